@@ -0,0 +1,3 @@
+"""
+Offline benchmark suite, run with `python -m benchmarks` (see `harness`)
+"""
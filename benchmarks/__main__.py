@@ -0,0 +1,4 @@
+import sys
+from benchmarks import harness
+
+sys.exit(harness.main())
@@ -0,0 +1,71 @@
+import dataclasses
+import random
+from typing import Any, Callable, List
+from pyalgo import queue
+from benchmarks import harness
+
+SIZES = (10**3, 10**4, 10**5, 10**6)
+
+
+@dataclasses.dataclass
+class Item:
+    uid: str
+    weight: float
+
+
+def _items(size: int) -> List[Item]:
+    rng = random.Random(0)
+    return [Item(str(i), rng.random()) for i in range(size)]
+
+
+@harness.benchmark("queue.priority.push_pop", SIZES)
+def priority_push_pop(size: int) -> Callable[[], Any]:
+    items = _items(size)
+
+    def _run() -> None:
+        q = queue.PriorityQueue[Item](heavy=False)
+        for item in items:
+            q.add(item)
+        while len(q) > 0:
+            q.get()
+
+    return _run
+
+
+@harness.benchmark("queue.priority.decrease_key", SIZES[:3])
+def priority_decrease_key(size: int) -> Callable[[], Any]:
+    items = _items(size)
+
+    def _run() -> None:
+        q = queue.PriorityQueue[Item](items, heavy=False)
+        for item in items:
+            q.decrease_key(item.uid, item.weight / 2)
+
+    return _run
+
+
+@harness.benchmark("queue.fifo.push_pop", SIZES)
+def fifo_push_pop(size: int) -> Callable[[], Any]:
+    items = _items(size)
+
+    def _run() -> None:
+        q = queue.FIFOQueue[Item]()
+        for item in items:
+            q.add(item)
+        while len(q) > 0:
+            q.get()
+
+    return _run
+
+
+@harness.benchmark("queue.fifo.remove", SIZES[:3])
+def fifo_remove(size: int) -> Callable[[], Any]:
+    items = _items(size)
+
+    def _run() -> None:
+        q = queue.FIFOQueue[Item](items)
+        for item in items[::2]:
+            q.remove(item.uid)
+        q.drain()
+
+    return _run
@@ -0,0 +1,40 @@
+from typing import Any, Callable, Dict
+from pyalgo import models, search
+from benchmarks import harness
+
+SIZES = (10**3, 10**4, 10**5)
+GRAPHS: Dict[str, Callable[[int], models.ElementMap[Any]]] = {
+    "grid": lambda size: search.GridMap((int(size**0.5),) * 2, max_weight=9),
+    "sparse": lambda size: search.ErdosRenyiMap(size),
+    "scale_free": lambda size: search.BarabasiAlbertMap(size, directed=False),
+    "road": lambda size: search.RoadMap(int(size**0.5)),
+}
+SEARCHES: Dict[str, Callable[..., Any]] = {
+    "breadth_first": search.breadth_first_search,
+    "depth_first": search.depth_first_search,
+    "dijakstra": search.dijakstra_search,
+}
+
+
+def _register(graph_name: str, search_name: str, fast_path: bool) -> None:
+    generate, search_ = GRAPHS[graph_name], SEARCHES[search_name]
+    name = f"search.{search_name}.{graph_name}" + (".fast_path" if fast_path else "")
+
+    @harness.benchmark(name, SIZES)
+    def _setup(size: int) -> Callable[[], Any]:
+        # NOTE: graphs are materialized so as to time searches, not generators
+        map = search.CompactGraph(generate(size))
+        if fast_path:
+            # NOTE: default ("full") recording on a `CompactGraph` is served by
+            # `compact_search`, "counts" recording by the generic engines
+            return lambda: search_(map)
+        return lambda: search_(map, recording="counts")
+
+
+for graph_name in GRAPHS:
+    for search_name in SEARCHES:
+        _register(graph_name, search_name, False)
+        # NOTE: "full" recording of depth-first searches materializes long paths,
+        # timing recording rather than search
+        if search_name != "depth_first":
+            _register(graph_name, search_name, True)
@@ -0,0 +1,80 @@
+import dataclasses
+import random
+from typing import Any, Callable, Dict, List
+from pyalgo import sort
+from benchmarks import harness
+
+SIZES = (10**3, 10**4, 10**5)
+PARALLEL_SIZES = (10**5, 10**6)
+PARALLEL_WORKERS = 4
+
+
+def _random(size: int) -> List[int]:
+    rng = random.Random(0)
+    return [rng.randrange(size * 10) for _ in range(size)]
+
+
+def _sorted(size: int) -> List[int]:
+    return list(range(size))
+
+
+def _duplicates(size: int) -> List[int]:
+    rng = random.Random(0)
+    return [rng.randrange(10) for _ in range(size)]
+
+
+INPUTS: Dict[str, Callable[[int], List[int]]] = {
+    "random": _random,
+    "sorted": _sorted,
+    "duplicates": _duplicates,
+}
+SORTS = {"quick_sort": sort.quick_sort, "merge_sort": sort.merge_sort}
+
+
+def _register(sort_name: str, input_name: str) -> None:
+    sort_, generate = SORTS[sort_name], INPUTS[input_name]
+
+    @harness.benchmark(f"sort.{sort_name}.{input_name}", SIZES)
+    def _setup(size: int) -> Callable[[], Any]:
+        items = generate(size)
+        return lambda: sort_(list(items))
+
+
+@dataclasses.dataclass(frozen=True)
+class Record:
+    uid: int
+    score: float
+
+
+def _register_key(sort_name: str) -> None:
+    sort_ = SORTS[sort_name]
+
+    @harness.benchmark(f"sort.{sort_name}.key", SIZES)
+    def _setup(size: int) -> Callable[[], Any]:
+        rng = random.Random(0)
+        records = [Record(i, rng.random()) for i in range(size)]
+        return lambda: sort_(list(records), key=lambda r: r.score, reverse=True)
+
+
+for sort_name in SORTS:
+    for input_name in INPUTS:
+        _register(sort_name, input_name)
+    _register_key(sort_name)
+
+
+def _register_parallel(variant: str) -> None:
+    @harness.benchmark(f"sort.parallel_sort.{variant}", PARALLEL_SIZES)
+    def _setup(size: int) -> Callable[[], Any]:
+        items = _random(size)
+        if variant == "serial":
+            return lambda: sort.parallel_sort(items, workers=1)
+        if variant == "pickled":
+            # NOTE: an int beyond 64 bits rules out the shared memory array
+            items.append(2**64)
+        return lambda: sort.parallel_sort(items, workers=PARALLEL_WORKERS, threshold=0)
+
+
+# NOTE: "shared" (memory-mapped array) against "pickled" partitions of the same
+# numbers, and "serial" (i.e. `merge_sort`) for reference
+for variant in ("serial", "shared", "pickled"):
+    _register_parallel(variant)
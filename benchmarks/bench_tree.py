@@ -0,0 +1,36 @@
+import random
+from typing import Any, Callable, List
+from pyalgo.tree import binary_tree
+from benchmarks import harness
+
+SIZES = (10**2, 10**3, 10**4)
+
+
+def _items(size: int) -> List[int]:
+    items = list(range(size))
+    random.Random(0).shuffle(items)
+    return items
+
+
+@harness.benchmark("tree.binary.add", SIZES)
+def binary_add(size: int) -> Callable[[], Any]:
+    items = _items(size)
+    return lambda: binary_tree.BinaryTree(*items)
+
+
+@harness.benchmark("tree.binary.add_remove", SIZES)
+def binary_add_remove(size: int) -> Callable[[], Any]:
+    items = _items(size)
+
+    def _run() -> None:
+        bst = binary_tree.BinaryTree(*items)
+        for item in items[::-1]:
+            bst.remove(item)
+
+    return _run
+
+
+@harness.benchmark("tree.binary.height", SIZES)
+def binary_height(size: int) -> Callable[[], Any]:
+    bst = binary_tree.BinaryTree(*_items(size))
+    return lambda: bst.height
@@ -0,0 +1,148 @@
+import argparse
+import dataclasses
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# NOTE: setup receives the input size and returns the (zero-argument) timed callable
+Setup = Callable[[int], Callable[[], Any]]
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+MODULES = ("bench_queue", "bench_search", "bench_sort", "bench_tree")
+
+
+@dataclasses.dataclass(frozen=True)
+class Case:
+    name: str
+    sizes: Tuple[int, ...]
+    setup: Setup
+
+
+@dataclasses.dataclass(frozen=True)
+class Timing:
+    key: str
+    best: float
+    mean: float
+
+
+CASES: Dict[str, Case] = {}
+
+
+def benchmark(name: str, sizes: Sequence[int]) -> Callable[[Setup], Setup]:
+    """Register decorated setup as benchmark case `name`, run once per size"""
+
+    def _register(setup: Setup) -> Setup:
+        if name in CASES:
+            raise ValueError(f"duplicate benchmark: {name}")
+        CASES[name] = Case(name, tuple(sizes), setup)
+        return setup
+
+    return _register
+
+
+def load() -> Dict[str, Case]:
+    """Import benchmark modules, registering their cases"""
+    for module in MODULES:
+        importlib.import_module(f"benchmarks.{module}")
+    return CASES
+
+
+def run(
+    cases: Sequence[Case],
+    repeat: int = 3,
+    max_size: Optional[int] = None,
+    report: Callable[[Timing], None] = lambda timing: None,
+) -> List[Timing]:
+    """Time each case size `repeat` times, keeping the best and mean timings"""
+    timings: List[Timing] = []
+    for case in cases:
+        for size in case.sizes:
+            if max_size is not None and size > max_size:
+                continue
+            function = case.setup(size)
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                function()
+                samples.append(time.perf_counter() - start)
+            key = f"{case.name}[{size}]"
+            timing = Timing(key, min(samples), statistics.mean(samples))
+            timings.append(timing)
+            report(timing)
+    return timings
+
+
+def save(timings: Sequence[Timing], path: str = BASELINE) -> None:
+    """Store best timings as baseline, merged into existing one"""
+    results: Dict[str, float] = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            results = json.load(f)["results"]
+    results.update({t.key: t.best for t in timings})
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": dict(sorted(results.items())),
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+def compare(
+    timings: Sequence[Timing], baseline: Dict[str, float], threshold: float
+) -> List[Tuple[Timing, float]]:
+    """Return timings slower than their baseline by more than `threshold` times"""
+    regressions = []
+    for timing in timings:
+        if timing.key in baseline:
+            ratio = timing.best / baseline[timing.key]
+            if ratio > threshold:
+                regressions.append((timing, ratio))
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="run cases containing")
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument(
+        "--max-size", type=int, default=10**5, help="skip larger sizes (10**6 too)"
+    )
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="update baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="fail upon timings slower than baseline by this factor",
+    )
+    args = parser.parse_args(argv)
+
+    baseline: Dict[str, float] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    def _report(timing: Timing) -> None:
+        ratio = ""
+        if timing.key in baseline:
+            ratio = f"{timing.best / baseline[timing.key]:8.2f}x"
+        print(f"{timing.key:<48} {timing.best:12.6f}s {timing.mean:12.6f}s {ratio}")
+
+    cases = [c for n, c in sorted(load().items()) if args.filter in n]
+    print(f"{'benchmark':<48} {'best':>13} {'mean':>13} {'vs baseline':>9}")
+    timings = run(cases, args.repeat, args.max_size, _report)
+
+    if args.save:
+        save(timings, args.baseline)
+        return 0
+    regressions = compare(timings, baseline, args.threshold)
+    for timing, ratio in regressions:
+        print(f"REGRESSION {timing.key}: {ratio:.2f}x baseline", file=sys.stderr)
+    return 1 if regressions else 0
@@ -1,6 +1,7 @@
 import abc
 import decimal
-from typing import Any, Generic, List, TypeVar, Union
+import operator
+from typing import Any, Callable, Dict, Generic, List, Sequence, TypeVar, Union
 from typing_extensions import Protocol
 
 Numbers = Union[int, float, decimal.Decimal]
@@ -8,6 +9,10 @@ Comparable = TypeVar("Comparable", bound="ComparableProtocol")
 Element = TypeVar("Element", bound="ElementProtocol")
 WeightedElement = TypeVar("WeightedElement", bound="WeightedElementProtocol")
 
+# NOTE: `+` over `Numbers` does not type check (e.g. float + Decimal), `add` does,
+# at C-level cost (unlike `sum`)
+add: Callable[[Numbers, Numbers], Numbers] = operator.add
+
 
 class ComparableProtocol(Protocol):
     def __gt__(self, other: Any) -> bool:
@@ -66,3 +71,35 @@ class ElementMap(abc.ABC, Generic[Element]):
     @abc.abstractmethod
     def get_next(self, uid: str) -> List[Element]:
         """Return list of `Element`s given current uid"""
+
+    def get_next_many(self, uids: Sequence[str]) -> Dict[str, List[Element]]:
+        """
+        Return lists of `Element`s given each uid
+        (NOTE: override for backends able to look up several uids at once)
+        """
+        return {uid: self.get_next(uid) for uid in uids}
+
+    def get_previous(self, uid: str) -> List[Element]:
+        """
+        Return list of `Element`s leading to current uid (optional)
+        (NOTE: for weighted maps, each `Element` weighs the cost of moving onto uid)
+        """
+        raise NotImplementedError
+
+
+class AsyncElementMap(abc.ABC, Generic[Element]):
+    """Similar to `ElementMap`, with `Element`s looked up asynchronously"""
+
+    @property
+    @abc.abstractmethod
+    def start(self) -> Element:
+        """Return starting `Element`"""
+
+    @property
+    @abc.abstractmethod
+    def end(self) -> Element:
+        """Return ending `Element`"""
+
+    @abc.abstractmethod
+    async def get_next(self, uid: str) -> List[Element]:
+        """Return list of `Element`s given current uid"""
@@ -1,36 +1,85 @@
-from typing import Iterable, List, Optional
+import collections
+import itertools
+from typing import Any, Deque, Dict, Iterable, List, Optional
 from pyalgo import models
 from pyalgo.queue import queue
 
 
+class _Entry:
+    """
+    Slot of the deque
+    NOTE: removed entries are only flagged (tombstoned) and skipped upon `get`
+    """
+
+    __slots__ = ("element", "removed")
+
+    def __init__(self, element: Any) -> None:
+        self.element = element
+        self.removed = False
+
+
 class FIFOQueue(queue.Queue[models.Element]):
     """First-In, First-Out"""
 
     def __init__(self, elements: Optional[Iterable[models.Element]] = None) -> None:
-        self._elements: List[models.Element] = []
+        self._elements: Deque[_Entry] = collections.deque()
+        self._index: Dict[str, List[_Entry]] = {}
+        self.__tombstones = 0
         if elements is not None:
-            self._elements = list(elements)
+            self.extend(elements)
 
     def __len__(self) -> int:
-        return len(self._elements)
+        return len(self._elements) - self.__tombstones
 
     def get(self) -> models.Element:
-        try:
-            result = self._elements.pop(0)
-        except IndexError:
-            raise queue.EmptyQueueError()
-
-        return result
+        elements = self._elements
+        while elements:
+            entry = elements.popleft()
+            if entry.removed:
+                self.__tombstones -= 1
+                continue
+            self.__unindex(entry)
+            return entry.element  # type: ignore[no-any-return]
+        raise queue.EmptyQueueError()
 
     def add(self, element: models.Element) -> None:
-        self._elements.append(element)
+        entry = _Entry(element)
+        self._elements.append(entry)
+        self._index.setdefault(element.uid, []).append(entry)
 
     def remove(self, uid: str) -> None:
-        checked = False
-        for i, element in enumerate(self._elements):
-            if element.uid == uid:
-                del self._elements[i]
-                checked = True
-                break
-        if not checked:
+        entries = self._index.get(uid)
+        if not entries:
             raise KeyError("no such uid stored")
+        entry = entries[0]
+        self.__unindex(entry)
+        entry.removed = True
+        self.__tombstones += 1
+        if self.__tombstones > len(self):
+            self.__compact()
+
+    def peek(self, n: int = 1) -> List[models.Element]:
+        live = (e.element for e in self._elements if not e.removed)
+        return list(itertools.islice(live, n))
+
+    def extend(self, elements: Iterable[models.Element]) -> None:
+        """Add `Element`s to queue in order"""
+        for element in elements:
+            self.add(element)
+
+    def drain(self, n: Optional[int] = None) -> List[models.Element]:
+        """Retrieve up to `n` `Element`s from queue (all if `n` is None)"""
+        count = len(self) if n is None else min(n, len(self))
+        return [self.get() for _ in range(count)]
+
+    def __unindex(self, entry: _Entry) -> None:
+        uid = entry.element.uid
+        entries = self._index[uid]
+        if len(entries) == 1:
+            del self._index[uid]
+        else:
+            entries.remove(entry)
+
+    def __compact(self) -> None:
+        self._elements = collections.deque(e for e in self._elements if not e.removed)
+        self.__tombstones = 0
@@ -1,39 +1,159 @@
+import heapq
+import itertools
 from pyalgo import models
-from pyalgo.queue import _fifo
-from typing import Iterable, List, Optional
+from pyalgo.queue import queue
+from typing import Any, Dict, Iterable, List, Optional
 
 
-class PriorityQueue(_fifo.FIFOQueue[models.WeightedElement]):
+class _HeapEntry:
+    """
+    Slot of the binary heap
+    NOTE: `count` breaks ties between equal keys in insertion (FIFO) order
+    """
+
+    __slots__ = ("key", "count", "element", "position")
+
+    def __init__(self, key: Any, count: int, element: Any, position: int) -> None:
+        self.key = key
+        self.count = count
+        self.element = element
+        self.position = position
+
+    def __lt__(self, other: "_HeapEntry") -> bool:
+        if self.key == other.key:
+            return self.count < other.count
+        return bool(self.key < other.key)
+
+
+class PriorityQueue(queue.Queue[models.WeightedElement]):
     def __init__(
         self,
         elements: Optional[Iterable[models.WeightedElement]] = None,
         heavy: bool = True,
     ) -> None:
         """
+        Indexed binary heap, elements of equal weights are retrieved in FIFO order.
         Args:
             elements: Iterables of `WeightedElement`s
             heavy   :
                 - True : ↑ weighted elements == ↑ priorities
                 - False: ↓ weighted elements == ↑ priorities
         """
-        super().__init__(elements)
-        self._elements: List[models.WeightedElement] = []
-        if elements is not None:
-            self._elements = list(elements)
         self.__heavy = heavy
+        self.__counter = itertools.count()
+        self._heap: List[_HeapEntry] = []
+        self._index: Dict[str, List[_HeapEntry]] = {}
+        if elements is not None:
+            for element in elements:
+                self.add(element)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def get(self) -> models.WeightedElement:
+        if not self._heap:
+            raise queue.EmptyQueueError()
+        entry = self._heap[0]
+        self.__pop(entry)
+        return entry.element  # type: ignore[no-any-return]
 
     def add(self, element: models.WeightedElement) -> None:
         """
         Queue elements based on their respective weights.
         """
-        inserted = False
-        for i, e in enumerate(self._elements):
-            insert_heavy = self.__heavy and element.weight > e.weight
-            insert_light = not self.__heavy and element.weight < e.weight
-            if insert_heavy or insert_light:
-                self._elements.insert(i, element)
-                inserted = True
+        entry = _HeapEntry(
+            self.__key(element.weight),
+            next(self.__counter),
+            element,
+            len(self._heap),
+        )
+        self._heap.append(entry)
+        self._index.setdefault(element.uid, []).append(entry)
+        self.__sift_up(entry.position)
+
+    def remove(self, uid: str) -> None:
+        self.__pop(self.__lookup(uid))
+
+    def peek(self, n: int = 1) -> List[models.WeightedElement]:
+        """
+        Return up to `n` next elements in retrieval order, without removing them
+        NOTE: walks the heap from its root in O(n log n), regardless of queue size
+        """
+        result: List[models.WeightedElement] = []
+        candidates = self._heap[:1]
+        while candidates and len(result) < n:
+            entry = heapq.heappop(candidates)
+            result.append(entry.element)
+            for child in (2 * entry.position + 1, 2 * entry.position + 2):
+                if child < len(self._heap):
+                    heapq.heappush(candidates, self._heap[child])
+        return result
+
+    def decrease_key(self, uid: str, weight: models.Numbers) -> None:
+        """
+        Raise priority of queued element with `uid`, ordering it by `weight` instead.
+        (NOTE: "decrease" refers to the heap key, for `heavy` queues `weight` must be
+        greater than or equal to current weight, otherwise less than or equal to)
+        """
+        entry = self.__lookup(uid)
+        key = self.__key(weight)
+        if entry.key < key:
+            raise ValueError(f"new weight lowers priority of uid: {uid}")
+        entry.key = key
+        self.__sift_up(entry.position)
+
+    def __key(self, weight: models.Numbers) -> models.Numbers:
+        return -weight if self.__heavy else weight
+
+    def __lookup(self, uid: str) -> _HeapEntry:
+        entries = self._index.get(uid)
+        if not entries:
+            raise KeyError("no such uid stored")
+        return min(entries)
+
+    def __pop(self, entry: _HeapEntry) -> None:
+        entries = self._index[entry.element.uid]
+        entries.remove(entry)
+        if not entries:
+            del self._index[entry.element.uid]
+
+        last = self._heap.pop()
+        if last is entry:
+            return None
+        last.position = entry.position
+        self._heap[last.position] = last
+        self.__sift_up(last.position)
+        self.__sift_down(last.position)
+
+    def __sift_up(self, position: int) -> None:
+        heap = self._heap
+        entry = heap[position]
+        while position > 0:
+            parent_position = (position - 1) >> 1
+            parent = heap[parent_position]
+            if not entry < parent:
                 break
+            parent.position = position
+            heap[position] = parent
+            position = parent_position
+        entry.position = position
+        heap[position] = entry
 
-        if not inserted:
-            super().add(element)
+    def __sift_down(self, position: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        entry = heap[position]
+        child_position = 2 * position + 1
+        while child_position < size:
+            right_position = child_position + 1
+            if right_position < size and heap[right_position] < heap[child_position]:
+                child_position = right_position
+            child = heap[child_position]
+            if not child < entry:
+                break
+            child.position = position
+            heap[position] = child
+            position = child_position
+            child_position = 2 * position + 1
+        entry.position = position
+        heap[position] = entry
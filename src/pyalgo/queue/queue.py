@@ -1,5 +1,5 @@
 import abc
-from typing import Generic
+from typing import Generic, List
 from pyalgo import models
 
 
@@ -25,3 +25,7 @@ class Queue(abc.ABC, Generic[models.Element]):
     @abc.abstractmethod
     def remove(self, uid: str) -> None:
         """Remove `Element` from queue based on uid"""
+
+    @abc.abstractmethod
+    def peek(self, n: int = 1) -> List[models.Element]:
+        """Return up to `n` next `Element`s in retrieval order, without removing them"""
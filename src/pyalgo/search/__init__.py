@@ -1,9 +1,68 @@
+from pyalgo.search.a_star import a_star_search
+from pyalgo.search.async_search import (
+    async_a_star_search,
+    async_breadth_first_search,
+    async_depth_first_search,
+    async_dijakstra_search,
+)
 from pyalgo.search.bfs import breadth_first_search
+from pyalgo.search.bidirectional import (
+    bidirectional_breadth_first_search,
+    bidirectional_dijakstra_search,
+)
+from pyalgo.search.cached_map import CachedElementMap
+from pyalgo.search.compact_graph import CompactGraph
 from pyalgo.search.dfs import depth_first_search
 from pyalgo.search.dijakstra import dijakstra_search
+from pyalgo.search.distance_table import (
+    breadth_first_distances,
+    dijakstra_distances,
+)
+from pyalgo.search.hooks import Profiler, SearchObserver
+from pyalgo.search.iterative_deepening import (
+    depth_limited_search,
+    ida_star_search,
+    iterative_deepening_search,
+)
+from pyalgo.search.parallel import search_many
+from pyalgo.search.streaming import iter_search
+from pyalgo.search.synthetic import (
+    BarabasiAlbertMap,
+    ErdosRenyiMap,
+    GridMap,
+    RoadMap,
+)
+from pyalgo.search.vectorized import (
+    batch_breadth_first_search,
+    batch_dijakstra_search,
+)
 
 __all__ = [
+    "BarabasiAlbertMap",
+    "CachedElementMap",
+    "CompactGraph",
+    "ErdosRenyiMap",
+    "GridMap",
+    "Profiler",
+    "RoadMap",
+    "SearchObserver",
+    "a_star_search",
+    "async_a_star_search",
+    "async_breadth_first_search",
+    "async_depth_first_search",
+    "async_dijakstra_search",
+    "batch_breadth_first_search",
+    "batch_dijakstra_search",
+    "bidirectional_breadth_first_search",
+    "bidirectional_dijakstra_search",
+    "breadth_first_distances",
     "breadth_first_search",
     "depth_first_search",
+    "depth_limited_search",
+    "dijakstra_distances",
     "dijakstra_search",
+    "ida_star_search",
+    "iter_search",
+    "iterative_deepening_search",
+    "search_many",
 ]
@@ -0,0 +1,48 @@
+from typing import Optional
+from pyalgo import models
+from pyalgo.search import (
+    budget,
+    compact_graph,
+    compact_search,
+    distance_search,
+    queue_search,
+)
+
+InconsistentHeuristicError = distance_search.InconsistentHeuristicError
+
+
+def a_star_search(
+    map: models.ElementMap[models.WeightedElement],
+    heuristic: distance_search.Heuristic[models.WeightedElement],
+    check_consistency: bool = False,
+    recording: str = "full",
+    recording_limit: int = 100,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.WeightedElement]:
+    """
+    https://en.wikipedia.org/wiki/A*_search_algorithm
+    Dijakstra search guided by `heuristic`, an estimate of the remaining distance
+    from an `Element` to end. Solution is optimal for admissible heuristics
+    (never overestimating), `Element`s are settled at most once for consistent ones.
+    Set `check_consistency` to raise `InconsistentHeuristicError` on violations.
+    (see `queue_search` for `recording` policies and budgets)
+    """
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    if (
+        isinstance(map, compact_graph.CompactGraph)
+        and limits.unbounded
+        and recording == "full"
+    ):
+        return compact_search.compact_distance_search(map, heuristic, check_consistency)
+    return distance_search.distance_search(
+        map,
+        heuristic,
+        check_consistency,
+        recording,
+        recording_limit,
+        max_expansions,
+        max_frontier,
+        deadline,
+    )
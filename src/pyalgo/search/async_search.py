@@ -0,0 +1,302 @@
+import asyncio
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from pyalgo import models, queue
+from pyalgo.search import budget, distance_search, path_queue, queue_search, recorder
+
+PathTracker = path_queue.PathTracker
+
+
+class _Prefetcher(Generic[models.Element]):
+    """
+    Concurrent `get_next` lookups keyed by uid, with at most `concurrency`
+    lookups in flight at once
+    """
+
+    def __init__(
+        self, map: models.AsyncElementMap[models.Element], concurrency: int
+    ) -> None:
+        self.__map = map
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__tasks: Dict[str, "asyncio.Future[List[models.Element]]"] = {}
+
+    def prefetch(self, uids: Iterable[str]) -> None:
+        """Start looking up `Element`s next to `uids`, unless already started"""
+        for uid in uids:
+            if uid not in self.__tasks:
+                self.__tasks[uid] = asyncio.ensure_future(self.__fetch(uid))
+
+    async def get_next(self, uid: str) -> List[models.Element]:
+        """Return (prefetched) `Element`s next to `uid`"""
+        self.prefetch([uid])
+        return await self.__tasks.pop(uid)
+
+    def cancel(self) -> None:
+        """Cancel lookups left unused"""
+        for task in self.__tasks.values():
+            task.cancel()
+        self.__tasks.clear()
+
+    async def __fetch(self, uid: str) -> List[models.Element]:
+        async with self.__semaphore:
+            return await self.__map.get_next(uid)
+
+
+class _AsyncMapView(models.ElementMap[models.Element]):
+    """
+    `ElementMap` view of an `AsyncElementMap` for search engines,
+    `Element`s being looked up asynchronously and sent to engines instead
+    """
+
+    def __init__(self, map: models.AsyncElementMap[models.Element]) -> None:
+        self.__map = map
+
+    @property
+    def start(self) -> models.Element:
+        return self.__map.start
+
+    @property
+    def end(self) -> models.Element:
+        return self.__map.end
+
+    def get_next(self, uid: str) -> List[models.Element]:
+        raise RuntimeError(
+            f"cannot expand {uid} synchronously: `Element`s of asynchronous maps "
+            "are looked up by the search driver and sent to engines"
+        )
+
+
+async def _drive(
+    paths: Generator[
+        PathTracker[models.Element],
+        Optional[List[models.Element]],
+        Optional[PathTracker[models.Element]],
+    ],
+    end_uid: str,
+    fetcher: _Prefetcher[models.Element],
+    upcoming: Callable[[], Iterable[str]],
+    record: Callable[[PathTracker[models.Element]], None],
+) -> Tuple[List[models.Element], bool]:
+    """
+    Run search engine `paths` to end, sending it `Element`s next to each
+    expanded path as looked up by `fetcher`, `upcoming` uids being looked up
+    meanwhile, and return solution and whether it is partial (best path found
+    when stopped by budget)
+    """
+    try:
+        path = next(paths)
+        while True:
+            record(path)
+            uid = path.element.uid
+            if uid == end_uid:
+                return path.elements, False
+            fetcher.prefetch([uid])
+            fetcher.prefetch(upcoming())
+            path = paths.send(await fetcher.get_next(uid))
+    except StopIteration as stop:
+        if stop.value is None:
+            return [], False
+        return stop.value.elements, True
+    finally:
+        paths.close()
+        fetcher.cancel()
+
+
+async def async_queue_search(
+    map: models.AsyncElementMap[models.Element],
+    queue: path_queue.PathQueue[models.Element],
+    tree_search: bool = False,
+    prefetch: int = 8,
+    concurrency: int = 8,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.Element]:
+    """
+    `queue_search` on `AsyncElementMap`, expanding `Element`s in the exact same order
+    (`iter_queue_search` being sent `Element`s looked up concurrently)
+    Input:
+        map         : Async mapper object linking `Element`s
+        queue       : `PathQueue` object, supporting `peek`
+        tree_search : See `queue_search`
+        prefetch    : Number of upcoming queue entries to look up ahead of expansion
+        concurrency : Maximum number of concurrent `get_next` calls
+        max_expansions, max_frontier, deadline : See `queue_search`
+    Output:
+        SearchResult
+    """
+
+    history = recorder.Recorder[models.Element]()
+    closed: Set[str] = set()
+
+    def _check_visited(path: PathTracker[models.Element]) -> bool:
+        """Check if latest `Element` has already been visited"""
+        if tree_search:
+            return path.parent is not None and path.element in path.parent
+        return path.element.uid in closed
+
+    def _upcoming() -> List[str]:
+        """Return uids of upcoming queue entries, not visited yet"""
+        return [p.element.uid for p in queue.peek(prefetch) if not _check_visited(p)]
+
+    def _record(path: PathTracker[models.Element]) -> None:
+        closed.add(path.element.uid)
+        history.record(path, path.uid, path.previous_uid)
+
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    paths = queue_search.iter_queue_search(
+        _AsyncMapView(map), queue, tree_search, history.stats, limits
+    )
+    solution, partial = await _drive(
+        paths, map.end.uid, _Prefetcher(map, concurrency), _upcoming, _record
+    )
+    return queue_search.SearchResult(
+        solution=solution,
+        searches=history.searches(),
+        stats=history.stats,
+        partial=partial,
+    )
+
+
+async def async_distance_search(
+    map: models.AsyncElementMap[models.WeightedElement],
+    heuristic: Optional[distance_search.Heuristic[models.WeightedElement]] = None,
+    check_consistency: bool = False,
+    prefetch: int = 8,
+    concurrency: int = 8,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.WeightedElement]:
+    """
+    `distance_search` on `AsyncElementMap`, settling `Element`s in the exact same order
+    (see `distance_search` and `async_queue_search` for parameters)
+    """
+
+    history = recorder.Recorder[models.WeightedElement]()
+    frontier = queue.PriorityQueue[distance_search.Distance](heavy=False)
+
+    def _record(path: PathTracker[models.WeightedElement]) -> None:
+        parent = None if path.parent is None else path.parent.element.uid
+        history.record(path, path.element.uid, parent)
+
+    paths = distance_search.iter_distance_search(
+        _AsyncMapView(map),
+        heuristic,
+        check_consistency,
+        history.stats,
+        budget.Budget(max_expansions, max_frontier, deadline),
+        frontier=frontier,
+    )
+    solution, partial = await _drive(
+        paths,
+        map.end.uid,
+        _Prefetcher(map, concurrency),
+        lambda: [item.uid for item in frontier.peek(prefetch)],
+        _record,
+    )
+    return queue_search.SearchResult(
+        solution=solution,
+        searches=history.searches(),
+        stats=history.stats,
+        partial=partial,
+    )
+
+
+async def async_breadth_first_search(
+    map: models.AsyncElementMap[models.Element],
+    tree_search: bool = False,
+    prefetch: int = 8,
+    concurrency: int = 8,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.Element]:
+    """Async variant of `breadth_first_search`"""
+    queue = path_queue.WeightPathQueue[models.Element](len)
+    return await async_queue_search(
+        map,
+        queue,
+        tree_search,
+        prefetch,
+        concurrency,
+        max_expansions,
+        max_frontier,
+        deadline,
+    )
+
+
+async def async_depth_first_search(
+    map: models.AsyncElementMap[models.Element],
+    tree_search: bool = False,
+    prefetch: int = 8,
+    concurrency: int = 8,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.Element]:
+    """Async variant of `depth_first_search`"""
+    queue = path_queue.WeightPathQueue[models.Element](lambda t: -1 * len(t))
+    return await async_queue_search(
+        map,
+        queue,
+        tree_search,
+        prefetch,
+        concurrency,
+        max_expansions,
+        max_frontier,
+        deadline,
+    )
+
+
+async def async_dijakstra_search(
+    map: models.AsyncElementMap[models.WeightedElement],
+    prefetch: int = 8,
+    concurrency: int = 8,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.WeightedElement]:
+    """Async variant of `dijakstra_search`"""
+    return await async_distance_search(
+        map,
+        None,
+        False,
+        prefetch,
+        concurrency,
+        max_expansions,
+        max_frontier,
+        deadline,
+    )
+
+
+async def async_a_star_search(
+    map: models.AsyncElementMap[models.WeightedElement],
+    heuristic: distance_search.Heuristic[models.WeightedElement],
+    check_consistency: bool = False,
+    prefetch: int = 8,
+    concurrency: int = 8,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.WeightedElement]:
+    """Async variant of `a_star_search`"""
+    return await async_distance_search(
+        map,
+        heuristic,
+        check_consistency,
+        prefetch,
+        concurrency,
+        max_expansions,
+        max_frontier,
+        deadline,
+    )
@@ -1,8 +1,14 @@
 import decimal
-from typing import Union
+from typing import Optional, Union
 from pyalgo import models
-from pyalgo.search import path_queue, queue_search
-
+from pyalgo.search import (
+    budget,
+    compact_graph,
+    compact_search,
+    hooks,
+    path_queue,
+    queue_search,
+)
 
 PathTracker = path_queue.PathTracker
 Numeric = Union[int, float, decimal.Decimal]
@@ -10,16 +16,46 @@ Numeric = Union[int, float, decimal.Decimal]
 
 def breadth_first_search(
     map: models.ElementMap[models.Element],
+    tree_search: bool = False,
+    recording: str = "full",
+    recording_limit: int = 100,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+    observer: Optional[hooks.SearchObserver] = None,
 ) -> queue_search.SearchResult[models.Element]:
     """
     Perform a Breadth-First Search (DFS) on a given graph from start to end `Element`
+    (see `queue_search` for `recording` policies, budgets and `observer`)
     """
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    if (
+        isinstance(map, compact_graph.CompactGraph)
+        and limits.unbounded
+        and observer is None
+        and not tree_search
+        and recording == "full"
+    ):
+        return compact_search.compact_queue_search(map, depth_first=False)
 
     def _convert(tracker: PathTracker[models.Element]) -> Numeric:
         # NOTE: Adjusting weight can achieve different search patterns
         # i.e. for depth-first-search, set the weight to match proportionally with number of elements, ensuring newer elements to be at front
         # in breadth-first-search, set the weight based on levels in reversed order
-        return len(tracker.elements)
+        return len(tracker)
 
-    queue = path_queue.WeightPathQueue[models.Element](_convert)
-    return queue_search.queue_search(map, queue)
+    convert = _convert
+    if observer is not None:
+        convert = hooks.timed(_convert, observer, "convert")
+    queue = path_queue.WeightPathQueue[models.Element](convert)
+    return queue_search.queue_search(
+        map,
+        queue,
+        tree_search,
+        recording,
+        recording_limit,
+        max_expansions,
+        max_frontier,
+        deadline,
+        observer,
+    )
@@ -0,0 +1,236 @@
+import dataclasses
+import decimal
+import weakref
+from typing import Any, Dict, Generic, List, Optional, Tuple, Union
+from pyalgo import models
+from pyalgo.search import budget, cached_map, distance_table, queue_search, recorder
+
+Numeric = Union[int, float, decimal.Decimal]
+# NOTE: (`Element`, next `Element`) links leading to each uid
+_Index = Dict[str, List[Tuple[Any, Any]]]
+
+# NOTE: reverse indexes are cached per map (weakly, until it is collected), with
+# the uid of the start `Element` they were crawled from
+_INDEXES: "weakref.WeakKeyDictionary[Any, Tuple[str, _Index]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class InconsistentMapError(ValueError):
+    def __init__(self, uid: str, next_uid: str) -> None:
+        message = f"get_previous links {next_uid} back to {uid}, get_next does not"
+        super().__init__(message)
+
+
+@dataclasses.dataclass(frozen=True)
+class Predecessor(Generic[models.Element]):
+    """
+    Model complying to `WeightedElement` structure,
+    linking `element` to a later `Element` at the cost of `weight`
+    """
+
+    uid: str
+    weight: Numeric
+    element: models.Element
+
+
+def _reversible(map: models.ElementMap[Any]) -> bool:
+    """Return if `map` implements `get_previous`, without calling it"""
+    while isinstance(map, cached_map.CachedElementMap):
+        map = map.map
+    return type(map).get_previous is not models.ElementMap.get_previous
+
+
+def _reverse_index(map: models.ElementMap[Any]) -> _Index:
+    """
+    Return links leading to each uid, by crawling every `Element` reachable from
+    start, unless cached for `map` (NOTE: maps are assumed not to change)
+    """
+    start = map.start
+    try:
+        cached = _INDEXES.get(map)
+    except TypeError:
+        # NOTE: unhashable, or not weakly referenceable, maps are not cached
+        cached = None
+    if cached is not None and cached[0] == start.uid:
+        return cached[1]
+
+    index: _Index = {}
+    seen, pending = {start.uid}, [start]
+    while pending:
+        element = pending.pop()
+        for e in map.get_next(element.uid):
+            index.setdefault(e.uid, []).append((element, e))
+            if e.uid not in seen:
+                seen.add(e.uid)
+                pending.append(e)
+    try:
+        _INDEXES[map] = (start.uid, index)
+    except TypeError:
+        pass
+    return index
+
+
+class ReversedElementMap(models.ElementMap[Predecessor[models.Element]]):
+    """
+    Wrapper following links of an `ElementMap` lacking `get_previous` backwards,
+    from its end to its start, each `Predecessor` weighing the cost of the link
+    NOTE: reverse links are indexed upon first `get_next` call, by crawling
+    every `Element` reachable from start, once per wrapped map (see `_INDEXES`)
+    """
+
+    def __init__(
+        self,
+        map: models.ElementMap[models.Element],
+        cost: distance_table.Cost[models.Element],
+    ) -> None:
+        self.__map = map
+        self.__cost = cost
+        self.__index: Optional[_Index] = None
+
+    @property
+    def start(self) -> Predecessor[models.Element]:
+        return Predecessor(self.__map.end.uid, 0, self.__map.end)
+
+    @property
+    def end(self) -> Predecessor[models.Element]:
+        start = self.__map.start
+        return Predecessor(start.uid, self.__cost(start), start)
+
+    def get_next(self, uid: str) -> List[Predecessor[models.Element]]:
+        if self.__index is None:
+            self.__index = _reverse_index(self.__map)
+        return [
+            Predecessor(element.uid, self.__cost(e), element)
+            for element, e in self.__index.get(uid, [])
+        ]
+
+
+def bidirectional_search(
+    map: models.ElementMap[models.Element],
+    cost: distance_table.Cost[models.Element],
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.Element]:
+    """
+    Generic method settling mapped `Element`s from start and end simultaneously,
+    always expanding the direction with the smaller frontier
+    Input:
+        map             : Mapper object linking `Element`s, followed backwards
+                          through `ReversedElementMap` if `get_previous` is not
+                          implemented
+        cost            : Cost of moving onto an `Element` (must be non-negative)
+        max_expansions  : Stop after settling this many `Element`s (both ways)
+        max_frontier    : Stop once both frontiers hold more `Element`s than this
+        deadline        : Stop at this `time.monotonic()` timestamp
+    Output:
+        SearchResult, with `searches` holding paths explored from start,
+        followed by paths explored from end (in reverse, as given by `get_previous`)
+        NOTE: if stopped by budget, `partial` solution is the shortest path found
+        through a meeting `Element` so far (not proven shortest), or else the path
+        from start to the next `Element` to settle forwards
+    Raises `InconsistentMapError` if `get_previous` links an `Element` to one whose
+    `get_next` does not list it
+    """
+
+    start, end = map.start, map.end
+    forward = distance_table.DistanceTable(start, cost(start), map.get_next, cost)
+    backward: distance_table.DistanceTable[Any]
+    if _reversible(map):
+        backward = distance_table.DistanceTable(end, 0, map.get_previous, cost)
+    else:
+        reverse = ReversedElementMap(map, cost)
+        backward = distance_table.DistanceTable(
+            reverse.start, 0, reverse.get_next, lambda p: p.weight
+        )
+    best: Optional[Tuple[Numeric, str]] = None
+    stats = recorder.SearchStats()
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    partial = False
+
+    def _meet(uid: str) -> None:
+        """Record shortest start-to-end distance found through `uid`"""
+        nonlocal best
+        if uid in forward.distances and uid in backward.distances:
+            distance = models.add(forward.distances[uid], backward.distances[uid])
+            if best is None or distance < best[0]:
+                best = (distance, uid)
+
+    while len(forward.frontier) > 0 and len(backward.frontier) > 0:
+        if (
+            best is not None
+            and models.add(forward.distance, backward.distance) >= best[0]
+        ):
+            break
+        if not limits.unbounded and limits.exceeded(stats):
+            partial = True
+            break
+        if len(forward.frontier) <= len(backward.frontier):
+            side = forward
+        else:
+            side = backward
+        uid = side.settle()
+        stats.expanded += 1
+        _meet(uid)
+        for next_uid in side.relax(uid):
+            _meet(next_uid)
+        stats.max_frontier = max(
+            stats.max_frontier, len(forward.frontier) + len(backward.frontier)
+        )
+
+    solution: List[models.Element] = []
+    if best is None and partial:
+        solution = forward.path(forward.frontier.peek()[0].uid)
+    elif best is not None:
+        current = best[1]
+        solution = forward.path(current)
+        following = backward.previous[current]
+        while following is not None:
+            candidates = [e for e in map.get_next(current) if e.uid == following]
+            if not candidates:
+                raise InconsistentMapError(current, following)
+            solution.append(min(candidates, key=cost))
+            current, following = following, backward.previous[following]
+
+    searches = [forward.path(uid) for uid in forward.searches]
+    for uid in backward.searches:
+        path = backward.path(uid)
+        # NOTE: `Predecessor`s of `ReversedElementMap` stand for the map's `Element`s
+        searches.append([e.element if isinstance(e, Predecessor) else e for e in path])
+    return queue_search.SearchResult(
+        solution=solution,
+        searches={i: s for i, s in enumerate(searches)},
+        stats=stats,
+        partial=partial,
+    )
+
+
+def bidirectional_breadth_first_search(
+    map: models.ElementMap[models.Element],
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.Element]:
+    """
+    Perform a Breadth-First Search (BFS) from both start and end `Element`s,
+    finding a path with the fewest `Element`s (see `bidirectional_search` for budgets)
+    """
+    return bidirectional_search(
+        map, lambda e: 1, max_expansions, max_frontier, deadline
+    )
+
+
+def bidirectional_dijakstra_search(
+    map: models.ElementMap[models.WeightedElement],
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.WeightedElement]:
+    """
+    Perform a Dijakstra search from both start and end `Element`s
+    (NOTE: `Element` weights must be non-negative, start `Element` weight included)
+    """
+    return bidirectional_search(
+        map, lambda e: e.weight, max_expansions, max_frontier, deadline
+    )
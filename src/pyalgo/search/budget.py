@@ -0,0 +1,41 @@
+import dataclasses
+import time
+from typing import Optional
+from pyalgo.search import recorder
+
+
+@dataclasses.dataclass(frozen=True)
+class Budget:
+    """
+    Limits on a search, exceeded ones stopping it early
+    max_expansions: Maximum number of paths expanded
+    max_frontier:   Maximum number of paths queued at once
+    deadline:       `time.monotonic()` timestamp to stop at,
+                    i.e. `time.monotonic() + 0.05` for 50ms from now
+    """
+
+    max_expansions: Optional[int] = None
+    max_frontier: Optional[int] = None
+    deadline: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        for name in ("max_expansions", "max_frontier"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be non-negative, got: {value}")
+
+    @property
+    def unbounded(self) -> bool:
+        return (
+            self.max_expansions is None
+            and self.max_frontier is None
+            and self.deadline is None
+        )
+
+    def exceeded(self, stats: recorder.SearchStats) -> bool:
+        """Check if search summarized by `stats` ran out of budget"""
+        if self.max_expansions is not None and stats.expanded >= self.max_expansions:
+            return True
+        if self.max_frontier is not None and stats.max_frontier > self.max_frontier:
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
@@ -0,0 +1,175 @@
+import collections
+import dataclasses
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from pyalgo import models
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """
+    Cache Counters
+    hits:       Lookups answered from cache
+    misses:     Uids looked up from wrapped map (prefetched ones included)
+    evictions:  Entries dropped to stay within limits
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def _sizeof(elements: List[models.Element]) -> int:
+    """Return shallow estimate of bytes held by `elements`"""
+    return sys.getsizeof(elements) + sum(sys.getsizeof(e) for e in elements)
+
+
+class CachedElementMap(models.ElementMap[models.Element]):
+    """
+    Wrapper memoizing `get_next` of an `ElementMap` in a bounded LRU cache
+    NOTE: cached lists are shared between callers and must not be mutated
+    """
+
+    def __init__(
+        self,
+        map: models.ElementMap[models.Element],
+        max_size: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        batch_size: int = 0,
+        sizeof: Callable[[List[models.Element]], int] = _sizeof,
+    ) -> None:
+        """
+        Args:
+            map         : Mapper object linking `Element`s
+            max_size    : Maximum number of cached uids (None for no limit)
+            max_bytes   : Maximum estimated bytes cached (None for no limit)
+            batch_size  : Number of upcoming uids search engines look up
+                          along with each cache miss, via `get_next_many`
+            sizeof      : Estimate of bytes held by a `get_next` result
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"max_size must be positive, got: {max_size}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive, got: {max_bytes}")
+        if batch_size < 0:
+            raise ValueError(f"batch_size must be non-negative, got: {batch_size}")
+        self.__map = map
+        self.__max_size = max_size
+        self.__max_bytes = max_bytes
+        self.__batch_size = batch_size
+        self.__sizeof = sizeof
+        self.__cache: "collections.OrderedDict[str, List[models.Element]]" = (
+            collections.OrderedDict()
+        )
+        self.__sizes: Dict[str, int] = {}
+        self.__bytes = 0
+        self.__stats = CacheStats()
+        # NOTE: uid looked up by `prefetch`, handed over to next `get_next` call
+        self.__prefetched: Optional[Tuple[str, List[models.Element]]] = None
+
+    def __len__(self) -> int:
+        return len(self.__cache)
+
+    def __contains__(self, uid: object) -> bool:
+        return uid in self.__cache
+
+    @property
+    def start(self) -> models.Element:
+        return self.__map.start
+
+    @property
+    def end(self) -> models.Element:
+        return self.__map.end
+
+    @property
+    def map(self) -> models.ElementMap[models.Element]:
+        """Wrapped mapper object"""
+        return self.__map
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.__stats
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes currently cached"""
+        return self.__bytes
+
+    @property
+    def batch_size(self) -> int:
+        return self.__batch_size
+
+    def get_next(self, uid: str) -> List[models.Element]:
+        if self.__prefetched is not None and self.__prefetched[0] == uid:
+            # NOTE: already counted as a miss (and stored, unless too large)
+            prefetched = self.__prefetched[1]
+            self.__prefetched = None
+            return prefetched
+        elements = self.__cache.get(uid)
+        if elements is not None:
+            self.__cache.move_to_end(uid)
+            self.__stats.hits += 1
+            return elements
+        self.__stats.misses += 1
+        elements = self.__map.get_next(uid)
+        self.__store(uid, elements)
+        return elements
+
+    def get_next_many(self, uids: Sequence[str]) -> Dict[str, List[models.Element]]:
+        results: Dict[str, List[models.Element]] = dict.fromkeys(uids, [])
+        missing: List[str] = []
+        for uid in results:
+            elements = self.__cache.get(uid)
+            if elements is None:
+                missing.append(uid)
+            else:
+                self.__cache.move_to_end(uid)
+                self.__stats.hits += 1
+                results[uid] = elements
+        if missing:
+            self.__stats.misses += len(missing)
+            fetched = self.__map.get_next_many(missing)
+            for uid in missing:
+                results[uid] = fetched[uid]
+                self.__store(uid, fetched[uid])
+        return results
+
+    def get_previous(self, uid: str) -> List[models.Element]:
+        return self.__map.get_previous(uid)
+
+    def prefetch(self, uid: str, upcoming: Callable[[int], Iterable[str]]) -> None:
+        """
+        Look up `uid` in one `get_next_many` batch together with up to `batch_size`
+        `upcoming` uids, unless `uid` is already cached
+        (NOTE: called by search engines ahead of expanding `uid`, which is stored
+        last, i.e. evicted last, and handed over to the next `get_next` call)
+        """
+        if uid in self.__cache:
+            return None
+        uids: List[str] = []
+        if self.__batch_size > 0:
+            uids.extend(u for u in upcoming(self.__batch_size) if u not in self)
+        uids = [u for u in uids if u != uid]
+        uids.append(uid)
+        self.__prefetched = (uid, self.get_next_many(uids)[uid])
+
+    def clear(self) -> None:
+        """Drop all cached entries, keeping counters"""
+        self.__cache.clear()
+        self.__sizes.clear()
+        self.__bytes = 0
+        self.__prefetched = None
+
+    def __store(self, uid: str, elements: List[models.Element]) -> None:
+        size = self.__sizeof(elements) if self.__max_bytes is not None else 0
+        if self.__max_bytes is not None and size > self.__max_bytes:
+            return None
+        self.__cache[uid] = elements
+        self.__sizes[uid] = size
+        self.__bytes += size
+        while (self.__max_size is not None and len(self.__cache) > self.__max_size) or (
+            self.__max_bytes is not None and self.__bytes > self.__max_bytes
+        ):
+            evicted, _ = self.__cache.popitem(last=False)
+            self.__bytes -= self.__sizes.pop(evicted)
+            self.__stats.evictions += 1
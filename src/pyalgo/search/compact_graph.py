@@ -0,0 +1,110 @@
+import array
+from typing import Any, Dict, List
+from pyalgo import models
+
+LONG_SIZE = array.array("l").itemsize
+DOUBLE_SIZE = array.array("d").itemsize
+
+
+def _weight(element: object) -> float:
+    """Return weight of `element`, unweighted `Element`s weigh 1"""
+    return float(getattr(element, "weight", 1))
+
+
+def _origin(graph: "CompactGraph[Any]", index: int) -> float:
+    """
+    Return distance of a search from node `index` at its source: weight of start
+    `Element` of `graph`, 0 for other nodes (only known by uid, the `Element`s
+    reaching them weighing their incoming links)
+    """
+    return _weight(graph.start) if index == graph.start_index else 0.0
+
+
+class CompactGraph(models.ElementMap[models.Element]):
+    """
+    Frozen copy of an `ElementMap`, interning uids to dense ints 0 to n-1
+    and storing adjacency in CSR (compressed sparse row) arrays:
+        node i links to targets[offsets[i]:offsets[i + 1]]
+        at the cost of  weights[offsets[i]:offsets[i + 1]]
+    NOTE: only `Element`s reachable from start are crawled (end is always interned),
+    weights are stored as floats
+    """
+
+    def __init__(self, map: models.ElementMap[models.Element]) -> None:
+        self.__start = map.start
+        self.__end = map.end
+        self.__indices: Dict[str, int] = {}
+        self.__elements: List[models.Element] = []
+        self.__links: List[models.Element] = []
+        self.__offsets = array.array("l", [0])
+        self.__targets = array.array("l")
+        self.__weights = array.array("d")
+
+        self.__intern(map.start)
+        i = 0
+        while i < len(self.__elements):
+            for e in map.get_next(self.__elements[i].uid):
+                self.__targets.append(self.__intern(e))
+                self.__weights.append(_weight(e))
+                self.__links.append(e)
+            self.__offsets.append(len(self.__targets))
+            i += 1
+        if self.__end.uid not in self.__indices:
+            self.__intern(self.__end)
+            self.__offsets.append(len(self.__targets))
+
+    @property
+    def start(self) -> models.Element:
+        return self.__start
+
+    @property
+    def end(self) -> models.Element:
+        return self.__end
+
+    @property
+    def size(self) -> int:
+        """Number of interned `Element`s"""
+        return len(self.__elements)
+
+    @property
+    def start_index(self) -> int:
+        return self.__indices[self.__start.uid]
+
+    @property
+    def end_index(self) -> int:
+        return self.__indices[self.__end.uid]
+
+    @property
+    def offsets(self) -> "array.array[int]":
+        return self.__offsets
+
+    @property
+    def targets(self) -> "array.array[int]":
+        return self.__targets
+
+    @property
+    def weights(self) -> "array.array[float]":
+        return self.__weights
+
+    def index(self, uid: str) -> int:
+        """Return interned int of `uid`"""
+        return self.__indices[uid]
+
+    def element(self, index: int) -> models.Element:
+        """Return `Element` first reaching node `index`"""
+        return self.__elements[index]
+
+    def link(self, edge: int) -> models.Element:
+        """Return `Element` as given by `get_next` for CSR position `edge`"""
+        return self.__links[edge]
+
+    def get_next(self, uid: str) -> List[models.Element]:
+        i = self.__indices[uid]
+        return self.__links[self.__offsets[i] : self.__offsets[i + 1]]
+
+    def __intern(self, element: models.Element) -> int:
+        index = self.__indices.get(element.uid)
+        if index is None:
+            index = self.__indices[element.uid] = len(self.__elements)
+            self.__elements.append(element)
+        return index
@@ -0,0 +1,234 @@
+import collections
+import heapq
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from pyalgo import models
+from pyalgo.search import compact_graph, distance_search, queue_search, recorder
+
+CompactGraph = compact_graph.CompactGraph
+Heuristic = Callable[[Any], models.Numbers]
+Estimate = Callable[[int], float]
+# NOTE: paths are lists of CSR positions of edges taken, -1 standing for start
+Path = List[int]
+
+
+def distance_paths(
+    graph: Any,
+    start: int,
+    end: int,
+    origin: float,
+    estimate: Optional[Estimate] = None,
+    check_consistency: bool = False,
+    stats: Optional[recorder.SearchStats] = None,
+) -> Tuple[Path, List[Path]]:
+    """
+    `distance_search` core running on CSR ints of `graph` (see `CompactGraph`)
+    (NOTE: nodes sharing both priority and insertion order with
+    `distance_search`, ties are broken identically, and `stats` are updated
+    in place with the same counts)
+    Output:
+        Solution path and explored paths
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = [float("inf")] * graph.size
+    previous = [-1] * graph.size
+    edges = [-1] * graph.size
+    orders = [-1] * graph.size
+    settled = bytearray(graph.size)
+    estimates: List[Optional[float]] = [None] * graph.size
+    searches: Dict[int, None] = {}
+    counter = itertools.count()
+
+    def _estimate(node: int) -> float:
+        """Return (cached) heuristic estimate of `node`"""
+        value = estimates[node]
+        if value is None:
+            value = estimates[node] = estimate(node) if estimate else 0
+        return value
+
+    def _trace(node: int) -> Path:
+        """Rebuild path from start to `node` via predecessor and reaching edges"""
+        path: Path = []
+        while node >= 0:
+            path.append(edges[node])
+            node = previous[node]
+        return path[::-1]
+
+    distances[start] = origin
+    orders[start] = next(counter)
+    frontier: List[Tuple[float, int, int]] = [
+        (distances[start] + _estimate(start), orders[start], start)
+    ]
+    # NOTE: number of nodes in frontier, i.e. not counting stale entries
+    queued = 1
+    expanded = max_frontier = pruned = 0
+
+    solution: Path = []
+    while frontier:
+        priority, _, node = heapq.heappop(frontier)
+        if settled[node] or priority != distances[node] + _estimate(node):
+            continue  # NOTE: stale entry left behind by an improved distance
+        settled[node] = 1
+        queued -= 1
+        expanded += 1
+        searches.pop(previous[node], None)
+        searches.pop(node, None)
+        searches[node] = None
+        if node == end:
+            solution = _trace(node)
+            break
+
+        distance, node_estimate = distances[node], _estimate(node)
+        for edge in range(offsets[node], offsets[node + 1]):
+            target, weight = targets[edge], weights[edge]
+            if check_consistency and node_estimate > weight + _estimate(target):
+                raise distance_search.InconsistentHeuristicError(
+                    graph.element(node).uid, graph.element(target).uid
+                )
+            candidate = distance + weight
+            if not candidate < distances[target]:
+                pruned += 1
+                continue
+            if settled[target] or orders[target] < 0:
+                # NOTE: first visit, or reopening under an inconsistent heuristic
+                settled[target] = 0
+                orders[target] = next(counter)
+                queued += 1
+            distances[target] = candidate
+            previous[target] = node
+            edges[target] = edge
+            item = (candidate + _estimate(target), orders[target], target)
+            heapq.heappush(frontier, item)
+        max_frontier = max(max_frontier, queued)
+
+    if stats is not None:
+        stats.expanded += expanded
+        stats.max_frontier = max(stats.max_frontier, max_frontier)
+        stats.pruned += pruned
+    return solution, [_trace(node) for node in searches]
+
+
+def queue_paths(
+    graph: Any,
+    start: int,
+    end: int,
+    depth_first: bool = False,
+    stats: Optional[recorder.SearchStats] = None,
+) -> Tuple[Path, List[Path]]:
+    """
+    Graph-search mode of `queue_search` core running on CSR ints of `graph`,
+    expanding each node at most once in breadth-first or depth-first order
+    (NOTE: `stats` are updated in place with the same counts as `queue_search`)
+    Output:
+        Solution path and explored paths
+    """
+    offsets, targets = graph.offsets, graph.targets
+    closed = bytearray(graph.size)
+    # NOTE: paths are entries linked to their parent entries, as in `PathTracker`
+    nodes: List[int] = [start]
+    edges: List[int] = [-1]
+    parents: List[int] = [-1]
+    lengths: List[int] = [1]
+    searches: Dict[int, None] = {}
+
+    breadth: "collections.deque[int]" = collections.deque([0])
+    depth: List[Tuple[int, int]] = [(-1, 0)]
+
+    def _trace(entry: int) -> Path:
+        path: Path = []
+        while entry >= 0:
+            path.append(edges[entry])
+            entry = parents[entry]
+        return path[::-1]
+
+    expanded = max_frontier = pruned = 0
+
+    solution: Path = []
+    while depth if depth_first else breadth:
+        entry = heapq.heappop(depth)[1] if depth_first else breadth.popleft()
+        node = nodes[entry]
+        if closed[node]:
+            pruned += 1
+            continue
+        closed[node] = 1
+        expanded += 1
+        searches.pop(parents[entry], None)
+        searches[entry] = None
+        if node == end:
+            solution = _trace(entry)
+            break
+
+        length = lengths[entry] + 1
+        for edge in range(offsets[node], offsets[node + 1]):
+            target = targets[edge]
+            if closed[target]:
+                pruned += 1
+                continue
+            child = len(nodes)
+            nodes.append(target)
+            edges.append(edge)
+            parents.append(entry)
+            lengths.append(length)
+            if depth_first:
+                # NOTE: entries are created in order, ties on length are FIFO
+                heapq.heappush(depth, (-length, child))
+            else:
+                breadth.append(child)
+        max_frontier = max(max_frontier, len(depth if depth_first else breadth))
+
+    if stats is not None:
+        stats.expanded += expanded
+        stats.max_frontier = max(stats.max_frontier, max_frontier)
+        stats.pruned += pruned
+    return solution, [_trace(entry) for entry in searches]
+
+
+def to_result(
+    graph: "CompactGraph[models.Element]",
+    start: int,
+    solution: Sequence[int],
+    searches: Sequence[Sequence[int]],
+    stats: Optional[recorder.SearchStats] = None,
+) -> queue_search.SearchResult[models.Element]:
+    """Convert paths of CSR positions into `SearchResult` of `Element`s"""
+    origin = graph.element(start)
+
+    def _elements(path: Sequence[int]) -> List[models.Element]:
+        return [graph.link(edge) if edge >= 0 else origin for edge in path]
+
+    return queue_search.SearchResult(
+        solution=_elements(solution),
+        searches={i: _elements(path) for i, path in enumerate(searches)},
+        stats=stats,
+    )
+
+
+def compact_distance_search(
+    graph: "CompactGraph[models.Element]",
+    heuristic: Optional[Heuristic] = None,
+    check_consistency: bool = False,
+) -> queue_search.SearchResult[models.Element]:
+    """`distance_search` running on `CompactGraph` ints"""
+
+    def _estimate(node: int) -> float:
+        return float(heuristic(graph.element(node))) if heuristic else 0.0
+
+    estimate = _estimate if heuristic else None
+    start, end = graph.start_index, graph.end_index
+    origin = compact_graph._weight(graph.start)
+    stats = recorder.SearchStats()
+    paths = distance_paths(
+        graph, start, end, origin, estimate, check_consistency, stats
+    )
+    return to_result(graph, start, *paths, stats)
+
+
+def compact_queue_search(
+    graph: "CompactGraph[models.Element]",
+    depth_first: bool = False,
+) -> queue_search.SearchResult[models.Element]:
+    """Graph-search mode of `queue_search` running on `CompactGraph` ints"""
+    start, end = graph.start_index, graph.end_index
+    stats = recorder.SearchStats()
+    paths = queue_paths(graph, start, end, depth_first, stats)
+    return to_result(graph, start, *paths, stats)
@@ -1,25 +1,40 @@
-import decimal
-from typing import Union
+from typing import Optional
 from pyalgo import models
-from pyalgo.search import path_queue, queue_search
-
-PathTracker = path_queue.PathTracker
-Numeric = Union[int, float, decimal.Decimal]
+from pyalgo.search import (
+    budget,
+    compact_graph,
+    compact_search,
+    distance_search,
+    queue_search,
+)
 
 
 def dijakstra_search(
     map: models.ElementMap[models.WeightedElement],
+    recording: str = "full",
+    recording_limit: int = 100,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
 ) -> queue_search.SearchResult[models.WeightedElement]:
     """
     https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
-    Subset of breadth-first-search, with minor tweaks around weightage assignment
+    Settle `Element`s in order of their distance from start, each at most once.
+    (NOTE: `Element` weights must be non-negative, start `Element` weight included)
+    (see `queue_search` for `recording` policies and budgets)
     """
-
-    def _convert(tracker: PathTracker[models.WeightedElement]) -> Numeric:
-        # NOTE: Adjusting weight can achieve different search patterns
-        # i.e. for depth-first-search, set the weight to match proportionally with number of elements, ensuring newer elements to be at front
-        # in breadth-first-search, set the weight based on levels in reversed order
-        return sum([e.weight for e in tracker.elements])
-
-    queue = path_queue.WeightPathQueue[models.WeightedElement](_convert)
-    return queue_search.queue_search(map, queue)
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    if (
+        isinstance(map, compact_graph.CompactGraph)
+        and limits.unbounded
+        and recording == "full"
+    ):
+        return compact_search.compact_distance_search(map)
+    return distance_search.distance_search(
+        map,
+        recording=recording,
+        recording_limit=recording_limit,
+        max_expansions=max_expansions,
+        max_frontier=max_frontier,
+        deadline=deadline,
+    )
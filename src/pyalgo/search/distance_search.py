@@ -0,0 +1,175 @@
+import dataclasses
+import decimal
+from typing import Callable, Dict, Generator, List, Optional, Set, Union
+from pyalgo import models, queue
+from pyalgo.search import budget, cached_map, path_queue, queue_search, recorder
+
+Numeric = Union[int, float, decimal.Decimal]
+PathTracker = path_queue.PathTracker
+Heuristic = Callable[[models.WeightedElement], Numeric]
+
+
+class InconsistentHeuristicError(ValueError):
+    def __init__(self, uid: str, next_uid: str) -> None:
+        message = f"heuristic is inconsistent along edge: {uid} -> {next_uid}"
+        super().__init__(message)
+
+
+@dataclasses.dataclass
+class Distance:
+    """
+    Model complying to `WeightedElement` structure
+    to arrange uids based on their tentative distances
+    """
+
+    uid: str
+    weight: Numeric
+
+
+def iter_distance_search(
+    map: models.ElementMap[models.WeightedElement],
+    heuristic: Optional[Heuristic[models.WeightedElement]] = None,
+    check_consistency: bool = False,
+    stats: Optional[recorder.SearchStats] = None,
+    limits: Optional[budget.Budget] = None,
+    frontier: Optional["queue.PriorityQueue[Distance]"] = None,
+) -> Generator[
+    PathTracker[models.WeightedElement],
+    Optional[List[models.WeightedElement]],
+    Optional[PathTracker[models.WeightedElement]],
+]:
+    """
+    Generic generator settling mapped `WeightedElement`s by distance from start,
+    keeping a best-distance table and best path per uid, lazily yielding
+    each settled path, up to and including the one reaching end `Element`
+    Input:
+        map                 : Mapper object linking `WeightedElement`s
+        heuristic           : Estimated remaining distance from `Element` to end
+                              (None estimates 0, i.e. Dijkstra)
+        check_consistency   : Raise `InconsistentHeuristicError` upon relaxing an edge
+                              u -> v where heuristic(u) > weight(v) + heuristic(v)
+        stats               : `SearchStats` to update in place (None to skip counting)
+        limits              : `Budget` to stop search at, once exceeded
+        frontier            : Empty queue of uids to settle, by (estimated) cost,
+                              for callers to peek at (None for a new one)
+    Output:
+        `PathTracker`s in order of settlement, returning the path of the frontier
+        entry of lowest (estimated) cost if stopped by `limits` (None otherwise)
+    (NOTE: `Element` weights must be non-negative, start `Element` weight included)
+    NOTE: sending `Element`s next to the latest path (instead of calling `next`)
+    skips its `get_next` lookup, e.g. for them to be looked up asynchronously
+    """
+
+    start, end_uid = map.start, map.end.uid
+    distances: Dict[str, Numeric] = {start.uid: start.weight}
+    estimates: Dict[str, Numeric] = {}
+    paths: Dict[str, PathTracker[models.WeightedElement]] = {
+        start.uid: PathTracker([start])
+    }
+    settled: Set[str] = set()
+    if limits is not None and limits.unbounded:
+        limits = None
+    if limits is not None and stats is None:
+        stats = recorder.SearchStats()
+
+    def _estimate(element: models.WeightedElement) -> Numeric:
+        """Return (cached) heuristic estimate of `element`"""
+        if heuristic is None:
+            return 0
+        if element.uid not in estimates:
+            estimates[element.uid] = heuristic(element)
+        return estimates[element.uid]
+
+    if frontier is None:
+        frontier = queue.PriorityQueue[Distance](heavy=False)
+    frontier.add(Distance(start.uid, models.add(start.weight, _estimate(start))))
+
+    def _relax(uid: str, elements: Optional[List[models.WeightedElement]]) -> None:
+        """
+        Improve tentative distances of `Element`s next to `uid`
+        (looked up unless given)
+        """
+        if elements is None:
+            if isinstance(map, cached_map.CachedElementMap):
+                map.prefetch(uid, lambda n: [item.uid for item in frontier.peek(n)])
+            elements = map.get_next(uid)
+        distance, path = distances[uid], paths[uid]
+        for e in elements:
+            estimate = _estimate(path.element)
+            if check_consistency and estimate > models.add(e.weight, _estimate(e)):
+                raise InconsistentHeuristicError(uid, e.uid)
+            candidate = models.add(distance, e.weight)
+            if e.uid in distances and not candidate < distances[e.uid]:
+                if stats is not None:
+                    stats.pruned += 1
+                continue
+            priority = models.add(candidate, _estimate(e))
+            if e.uid in settled:
+                # NOTE: only reachable with an inconsistent heuristic, reopen `e`
+                settled.remove(e.uid)
+                frontier.add(Distance(e.uid, priority))
+            elif e.uid in distances:
+                frontier.decrease_key(e.uid, priority)
+            else:
+                frontier.add(Distance(e.uid, priority))
+            distances[e.uid] = candidate
+            paths[e.uid] = path.advance(e)
+        if stats is not None:
+            stats.max_frontier = max(stats.max_frontier, len(frontier))
+
+    while len(frontier) > 0:
+        uid = frontier.get().uid
+        # NOTE: goal is checked first, a path reaching end is never partial
+        if limits is not None and stats is not None and limits.exceeded(stats):
+            if uid != end_uid:
+                return paths[uid]
+        settled.add(uid)
+        if stats is not None:
+            stats.expanded += 1
+        elements = yield paths[uid]
+        if uid == end_uid:
+            return None
+        _relax(uid, elements)
+    return None
+
+
+def distance_search(
+    map: models.ElementMap[models.WeightedElement],
+    heuristic: Optional[Heuristic[models.WeightedElement]] = None,
+    check_consistency: bool = False,
+    recording: str = "full",
+    recording_limit: int = 100,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.WeightedElement]:
+    """
+    Generic method for settling mapped `WeightedElement`s by distance from start
+    (see `iter_distance_search` and `queue_search` for parameters)
+    Output:
+        SearchResult
+    """
+
+    solution: List[models.WeightedElement] = []
+    history = recorder.Recorder[models.WeightedElement](recording, recording_limit)
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    paths = iter_distance_search(
+        map, heuristic, check_consistency, history.stats, limits
+    )
+    while True:
+        try:
+            path = next(paths)
+        except StopIteration as stop:
+            best = stop.value
+            break
+        parent = None if path.parent is None else path.parent.element.uid
+        history.record(path, path.element.uid, parent)
+        if path.element.uid == map.end.uid:
+            solution = path.elements
+
+    return queue_search.SearchResult(
+        solution=solution if best is None else best.elements,
+        searches=history.searches(),
+        stats=history.stats,
+        partial=best is not None,
+    )
@@ -0,0 +1,127 @@
+import decimal
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Set, Union
+from pyalgo import models, queue
+from pyalgo.search import distance_search
+
+Numeric = Union[int, float, decimal.Decimal]
+Cost = Callable[[models.Element], Numeric]
+
+
+class DistanceTable(Generic[models.Element]):
+    """
+    Best distance and predecessor per uid, settled outwards from `origin`
+    distances   : Dict of (tentative, if not settled) distances from origin
+    previous    : Dict of previous uid along shortest path (None for origin)
+    elements    : Dict of `Element` reaching uid along shortest path
+    settled     : Set of uids whose distances are final
+    searches    : Dict of settled uids not extended (yet), in settling order
+    """
+
+    def __init__(
+        self,
+        origin: models.Element,
+        distance: Numeric,
+        expand: Callable[[str], List[models.Element]],
+        cost: Cost[models.Element],
+    ) -> None:
+        self.expand = expand
+        self.cost = cost
+        self.distance = distance
+        self.distances: Dict[str, Numeric] = {origin.uid: distance}
+        self.elements: Dict[str, models.Element] = {origin.uid: origin}
+        self.previous: Dict[str, Optional[str]] = {origin.uid: None}
+        self.settled: Set[str] = set()
+        self.searches: Dict[str, None] = {}
+        self.frontier = queue.PriorityQueue[distance_search.Distance](heavy=False)
+        self.frontier.add(distance_search.Distance(origin.uid, distance))
+
+    def settle(self) -> str:
+        """Settle closest `Element` in frontier, returning its uid"""
+        item = self.frontier.get()
+        self.distance = item.weight
+        self.settled.add(item.uid)
+        previous_uid = self.previous[item.uid]
+        if previous_uid is not None and previous_uid in self.searches:
+            del self.searches[previous_uid]
+        self.searches[item.uid] = None
+        return item.uid
+
+    def relax(self, uid: str) -> List[str]:
+        """Improve tentative distances next to `uid`, returning improved uids"""
+        improved: List[str] = []
+        distance = self.distances[uid]
+        for e in self.expand(uid):
+            if e.uid in self.settled:
+                continue
+            candidate = models.add(distance, self.cost(e))
+            if e.uid not in self.distances:
+                self.frontier.add(distance_search.Distance(e.uid, candidate))
+            elif candidate < self.distances[e.uid]:
+                self.frontier.decrease_key(e.uid, candidate)
+            else:
+                continue
+            self.distances[e.uid] = candidate
+            self.elements[e.uid] = e
+            self.previous[e.uid] = uid
+            improved.append(e.uid)
+        return improved
+
+    def path(self, uid: str) -> List[models.Element]:
+        """Rebuild path from origin to `uid` via predecessor map (empty if unseen)"""
+        path: List[models.Element] = []
+        current = uid if uid in self.previous else None
+        while current is not None:
+            path.append(self.elements[current])
+            current = self.previous[current]
+        return path[::-1]
+
+
+def distance_table(
+    map: models.ElementMap[models.Element],
+    cost: Cost[models.Element],
+    distance: Numeric,
+    ends: Optional[Iterable[str]] = None,
+) -> DistanceTable[models.Element]:
+    """
+    Generic method settling every `Element` reachable from start
+    Input:
+        map         : Mapper object linking `Element`s
+        cost        : Cost of moving onto an `Element` (must be non-negative)
+        distance    : Distance of start `Element`
+        ends        : Stop once all uids are settled (None settles everything)
+    Output:
+        DistanceTable
+    """
+    table = DistanceTable(map.start, distance, map.get_next, cost)
+    pending = None if ends is None else set(ends)
+    while len(table.frontier) > 0:
+        uid = table.settle()
+        if pending is not None:
+            pending.discard(uid)
+            if not pending:
+                break
+        table.relax(uid)
+    return table
+
+
+def breadth_first_distances(
+    map: models.ElementMap[models.Element],
+    ends: Optional[Iterable[str]] = None,
+) -> DistanceTable[models.Element]:
+    """
+    Fewest moves from start to every reachable `Element`,
+    or only until every uid in `ends` is settled
+    """
+    return distance_table(map, lambda e: 1, 0, ends)
+
+
+def dijakstra_distances(
+    map: models.ElementMap[models.WeightedElement],
+    ends: Optional[Iterable[str]] = None,
+) -> DistanceTable[models.WeightedElement]:
+    """
+    Shortest distances from start to every reachable `Element`,
+    or only until every uid in `ends` is settled
+    (NOTE: `Element` weights must be non-negative, start `Element` weight included)
+    """
+    return distance_table(map, lambda e: e.weight, map.start.weight, ends)
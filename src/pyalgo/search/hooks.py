@@ -0,0 +1,139 @@
+import collections
+import time
+from typing import Any, Callable, Dict, TypeVar, Union, cast
+from pyalgo import models
+from pyalgo.search.path_queue import path_queue
+
+PathTracker = path_queue.PathTracker
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+
+class SearchObserver:
+    """
+    Hooks called along a search, override the ones of interest
+    NOTE: searches only look hooks up once, and run uninstrumented without observer
+    """
+
+    # NOTE: whether search phases are timed and reported via `on_timing`
+    timed = False
+
+    def on_push(self, path: PathTracker[Any]) -> None:
+        """Called after `path` is added to queue"""
+
+    def on_pop(self, path: PathTracker[Any]) -> None:
+        """Called after `path` is retrieved from queue"""
+
+    def on_expand(self, path: PathTracker[Any]) -> None:
+        """Called upon expanding `path`, before looking up `Element`s next to it"""
+
+    def on_goal(self, path: PathTracker[Any]) -> None:
+        """Called upon expanding `path` reaching end `Element`"""
+
+    def on_timing(self, phase: str, seconds: float) -> None:
+        """Called after each timed call of search `phase`, if `timed`"""
+
+
+class Profiler(SearchObserver):
+    """
+    Aggregate counts and cumulative timings per search phase:
+        search      : Whole search
+        push, pop   : Queue operations (push including converter)
+        convert     : Queue converter calls
+        get_next    : `ElementMap.get_next` calls
+        visited     : Visited checks
+        expand, goal: Expansions and goals reached (counts only)
+    """
+
+    timed = True
+
+    def __init__(self) -> None:
+        self.__counts: Dict[str, int] = collections.defaultdict(int)
+        self.__seconds: Dict[str, float] = collections.defaultdict(float)
+
+    def on_expand(self, path: PathTracker[Any]) -> None:
+        self.__counts["expand"] += 1
+
+    def on_goal(self, path: PathTracker[Any]) -> None:
+        self.__counts["goal"] += 1
+
+    def on_timing(self, phase: str, seconds: float) -> None:
+        self.__counts[phase] += 1
+        self.__seconds[phase] += seconds
+
+    def report(self) -> Dict[str, Union[int, float]]:
+        """
+        Return flat dict of "<phase>.count" and "<phase>.seconds" metrics,
+        along with "other.seconds" spent in search outside of timed phases
+        """
+        report: Dict[str, Union[int, float]] = {}
+        for phase in sorted(self.__counts):
+            report[f"{phase}.count"] = self.__counts[phase]
+            if phase in self.__seconds:
+                report[f"{phase}.seconds"] = self.__seconds[phase]
+        if "search" in self.__seconds:
+            phases = ("push", "pop", "get_next", "visited")
+            inner = sum(self.__seconds.get(phase, 0.0) for phase in phases)
+            report["other.seconds"] = max(self.__seconds["search"] - inner, 0.0)
+        return report
+
+    def reset(self) -> None:
+        self.__counts.clear()
+        self.__seconds.clear()
+
+
+def timed(function: Function, observer: SearchObserver, phase: str) -> Function:
+    """Return `function` reporting its timings as `phase`, if `observer` is timed"""
+    if not observer.timed:
+        return function
+
+    def _timed(*args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            observer.on_timing(phase, time.perf_counter() - start)
+
+    return cast(Function, _timed)
+
+
+def observe_push(
+    add: Callable[[PathTracker[models.Element]], None], observer: SearchObserver
+) -> Callable[[PathTracker[models.Element]], None]:
+    """Return queue `add` method calling `observer` hooks"""
+    add = timed(add, observer, "push")
+
+    def _add(path: PathTracker[models.Element]) -> None:
+        add(path)
+        observer.on_push(path)
+
+    return _add
+
+
+def observe_pop(
+    get: Callable[[], PathTracker[models.Element]], observer: SearchObserver
+) -> Callable[[], PathTracker[models.Element]]:
+    """Return queue `get` method calling `observer` hooks"""
+    get = timed(get, observer, "pop")
+
+    def _get() -> PathTracker[models.Element]:
+        path = get()
+        observer.on_pop(path)
+        return path
+
+    return _get
+
+
+def observe_end(
+    check_end: Callable[[PathTracker[models.Element]], bool],
+    observer: SearchObserver,
+) -> Callable[[PathTracker[models.Element]], bool]:
+    """Return end check, called once per expansion, calling `observer` hooks"""
+
+    def _check_end(path: PathTracker[models.Element]) -> bool:
+        observer.on_expand(path)
+        if check_end(path):
+            observer.on_goal(path)
+            return True
+        return False
+
+    return _check_end
@@ -0,0 +1,269 @@
+import decimal
+import itertools
+from typing import Generator, Iterator, List, Optional, Tuple, Union
+from pyalgo import models
+from pyalgo.search import budget, distance_search, path_queue, queue_search, recorder
+
+Numeric = Union[int, float, decimal.Decimal]
+PathTracker = path_queue.PathTracker
+# NOTE: each frame holds a path and the `Element`s next to it left to visit
+Frame = Tuple[PathTracker[models.Element], Iterator[models.Element]]
+
+
+def _advance(
+    stack: List[Frame[models.Element]],
+    stats: Optional[recorder.SearchStats],
+) -> Optional[PathTracker[models.Element]]:
+    """
+    Pop frames until one yields an `Element` not yet visited along its path,
+    returning the path extended by it (None once stack is exhausted)
+    """
+    while stack:
+        parent, elements = stack[-1]
+        for e in elements:
+            if e not in parent:
+                return parent.advance(e)
+            if stats is not None:
+                stats.pruned += 1
+        stack.pop()
+    return None
+
+
+def _limits(
+    stats: Optional[recorder.SearchStats], limits: Optional[budget.Budget]
+) -> Tuple[Optional[recorder.SearchStats], Optional[budget.Budget]]:
+    """Return `stats` to count against `limits` (None if unbounded)"""
+    if limits is not None and limits.unbounded:
+        limits = None
+    if limits is not None and stats is None:
+        stats = recorder.SearchStats()
+    return stats, limits
+
+
+def _depth_limited(
+    map: models.ElementMap[models.Element],
+    limit: int,
+    stats: Optional[recorder.SearchStats],
+    limits: Optional[budget.Budget],
+) -> Generator[
+    PathTracker[models.Element],
+    None,
+    Tuple[bool, Optional[PathTracker[models.Element]]],
+]:
+    """
+    `iter_depth_limited_search` core, returning whether a deeper `limit` may reach
+    end `Element` (False once reached or if no path got cut off) and the next path
+    if stopped by `limits` (None otherwise)
+    """
+    end_uid = map.end.uid
+    stack: List[Frame[models.Element]] = []
+    cutoff = False
+    path: Optional[PathTracker[models.Element]] = PathTracker([map.start])
+    while path is not None:
+        # NOTE: goal is checked first, a path reaching end is never partial
+        if limits is not None and stats is not None and limits.exceeded(stats):
+            if path.element.uid != end_uid:
+                return False, path
+        if stats is not None:
+            stats.expanded += 1
+        yield path
+        if path.element.uid == end_uid:
+            return False, None
+        if len(path) > limit:
+            cutoff = True
+        else:
+            stack.append((path, iter(map.get_next(path.element.uid))))
+            if stats is not None:
+                stats.max_frontier = max(stats.max_frontier, len(stack))
+        path = _advance(stack, stats)
+    return cutoff, None
+
+
+def iter_depth_limited_search(
+    map: models.ElementMap[models.Element],
+    limit: int,
+    stats: Optional[recorder.SearchStats] = None,
+    limits: Optional[budget.Budget] = None,
+) -> Generator[
+    PathTracker[models.Element], None, Optional[PathTracker[models.Element]]
+]:
+    """
+    Depth-first traversal of paths of up to `limit` moves, lazily yielding each
+    expanded path, up to and including the one reaching end `Element`
+    NOTE: runs on an explicit stack of one frame per depth, `Element`s are only
+    rejected if already visited along the same path (no closed set)
+    Input:
+        map     : Mapper object linking `Element`s
+        limit   : Maximum number of moves from start `Element`
+        stats   : `SearchStats` to update in place (None to skip counting),
+                  `max_frontier` standing for the deepest stack
+        limits  : `Budget` stopping search early (None for unbounded)
+    Output:
+        `PathTracker`s in order of expansion,
+        returning the next path to expand if stopped by `limits` (None otherwise)
+    """
+    if limit < 0:
+        raise ValueError(f"limit must be non-negative, got: {limit}")
+    stats, limits = _limits(stats, limits)
+    _, best = yield from _depth_limited(map, limit, stats, limits)
+    return best
+
+
+def iter_iterative_deepening_search(
+    map: models.ElementMap[models.Element],
+    max_depth: Optional[int] = None,
+    stats: Optional[recorder.SearchStats] = None,
+    limits: Optional[budget.Budget] = None,
+) -> Generator[
+    PathTracker[models.Element], None, Optional[PathTracker[models.Element]]
+]:
+    """
+    Repeat `iter_depth_limited_search` with limits of 0, 1, 2, ... `max_depth`
+    (None for no limit), until end `Element` is reached or no path got cut off
+    NOTE: shallow paths are expanded again on each iteration, and count again
+    against `limits`
+    """
+    stats, limits = _limits(stats, limits)
+    depths = itertools.count() if max_depth is None else range(max_depth + 1)
+    for depth in depths:
+        cutoff, best = yield from _depth_limited(map, depth, stats, limits)
+        if best is not None or not cutoff:
+            return best
+    return None
+
+
+def iter_ida_star_search(
+    map: models.ElementMap[models.WeightedElement],
+    heuristic: distance_search.Heuristic[models.WeightedElement],
+    stats: Optional[recorder.SearchStats] = None,
+    limits: Optional[budget.Budget] = None,
+) -> Generator[
+    PathTracker[models.WeightedElement],
+    None,
+    Optional[PathTracker[models.WeightedElement]],
+]:
+    """
+    https://en.wikipedia.org/wiki/Iterative_deepening_A*
+    Repeat depth-first traversals pruning paths whose cost plus `heuristic` estimate
+    exceeds a bound, raised each time to the lowest estimate pruned, until end
+    `Element` is reached or nothing got pruned (see `iter_depth_limited_search`)
+    """
+
+    stats, limits = _limits(stats, limits)
+    end_uid = map.end.uid
+    bound: Optional[Numeric] = models.add(map.start.weight, heuristic(map.start))
+    while bound is not None:
+        stack: List[Frame[models.WeightedElement]] = []
+        exceeded: Optional[Numeric] = None
+        path: Optional[PathTracker[models.WeightedElement]] = PathTracker([map.start])
+        while path is not None:
+            estimate = models.add(path.weight, heuristic(path.element))
+            if estimate > bound:
+                if exceeded is None or estimate < exceeded:
+                    exceeded = estimate
+                if stats is not None:
+                    stats.pruned += 1
+            else:
+                if limits is not None and stats is not None and limits.exceeded(stats):
+                    if path.element.uid != end_uid:
+                        return path
+                if stats is not None:
+                    stats.expanded += 1
+                yield path
+                if path.element.uid == end_uid:
+                    return None
+                stack.append((path, iter(map.get_next(path.element.uid))))
+                if stats is not None:
+                    stats.max_frontier = max(stats.max_frontier, len(stack))
+            path = _advance(stack, stats)
+        bound = exceeded
+    return None
+
+
+def _consume(
+    map: models.ElementMap[models.Element],
+    paths: Generator[
+        PathTracker[models.Element], None, Optional[PathTracker[models.Element]]
+    ],
+    history: recorder.Recorder[models.Element],
+) -> queue_search.SearchResult[models.Element]:
+    """Collect `SearchResult` from paths yielded by an iterative deepening engine"""
+    solution: List[models.Element] = []
+    while True:
+        try:
+            path = next(paths)
+        except StopIteration as stop:
+            best = stop.value
+            break
+        history.record(path, path.uid, path.previous_uid)
+        if path.element.uid == map.end.uid:
+            solution = path.elements
+    return queue_search.SearchResult(
+        solution=solution if best is None else best.elements,
+        searches=history.searches(),
+        stats=history.stats,
+        partial=best is not None,
+    )
+
+
+def depth_limited_search(
+    map: models.ElementMap[models.Element],
+    limit: int,
+    recording: str = "counts",
+    recording_limit: int = 100,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.Element]:
+    """
+    https://en.wikipedia.org/wiki/Depth-limited_search
+    Depth-First Search of paths of up to `limit` moves, using memory proportional
+    to `limit` only (see `queue_search` for `recording` policies, of which "full"
+    and "last" hold explored paths on top, and budgets, `max_frontier` bounding
+    the depth of the stack)
+    """
+    history = recorder.Recorder[models.Element](recording, recording_limit)
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    paths = iter_depth_limited_search(map, limit, history.stats, limits)
+    return _consume(map, paths, history)
+
+
+def iterative_deepening_search(
+    map: models.ElementMap[models.Element],
+    max_depth: Optional[int] = None,
+    recording: str = "counts",
+    recording_limit: int = 100,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.Element]:
+    """
+    https://en.wikipedia.org/wiki/Iterative_deepening_depth-first_search
+    Repeat `depth_limited_search` with increasing limits, finding a path of fewest
+    moves with memory proportional to its length (see `depth_limited_search`)
+    """
+    history = recorder.Recorder[models.Element](recording, recording_limit)
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    paths = iter_iterative_deepening_search(map, max_depth, history.stats, limits)
+    return _consume(map, paths, history)
+
+
+def ida_star_search(
+    map: models.ElementMap[models.WeightedElement],
+    heuristic: distance_search.Heuristic[models.WeightedElement],
+    recording: str = "counts",
+    recording_limit: int = 100,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> queue_search.SearchResult[models.WeightedElement]:
+    """
+    https://en.wikipedia.org/wiki/Iterative_deepening_A*
+    A* search with memory proportional to solution length, solution is optimal
+    for admissible heuristics (see `depth_limited_search`)
+    (NOTE: `Element` weights must be non-negative, start `Element` weight included)
+    """
+    history = recorder.Recorder[models.WeightedElement](recording, recording_limit)
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    paths = iter_ida_star_search(map, heuristic, history.stats, limits)
+    return _consume(map, paths, history)
@@ -0,0 +1,126 @@
+import concurrent.futures
+import mmap
+import os
+import tempfile
+from typing import Dict, Generator, Iterable, List, Optional, Tuple
+from pyalgo import models
+from pyalgo.search import compact_graph, compact_search, queue_search, recorder
+
+CompactGraph = compact_graph.CompactGraph
+Path = compact_search.Path
+# NOTE: (query position, start node, end node, start weight)
+Query = Tuple[int, int, int, float]
+Answer = Tuple[int, Path, List[Path], recorder.SearchStats]
+
+ALGORITHMS = ("breadth_first", "depth_first", "dijakstra")
+
+
+class _SharedGraph:
+    """
+    Read-only CSR arrays of a `CompactGraph`, memory-mapped from file
+    so that worker processes share a single copy of the graph
+    """
+
+    def __init__(self, path: str, lengths: Tuple[int, int, int]) -> None:
+        with open(path, "rb") as f:
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.__mmap)
+        n_offsets, n_targets, n_weights = lengths
+        size_l, size_d = compact_graph.LONG_SIZE, compact_graph.DOUBLE_SIZE
+        offsets_end = n_offsets * size_l
+        targets_end = offsets_end + n_targets * size_l
+        weights_end = targets_end + n_weights * size_d
+        self.offsets = view[:offsets_end].cast("l")
+        self.targets = view[offsets_end:targets_end].cast("l")
+        self.weights = view[targets_end:weights_end].cast("d")
+        self.size = n_offsets - 1
+
+
+_graph: Optional[_SharedGraph] = None
+
+
+def _initialize(path: str, lengths: Tuple[int, int, int]) -> None:
+    """Map shared graph once per worker process"""
+    global _graph
+    _graph = _SharedGraph(path, lengths)
+
+
+def _search(algorithm: str, queries: List[Query]) -> List[Answer]:
+    """Run batch of queries on shared graph inside worker process"""
+    assert _graph is not None, "worker process not initialized"
+    results: List[Answer] = []
+    for i, start, end, origin in queries:
+        stats = recorder.SearchStats()
+        if algorithm == "dijakstra":
+            paths = compact_search.distance_paths(
+                _graph, start, end, origin, stats=stats
+            )
+        else:
+            depth_first = algorithm == "depth_first"
+            paths = compact_search.queue_paths(_graph, start, end, depth_first, stats)
+        results.append((i, *paths, stats))
+    return results
+
+
+def search_many(
+    map: models.ElementMap[models.Element],
+    pairs: Iterable[Tuple[str, str]],
+    algorithm: str = "dijakstra",
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+) -> Generator[Tuple[int, queue_search.SearchResult[models.Element]], None, None]:
+    """
+    Run independent searches, one per (start uid, end uid) pair, across processes
+    Input:
+        map         : Mapper object linking `Element`s, frozen into `CompactGraph` once
+                      (NOTE: every uid must be reachable from `map.start`)
+        pairs       : (start uid, end uid) of each search
+        algorithm   : One of "breadth_first", "depth_first" (graph-search mode)
+                      or "dijakstra"
+        workers     : Number of worker processes (defaults to number of CPUs)
+        chunk_size  : Number of searches sent to a worker at once
+    Output:
+        (position in `pairs`, SearchResult) tuples, in order of completion
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown algorithm: {algorithm}, expected {ALGORITHMS}")
+
+    graph = map if isinstance(map, CompactGraph) else CompactGraph(map)
+    queries: List[Query] = []
+    starts: Dict[int, int] = {}
+    for i, (start_uid, end_uid) in enumerate(pairs):
+        try:
+            start, end = graph.index(start_uid), graph.index(end_uid)
+        except KeyError as e:
+            raise ValueError(f"uid not reachable from start: {e.args[0]}") from None
+        starts[i] = start
+        queries.append((i, start, end, compact_graph._origin(graph, start)))
+    if not queries:
+        return
+
+    fd, path = tempfile.mkstemp(prefix="pyalgo-", suffix=".csr")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for values in (graph.offsets, graph.targets, graph.weights):
+                values.tofile(f)
+        lengths = (len(graph.offsets), len(graph.targets), len(graph.weights))
+        with concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=_initialize, initargs=(path, lengths)
+        ) as executor:
+            futures = [
+                executor.submit(_search, algorithm, queries[j : j + chunk_size])
+                for j in range(0, len(queries), chunk_size)
+            ]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    for i, solution, searches, stats in future.result():
+                        yield i, compact_search.to_result(
+                            graph, starts[i], solution, searches, stats
+                        )
+            finally:
+                # NOTE: pending chunks are cancelled before exiting the executor,
+                # which waits for submitted chunks (i.e. once generator is closed)
+                for future in futures:
+                    future.cancel()
+    finally:
+        os.remove(path)
@@ -1,8 +1,20 @@
 import abc
-from typing import Generic, List, Optional
+import itertools
+from typing import Generic, List, Optional, Sequence
 from pyalgo import models
 from pyalgo.queue import queue
 
+_uids = itertools.count()
+# NOTE: paths are split into segments of `_SEGMENT` `Element`s, each with its own
+# bloom filter of `_BLOOM_BITS` bits, so that filters neither saturate along long
+# paths nor grow (i.e. get copied) with them
+_SEGMENT = 64
+_BLOOM_BITS = 1024
+
+
+def _bloom_bit(element: object) -> int:
+    return 1 << (hash(element) & (_BLOOM_BITS - 1))
+
 
 class PathTracker(Generic[models.Element]):
     """
@@ -15,34 +27,138 @@ class PathTracker(Generic[models.Element]):
             2) [1, 4]
             3) [1, 4, 7]
             4) [1, 4, 7, 8]
+    Each `PathTracker` only holds its latest `Element` and a link to its parent,
+    so trackers 1) to 3) are shared (not copied) by tracker 4).
     """
 
-    def __init__(self, elements: List[models.Element]):
-        self.__elements = elements
-        self.__post_init()
+    __slots__ = (
+        "__element",
+        "__parent",
+        "__length",
+        "__uid",
+        "__bloom",
+        "__segment",
+        "__weight",
+    )
+    __element: models.Element
+    __parent: Optional["PathTracker[models.Element]"]
+    __length: int
+    __uid: int
+    __bloom: int
+    __segment: Optional["PathTracker[models.Element]"]
+    __weight: Optional[models.Numbers]
+
+    def __init__(self, elements: Sequence[models.Element]):
+        if len(elements) == 0:
+            raise ValueError(
+                "can't instantiate search tracker with empty list of `Element`s"
+            )
+        parent: Optional[PathTracker[models.Element]] = None
+        for e in elements[:-1]:
+            parent = PathTracker([e]) if parent is None else parent.advance(e)
+        self.__link(parent, elements[-1])
 
     @property
     def uid(self) -> str:
-        uids = ",".join([e.uid for e in self.__elements])
-        return uids
+        return str(self.__uid)
 
     @property
     def previous_uid(self) -> Optional[str]:
-        uids = ",".join([e.uid for e in self.__elements[:-1]])
-        return uids if uids else None
+        return None if self.__parent is None else self.__parent.uid
+
+    @property
+    def element(self) -> models.Element:
+        """Latest `Element` of path"""
+        return self.__element
+
+    @property
+    def parent(self) -> Optional["PathTracker[models.Element]"]:
+        return self.__parent
 
     @property
     def elements(self) -> List[models.Element]:
-        return self.__elements
+        """Materialize path from first to latest `Element`"""
+        elements: List[models.Element] = []
+        tracker: Optional[PathTracker[models.Element]] = self
+        while tracker is not None:
+            elements.append(tracker.__element)
+            tracker = tracker.__parent
+        return elements[::-1]
+
+    @property
+    def weight(self) -> models.Numbers:
+        """Cumulative weight of `WeightedElement`s in path"""
+        if self.__weight is None:
+            pending: List[PathTracker[models.Element]] = []
+            tracker: Optional[PathTracker[models.Element]] = self
+            while tracker is not None and tracker.__weight is None:
+                pending.append(tracker)
+                tracker = tracker.__parent
+            total: models.Numbers = 0
+            if tracker is not None and tracker.__weight is not None:
+                total = tracker.__weight
+            for t in reversed(pending):
+                total = total + t.__element.weight  # type: ignore[attr-defined]
+                t.__weight = total
+        return self.__weight  # type: ignore[return-value]
+
+    def advance(self, element: models.Element) -> "PathTracker[models.Element]":
+        """Return new `PathTracker` extending current path by `element`"""
+        tracker: PathTracker[models.Element] = PathTracker.__new__(PathTracker)
+        tracker.__link(self, element)
+        return tracker
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __contains__(self, element: object) -> bool:
+        """
+        Check if `element` has been visited along path
+        NOTE: rejects most unvisited `Element`s in O(1) per segment of path via
+        its bloom filter, only walking segments on a potential hit
+        """
+        bit = _bloom_bit(element)
+        tracker: Optional[PathTracker[models.Element]] = self
+        while tracker is not None:
+            segment = tracker.__segment
+            walk = tracker if tracker.__bloom & bit else segment
+            while walk is not None and walk is not segment:
+                if walk.__element == element:
+                    return True
+                walk = walk.__parent
+            tracker = segment
+        return False
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, PathTracker) and self.__elements == other.__elements
+        if not isinstance(other, PathTracker) or len(self) != len(other):
+            return False
+        this: Optional[PathTracker[models.Element]] = self
+        that: Optional[PathTracker[models.Element]] = other
+        while this is not None and that is not None:
+            if this is that:
+                return True
+            if this.__element != that.__element:
+                return False
+            this, that = this.__parent, that.__parent
+        return True
 
-    def __post_init(self) -> None:
-        if len(self.__elements) == 0:
-            raise ValueError(
-                "can't instantiate search tracker with empty list of `Element`s"
-            )
+    def __link(
+        self,
+        parent: Optional["PathTracker[models.Element]"],
+        element: models.Element,
+    ) -> None:
+        self.__element = element
+        self.__parent = parent
+        self.__length = 1 if parent is None else parent.__length + 1
+        self.__uid = next(_uids)
+        self.__bloom = _bloom_bit(element)
+        if parent is None or parent.__length % _SEGMENT == 0:
+            # NOTE: first `Element` of segment, linked to last tracker of previous one
+            self.__segment = parent
+        else:
+            self.__bloom |= parent.__bloom
+            self.__segment = parent.__segment
+        self.__weight = None
 
 
 class PathQueue(queue.Queue[PathTracker[models.Element]]):
@@ -65,3 +181,7 @@ class PathQueue(queue.Queue[PathTracker[models.Element]]):
     @abc.abstractmethod
     def remove(self, uid: str) -> None:
         """Remove `PathTracker` from queue based on uid"""
+
+    @abc.abstractmethod
+    def peek(self, n: int = 1) -> List[PathTracker[models.Element]]:
+        """Return up to `n` next `PathTracker`s in retrieval order, not removing them"""
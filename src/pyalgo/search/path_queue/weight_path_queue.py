@@ -1,6 +1,6 @@
 import dataclasses
 import decimal
-from typing import Callable, Generic, Union
+from typing import Callable, Generic, List, Union
 from pyalgo import models, queue
 from pyalgo.search.path_queue import path_queue
 
@@ -51,3 +51,6 @@ class WeightPathQueue(path_queue.PathQueue[models.Element]):
 
     def remove(self, uid: str) -> None:
         self.__queue.remove(uid)
+
+    def peek(self, n: int = 1) -> List[path_queue.PathTracker[models.Element]]:
+        return [item.tracker for item in self.__queue.peek(n)]
@@ -1,6 +1,17 @@
 import dataclasses
-from typing import Dict, Generic, Iterable, List
+import time
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 from pyalgo import models
+from pyalgo.search import budget, cached_map, hooks, recorder
 from pyalgo.search.path_queue import path_queue
 
 
@@ -10,65 +21,169 @@ class SearchResult(Generic[models.Element]):
     Search Result Model
     solution:   List of `Element`s from start to end
     searches:   Dict of paths done in order from 0 to n-1
+    stats:      Summary of search (None if not recorded)
+    partial:    Whether search ran out of budget, `solution` then being
+                the most promising path found so far (not reaching end)
     """
 
     solution: Iterable[models.Element] = dataclasses.field(default_factory=list)
     searches: Dict[int, Iterable[models.Element]] = dataclasses.field(
         default_factory=dict
     )
+    stats: Optional[recorder.SearchStats] = dataclasses.field(
+        default=None, compare=False
+    )
+    partial: bool = False
 
 
-def queue_search(
+def iter_queue_search(
     map: models.ElementMap[models.Element],
     queue: path_queue.PathQueue[models.Element],
-) -> "SearchResult[models.Element]":
+    tree_search: bool = False,
+    stats: Optional[recorder.SearchStats] = None,
+    limits: Optional[budget.Budget] = None,
+    observer: Optional[hooks.SearchObserver] = None,
+) -> Generator[
+    path_queue.PathTracker[models.Element],
+    Optional[List[models.Element]],
+    Optional[path_queue.PathTracker[models.Element]],
+]:
     """
-    Generic method for traversing through mapped `Element`s
+    Generic generator traversing through mapped `Element`s, lazily yielding
+    each expanded path, up to and including the one reaching end `Element`
     Input:
-        map     : Mapper object linking `Element`s
-        queue   : `PathQueue` object
+        map         : Mapper object linking `Element`s
+        queue       : `PathQueue` object
+        tree_search :
+            - True : only reject `Element`s already visited along the same path,
+                     an `Element` is expanded once per distinct path reaching it
+            - False: expand each `Element` uid at most once (closed set)
+        stats       : `SearchStats` to update in place (None to skip counting)
+        limits      : `Budget` to stop search at, once exceeded
+        observer    : `SearchObserver` hooked onto search (None to skip hooks)
     Output:
-        SearchResult
+        `PathTracker`s in order of expansion,
+        returning the next path in queue if stopped by `limits` (None otherwise)
+    NOTE: sending `Element`s next to the latest path (instead of calling `next`)
+    skips its `get_next` lookup, e.g. for them to be looked up asynchronously
     """
 
-    queue.add(path_queue.PathTracker([map.start]))
-
-    solution: List[models.Element] = []
-    searches: Dict[str, path_queue.PathTracker[models.Element]] = {}
+    closed: Set[str] = set()
+    if limits is not None and limits.unbounded:
+        limits = None
+    if limits is not None and stats is None:
+        stats = recorder.SearchStats()
 
     def _check_visited(path: path_queue.PathTracker[models.Element]) -> bool:
-        """Check if current tracker has already visited latest `Element`"""
-        latest = path.elements[-1]
-        return latest in path.elements[:-1]
+        """Check if latest `Element` has already been visited"""
+        if tree_search:
+            return path.parent is not None and path.element in path.parent
+        return path.element.uid in closed
 
     def _check_end(path: path_queue.PathTracker[models.Element]) -> bool:
         """Check if path has reach end `Element`"""
-        latest = path.elements[-1]
-        return latest.uid == map.end.uid
+        return path.element.uid == map.end.uid
 
-    def _update_searches(path: path_queue.PathTracker[models.Element]) -> None:
-        """Update search list in FIFO manner"""
-        if path.previous_uid and path.previous_uid in searches:
-            del searches[path.previous_uid]
-        searches[path.uid] = path
+    def _update_queue(
+        path: path_queue.PathTracker[models.Element],
+        elements: Optional[List[models.Element]],
+    ) -> None:
+        """Add `Element`s next to path (looked up unless given) to Queue"""
+        if elements is None:
+            if isinstance(map, cached_map.CachedElementMap):
+                map.prefetch(
+                    path.element.uid, lambda n: [p.element.uid for p in queue.peek(n)]
+                )
+            elements = get_next(path.element.uid)
+        for e in elements:
+            if tree_search or e.uid not in closed:
+                add(path.advance(e))
+            elif stats is not None:
+                stats.pruned += 1
+        if stats is not None:
+            stats.max_frontier = max(stats.max_frontier, len(queue))
 
-    def _update_queue(path: path_queue.PathTracker[models.Element]) -> None:
-        """Add `Element` to Queue"""
-        elements = path.elements
-        for e in map.get_next(elements[-1].uid):
-            tracker = path_queue.PathTracker([*path.elements, e])
-            queue.add(tracker)
+    add: Callable[[path_queue.PathTracker[models.Element]], None] = queue.add
+    get: Callable[[], path_queue.PathTracker[models.Element]] = queue.get
+    get_next: Callable[[str], List[models.Element]] = map.get_next
+    check_visited: Callable[[path_queue.PathTracker[models.Element]], bool] = (
+        _check_visited
+    )
+    check_end: Callable[[path_queue.PathTracker[models.Element]], bool] = _check_end
+    if observer is not None:
+        # NOTE: hooks are bound once, leaving the loop below untouched without them
+        add = hooks.observe_push(add, observer)
+        get = hooks.observe_pop(get, observer)
+        get_next = hooks.timed(get_next, observer, "get_next")
+        check_visited = hooks.timed(check_visited, observer, "visited")
+        check_end = hooks.observe_end(check_end, observer)
 
+    add(path_queue.PathTracker([map.start]))
     while len(queue) > 0:
-        path = queue.get()
-        if not _check_visited(path):
-            _update_searches(path)
-            if _check_end(path):
-                solution = [*path.elements]
-                break
-            _update_queue(path)
+        path = get()
+        if not check_visited(path):
+            # NOTE: goal is checked first, a path reaching end is never partial
+            if limits is not None and stats is not None and limits.exceeded(stats):
+                if not _check_end(path):
+                    return path
+            if not tree_search:
+                closed.add(path.element.uid)
+            if stats is not None:
+                stats.expanded += 1
+            elements = yield path
+            if check_end(path):
+                return None
+            _update_queue(path, elements)
+        elif stats is not None:
+            stats.pruned += 1
+    return None
+
+
+def queue_search(
+    map: models.ElementMap[models.Element],
+    queue: path_queue.PathQueue[models.Element],
+    tree_search: bool = False,
+    recording: str = "full",
+    recording_limit: int = 100,
+    max_expansions: Optional[int] = None,
+    max_frontier: Optional[int] = None,
+    deadline: Optional[float] = None,
+    observer: Optional[hooks.SearchObserver] = None,
+) -> "SearchResult[models.Element]":
+    """
+    Generic method for traversing through mapped `Element`s
+    (see `iter_queue_search` for parameters)
+    Input:
+        recording       : One of "off", "counts", "last" or "full" (see `Recorder`)
+        recording_limit : Number of explored paths kept by "last" recording
+        max_expansions  : See `Budget`, result is partial once exceeded
+        max_frontier    : See `Budget`, result is partial once exceeded
+        deadline        : See `Budget`, result is partial once exceeded
+        observer        : See `SearchObserver`, i.e. `Profiler`
+    Output:
+        SearchResult
+    """
+
+    solution: List[models.Element] = []
+    history = recorder.Recorder[models.Element](recording, recording_limit)
+    limits = budget.Budget(max_expansions, max_frontier, deadline)
+    paths = iter_queue_search(map, queue, tree_search, history.stats, limits, observer)
+    start = time.perf_counter()
+    while True:
+        try:
+            path = next(paths)
+        except StopIteration as stop:
+            best = stop.value
+            break
+        history.record(path, path.uid, path.previous_uid)
+        if path.element.uid == map.end.uid:
+            solution = path.elements
+    if observer is not None and observer.timed:
+        observer.on_timing("search", time.perf_counter() - start)
 
     return SearchResult(
-        solution=solution,
-        searches={i: s.elements for i, s in enumerate(searches.values())},
+        solution=solution if best is None else best.elements,
+        searches=history.searches(),
+        stats=history.stats,
+        partial=best is not None,
     )
@@ -0,0 +1,69 @@
+import dataclasses
+from typing import Dict, Generic, Hashable, Iterable, Optional
+from pyalgo import models
+from pyalgo.search.path_queue import path_queue
+
+PathTracker = path_queue.PathTracker
+
+RECORDINGS = ("off", "counts", "last", "full")
+
+
+@dataclasses.dataclass
+class SearchStats:
+    """
+    Search Summary
+    expanded:       Number of paths expanded
+    max_frontier:   Largest number of paths queued at once
+    pruned:         Number of duplicate paths discarded, i.e. reaching `Element`s
+                    already visited (or without improving their distances)
+    """
+
+    expanded: int = 0
+    max_frontier: int = 0
+    pruned: int = 0
+
+
+class Recorder(Generic[models.Element]):
+    """
+    Keep explored paths of a search according to `recording` policy:
+        - "off"    : keep nothing
+        - "counts" : only keep `SearchStats`
+        - "last"   : keep `SearchStats` and the `limit` latest explored paths
+        - "full"   : keep `SearchStats` and every explored path
+    NOTE: explored paths are leaves, a path is dropped once extended
+    """
+
+    def __init__(self, recording: str = "full", limit: int = 100) -> None:
+        if recording not in RECORDINGS:
+            raise ValueError(f"unknown recording: {recording}, expected {RECORDINGS}")
+        if limit < 1:
+            raise ValueError(f"limit must be positive, got: {limit}")
+        self.__keep = recording in ("last", "full")
+        self.__limit = limit if recording == "last" else None
+        self.__stats = None if recording == "off" else SearchStats()
+        self.__searches: Dict[Hashable, PathTracker[models.Element]] = {}
+
+    @property
+    def stats(self) -> Optional[SearchStats]:
+        return self.__stats
+
+    def record(
+        self,
+        path: PathTracker[models.Element],
+        key: Hashable,
+        parent_key: Optional[Hashable],
+    ) -> None:
+        """Keep `path` under `key`, in place of its parent path under `parent_key`"""
+        if not self.__keep:
+            return None
+        searches = self.__searches
+        if parent_key is not None and parent_key in searches:
+            del searches[parent_key]
+        searches.pop(key, None)
+        searches[key] = path
+        if self.__limit is not None and len(searches) > self.__limit:
+            del searches[next(iter(searches))]
+
+    def searches(self) -> Dict[int, Iterable[models.Element]]:
+        """Return kept paths from oldest to latest"""
+        return {i: s.elements for i, s in enumerate(self.__searches.values())}
@@ -0,0 +1,63 @@
+import decimal
+from typing import Any, Iterator, Optional, Union
+from pyalgo import models
+from pyalgo.search import distance_search, iterative_deepening, path_queue, queue_search
+
+Numeric = Union[int, float, decimal.Decimal]
+PathTracker = path_queue.PathTracker
+
+ALGORITHMS = (
+    "breadth_first",
+    "depth_first",
+    "dijakstra",
+    "a_star",
+    "iterative_deepening",
+    "ida_star",
+)
+
+
+def iter_search(
+    map: models.ElementMap[Any],
+    algorithm: str = "breadth_first",
+    tree_search: bool = False,
+    heuristic: Optional[distance_search.Heuristic[Any]] = None,
+    check_consistency: bool = False,
+) -> Iterator[PathTracker[Any]]:
+    """
+    Lazily yield each path expanded by `algorithm`, in order of expansion,
+    the last one reaching end `Element` (if reachable)
+    Input:
+        map                 : Mapper object linking `Element`s
+        algorithm           : One of "breadth_first", "depth_first", "dijakstra",
+                              "a_star", "iterative_deepening" or "ida_star"
+        tree_search         : See `queue_search` (breadth/depth-first only)
+        heuristic           : See `distance_search` (required by "a_star" and
+                              "ida_star")
+        check_consistency   : See `distance_search` ("a_star" only)
+    Output:
+        `PathTracker`s, sharing common prefixes
+    Example:
+        for i, path in enumerate(iter_search(map)):
+            if i == 100:
+                break  # stop after 100 expansions
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown algorithm: {algorithm}, expected {ALGORITHMS}")
+    if algorithm in ("a_star", "ida_star") and heuristic is None:
+        raise ValueError(f"{algorithm} algorithm requires a heuristic")
+
+    if algorithm == "iterative_deepening":
+        return iterative_deepening.iter_iterative_deepening_search(map)
+    if algorithm == "ida_star" and heuristic is not None:
+        return iterative_deepening.iter_ida_star_search(map, heuristic)
+
+    if algorithm in ("dijakstra", "a_star"):
+        return distance_search.iter_distance_search(
+            map, heuristic if algorithm == "a_star" else None, check_consistency
+        )
+
+    def _convert(tracker: PathTracker[Any]) -> Numeric:
+        return len(tracker) if algorithm == "breadth_first" else -1 * len(tracker)
+
+    queue = path_queue.WeightPathQueue[Any](_convert)
+    return queue_search.iter_queue_search(map, queue, tree_search)
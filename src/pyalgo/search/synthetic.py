@@ -0,0 +1,405 @@
+import dataclasses
+import functools
+import math
+import operator
+import random
+from typing import List, Optional, Sequence, Set, Tuple
+from pyalgo import models
+
+MASK = (1 << 64) - 1
+Cell = Tuple[int, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class GraphElement:
+    uid: str
+    weight: int = 1
+
+
+def _mix(*values: int) -> int:
+    """
+    Hash `values` into a 64 bits int (splitmix64 finalizer), a stateless source
+    of randomness letting neighbours be generated on demand, in any order
+    """
+    h = 0
+    for value in values:
+        h = (h + (value & MASK) + 0x9E3779B97F4A7C15) & MASK
+        h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+        h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK
+        h ^= h >> 31
+    return h
+
+
+def _uniform(*values: int) -> float:
+    """Hash `values` into a float uniformly distributed over [0, 1)"""
+    return _mix(*values) / (MASK + 1)
+
+
+def _cell(uid: str) -> Cell:
+    return tuple(int(i) for i in uid.split(","))
+
+
+def _uid(cell: Cell) -> str:
+    return ",".join(str(i) for i in cell)
+
+
+class GridMap(models.ElementMap[GraphElement]):
+    """
+    Grid of any dimensions, linking each cell to its axis-aligned neighbours,
+    from corner "0,0,..." to the opposite one
+    NOTE: cells are laid out, blocked and weighted on demand from `seed`,
+    moving onto a cell costs its weight
+    Input:
+        shape       : Number of cells along each axis, e.g. (1000, 1000) for 2D
+        obstacles   : Fraction of cells blocked (start and end cells never are)
+        max_weight  : Cell weights are drawn from 1 to `max_weight`
+        seed        : Seed of the random obstacles and weights
+    """
+
+    def __init__(
+        self,
+        shape: Sequence[int],
+        obstacles: float = 0.0,
+        max_weight: int = 1,
+        seed: int = 0,
+    ) -> None:
+        if not shape or min(shape) < 1:
+            raise ValueError(f"shape must hold positive sides, got: {shape}")
+        if not 0.0 <= obstacles < 1.0:
+            raise ValueError(f"obstacles must be in [0, 1), got: {obstacles}")
+        if max_weight < 1:
+            raise ValueError(f"max_weight must be positive, got: {max_weight}")
+        self.__shape = tuple(shape)
+        self.__obstacles = obstacles
+        self.__max_weight = max_weight
+        self.__seed = seed
+        self.__first = tuple(0 for _ in shape)
+        self.__last = tuple(side - 1 for side in shape)
+
+    @property
+    def start(self) -> GraphElement:
+        return GraphElement(_uid(self.__first), 0)
+
+    @property
+    def end(self) -> GraphElement:
+        return GraphElement(_uid(self.__last), self.__weight(self.__last))
+
+    @property
+    def size(self) -> int:
+        """Number of cells, blocked ones included"""
+        return functools.reduce(operator.mul, self.__shape, 1)
+
+    def blocked(self, uid: str) -> bool:
+        """Return if cell `uid` is an obstacle"""
+        return self.__blocked(_cell(uid))
+
+    def get_next(self, uid: str) -> List[GraphElement]:
+        return [
+            GraphElement(_uid(cell), self.__weight(cell))
+            for cell in self.__neighbours(_cell(uid))
+        ]
+
+    def get_previous(self, uid: str) -> List[GraphElement]:
+        cell = _cell(uid)
+        if self.__blocked(cell):
+            return []
+        weight = self.__weight(cell)
+        return [GraphElement(_uid(c), weight) for c in self.__neighbours(cell)]
+
+    def heuristic(self, element: GraphElement) -> int:
+        """Manhattan distance to end, consistent since each move costs at least 1"""
+        cell = _cell(element.uid)
+        return sum(last - i for i, last in zip(cell, self.__last))
+
+    def __blocked(self, cell: Cell) -> bool:
+        if not self.__obstacles or cell == self.__first or cell == self.__last:
+            return False
+        return _uniform(self.__seed, 0, *cell) < self.__obstacles
+
+    def __weight(self, cell: Cell) -> int:
+        if self.__max_weight == 1:
+            return 1
+        return 1 + _mix(self.__seed, 1, *cell) % self.__max_weight
+
+    def __neighbours(self, cell: Cell) -> List[Cell]:
+        neighbours: List[Cell] = []
+        for axis, side in enumerate(self.__shape):
+            for step in (1, -1):
+                i = cell[axis] + step
+                if 0 <= i < side:
+                    neighbour = cell[:axis] + (i,) + cell[axis + 1 :]
+                    if not self.__blocked(neighbour):
+                        neighbours.append(neighbour)
+        return neighbours
+
+
+class ErdosRenyiMap(models.ElementMap[GraphElement]):
+    """
+    https://en.wikipedia.org/wiki/Erd%C5%91s%E2%80%93R%C3%A9nyi_model
+    Directed random graph of `size` nodes "0" to "<size - 1>", each linking to any
+    other with the same probability, from "0" to "<size - 1>"
+    NOTE: each node's links are sampled on demand by geometric skips (in time
+    proportional to their count), repeated lookups returning the same `Element`s
+    Input:
+        size        : Number of nodes
+        degree      : Average number of links per node
+        max_weight  : Link weights are drawn from 1 to `max_weight`
+        seed        : Seed of the random links and weights
+    """
+
+    def __init__(
+        self, size: int, degree: float = 3.0, max_weight: int = 9, seed: int = 0
+    ) -> None:
+        if size < 2:
+            raise ValueError(f"size must be at least 2, got: {size}")
+        if not 0.0 < degree <= size - 1:
+            raise ValueError(f"degree must be in (0, {size - 1}], got: {degree}")
+        if max_weight < 1:
+            raise ValueError(f"max_weight must be positive, got: {max_weight}")
+        self.__size = size
+        self.__probability = degree / (size - 1)
+        self.__max_weight = max_weight
+        self.__seed = seed
+
+    @property
+    def start(self) -> GraphElement:
+        return GraphElement("0", 0)
+
+    @property
+    def end(self) -> GraphElement:
+        return GraphElement(str(self.__size - 1), 0)
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def get_next(self, uid: str) -> List[GraphElement]:
+        node = int(uid)
+        rng = random.Random(_mix(self.__seed, node))
+        log_miss = math.log1p(-self.__probability) if self.__probability < 1 else 0.0
+        elements: List[GraphElement] = []
+        # NOTE: walks over the `size - 1` other nodes, skipping node itself
+        i = -1
+        while True:
+            if log_miss:
+                i += 1 + int(math.log1p(-rng.random()) / log_miss)
+            else:
+                i += 1
+            if i >= self.__size - 1:
+                return elements
+            target = i if i < node else i + 1
+            weight = rng.randint(1, self.__max_weight)
+            elements.append(GraphElement(str(target), weight))
+
+
+class BarabasiAlbertMap(models.ElementMap[GraphElement]):
+    """
+    https://en.wikipedia.org/wiki/Barab%C3%A1si%E2%80%93Albert_model
+    Scale-free graph of `size` nodes "0" to "<size - 1>", each node attaching
+    to up to `links` older nodes picked with probability proportional to their
+    degree, searched from newest node "<size - 1>" to oldest node "0" (the first
+    hub, reachable from any node, every node but "0" linking to at least one
+    older node)
+    NOTE: `directed` links only lead from each node to the older ones it attached
+    to, resolved on demand following Batagelj and Brandes' edge list formulation:
+    the target of edge k is the endpoint of a random earlier edge.
+    Otherwise links are traversable both ways, searched from "0" to "<size - 1>",
+    but as newer nodes attached to a node can only be found by generating every
+    attachment, they are all indexed upon first lookup (in time and memory
+    proportional to `size` * `links`, unlike other synthetic maps)
+    Input:
+        size        : Number of nodes
+        links       : Number of attachments of each node (duplicates merged)
+        max_weight  : Link weights are drawn from 1 to `max_weight`
+        seed        : Seed of the random attachments and weights
+        directed    : Whether links only lead to older nodes (False for undirected
+                      links, indexed upon first lookup)
+    """
+
+    def __init__(
+        self,
+        size: int,
+        links: int = 2,
+        max_weight: int = 9,
+        seed: int = 0,
+        directed: bool = True,
+    ) -> None:
+        if size < 2:
+            raise ValueError(f"size must be at least 2, got: {size}")
+        if links < 1:
+            raise ValueError(f"links must be positive, got: {links}")
+        if max_weight < 1:
+            raise ValueError(f"max_weight must be positive, got: {max_weight}")
+        self.__size = size
+        self.__links = links
+        self.__max_weight = max_weight
+        self.__seed = seed
+        self.__directed = directed
+        self.__newer: Optional[List[List[GraphElement]]] = None
+
+    @property
+    def start(self) -> GraphElement:
+        return GraphElement(str(self.__size - 1) if self.__directed else "0", 0)
+
+    @property
+    def end(self) -> GraphElement:
+        return GraphElement("0" if self.__directed else str(self.__size - 1), 0)
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def get_next(self, uid: str) -> List[GraphElement]:
+        node = int(uid)
+        if self.__directed:
+            return self.__older(node)
+        if self.__newer is None:
+            self.__newer = self.__index()
+        return self.__older(node) + self.__newer[node]
+
+    def __older(self, node: int) -> List[GraphElement]:
+        """Return older nodes `node` attached to"""
+        seen: Set[int] = {node}
+        elements: List[GraphElement] = []
+        for edge in range(node * self.__links, (node + 1) * self.__links):
+            target = self.__target(edge)
+            if target not in seen:
+                seen.add(target)
+                weight = 1 + _mix(self.__seed, 1, edge) % self.__max_weight
+                elements.append(GraphElement(str(target), weight))
+        return elements
+
+    def __index(self) -> List[List[GraphElement]]:
+        """Return newer nodes attached to each node"""
+        newer: List[List[GraphElement]] = [[] for _ in range(self.__size)]
+        for node in range(1, self.__size):
+            for e in self.__older(node):
+                newer[int(e.uid)].append(GraphElement(str(node), e.weight))
+        return newer
+
+    def __target(self, edge: int) -> int:
+        """
+        Return node attached to by `edge`, edges being laid out as endpoints
+        [source 0, target 0, source 1, target 1, ...], source of edge k being node
+        k // links and its target the endpoint at a random position below 2k
+        """
+        while edge:
+            position = _mix(self.__seed, 0, edge) % (2 * edge)
+            if position % 2 == 0:
+                return position // 2 // self.__links
+            edge = position // 2
+        return 0
+
+
+class RoadMap(models.ElementMap[GraphElement]):
+    """
+    Planar road-network-like graph: a `side` x `side` lattice of jittered
+    intersections, with some streets removed and some blocks crossed by a
+    diagonal, from corner "0,0" to corner "<side - 1>,<side - 1>"
+    NOTE: streets are undirected, weighing 100 times their length rounded up,
+    everything is generated on demand from `seed`
+    Input:
+        side        : Number of intersections along each axis
+        removed     : Fraction of lattice streets removed
+        diagonals   : Fraction of blocks crossed by a diagonal street
+        jitter      : Maximum offset of intersections from lattice, in [0, 0.5)
+        seed        : Seed of the random layout
+    """
+
+    SCALE = 100
+
+    def __init__(
+        self,
+        side: int,
+        removed: float = 0.1,
+        diagonals: float = 0.2,
+        jitter: float = 0.3,
+        seed: int = 0,
+    ) -> None:
+        if side < 2:
+            raise ValueError(f"side must be at least 2, got: {side}")
+        if not 0.0 <= removed < 1.0 or not 0.0 <= diagonals <= 1.0:
+            raise ValueError(f"invalid fractions: {removed}, {diagonals}")
+        if not 0.0 <= jitter < 0.5:
+            raise ValueError(f"jitter must be in [0, 0.5), got: {jitter}")
+        self.__side = side
+        self.__removed = removed
+        self.__diagonals = diagonals
+        self.__jitter = jitter
+        self.__seed = seed
+
+    @property
+    def start(self) -> GraphElement:
+        return GraphElement("0,0", 0)
+
+    @property
+    def end(self) -> GraphElement:
+        return GraphElement(f"{self.__side - 1},{self.__side - 1}", 0)
+
+    @property
+    def size(self) -> int:
+        return self.__side**2
+
+    def position(self, uid: str) -> Tuple[float, float]:
+        """Return coordinates of intersection `uid`"""
+        i, j = _cell(uid)
+        return self.__position(i, j)
+
+    def get_next(self, uid: str) -> List[GraphElement]:
+        i, j = _cell(uid)
+        x, y = self.__position(i, j)
+        elements: List[GraphElement] = []
+        for a, b in self.__neighbours(i, j):
+            u, v = self.__position(a, b)
+            weight = math.ceil(self.SCALE * math.hypot(u - x, v - y))
+            elements.append(GraphElement(f"{a},{b}", weight))
+        return elements
+
+    def get_previous(self, uid: str) -> List[GraphElement]:
+        return self.get_next(uid)
+
+    def heuristic(self, element: GraphElement) -> int:
+        """Straight-line distance to end rounded down, consistent with weights"""
+        x, y = self.position(element.uid)
+        u, v = self.position(self.end.uid)
+        return math.floor(self.SCALE * math.hypot(u - x, v - y))
+
+    def __position(self, i: int, j: int) -> Tuple[float, float]:
+        offset = 2 * self.__jitter
+        dx = offset * (_uniform(self.__seed, 0, i, j) - 0.5)
+        dy = offset * (_uniform(self.__seed, 1, i, j) - 0.5)
+        return i + dx, j + dy
+
+    def __street(self, i: int, j: int, a: int, b: int) -> bool:
+        """Return if lattice street between neighbours (i, j) and (a, b) is kept"""
+        (i, j), (a, b) = sorted([(i, j), (a, b)])
+        return _uniform(self.__seed, 2, i, j, a, b) >= self.__removed
+
+    def __diagonal(self, i: int, j: int) -> int:
+        """
+        Return diagonal crossing block of lower corner (i, j): 0 for none, 1 from
+        (i, j) to (i + 1, j + 1), -1 from (i + 1, j) to (i, j + 1)
+        NOTE: at most one diagonal per block keeps the graph planar
+        """
+        if _uniform(self.__seed, 3, i, j) >= self.__diagonals:
+            return 0
+        return 1 if _mix(self.__seed, 4, i, j) % 2 else -1
+
+    def __neighbours(self, i: int, j: int) -> List[Tuple[int, int]]:
+        last = self.__side - 1
+        neighbours = [
+            (a, b)
+            for a, b in ((i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1))
+            if 0 <= a <= last and 0 <= b <= last and self.__street(i, j, a, b)
+        ]
+        # NOTE: blocks touching (i, j), by lower corner, and the diagonal via it
+        blocks = [(i, j, 1), (i - 1, j - 1, 1), (i - 1, j, -1), (i, j - 1, -1)]
+        for a, b, diagonal in blocks:
+            if 0 <= a < last and 0 <= b < last and self.__diagonal(a, b) == diagonal:
+                if diagonal == 1:
+                    neighbours.append((a + 1, b + 1) if (a, b) == (i, j) else (a, b))
+                elif (a + 1, b) == (i, j):
+                    neighbours.append((a, b + 1))
+                else:
+                    neighbours.append((a + 1, b))
+        return neighbours
@@ -0,0 +1,167 @@
+import dataclasses
+from typing import TYPE_CHECKING, Any, Iterable, List, Tuple
+from pyalgo import models
+from pyalgo.search import compact_graph
+
+if TYPE_CHECKING:
+    import numpy
+
+CompactGraph = compact_graph.CompactGraph
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        message = "vectorized searches require numpy: `pip install pyalgo[numpy]`"
+        raise ImportError(message) from e
+    return numpy
+
+
+@dataclasses.dataclass
+class BatchResult:
+    """
+    Batch Search Result Model, row q holding results searched from `sources[q]`
+    graph       : `CompactGraph` searched
+    sources     : Interned ints of source `Element`s
+    distances   : Distance to every node (inf if unreachable), start `Element` weight
+                  included as in `dijakstra_search` when searched from start, other
+                  sources (only known by uid) weighing 0 (edge counts for
+                  breadth-first searches)
+    predecessors: Previous node along a shortest path (-1 if source or unreachable)
+    edges       : CSR position of edge reaching node (-1 if source or unreachable)
+    """
+
+    graph: "CompactGraph[Any]"
+    sources: "numpy.ndarray"
+    distances: "numpy.ndarray"
+    predecessors: "numpy.ndarray"
+    edges: "numpy.ndarray"
+
+    def path(self, row: int, uid: str) -> List[Any]:
+        """
+        Return `Element`s along shortest path from `sources[row]` to `uid`
+        (NOTE: source other than start stands as `Element` first reaching it)
+        """
+        node = self.graph.index(uid)
+        path: List[Any] = []
+        if self.edges[row, node] < 0 and node != self.sources[row]:
+            return path
+        while node >= 0:
+            edge = int(self.edges[row, node])
+            element = self.graph.link(edge) if edge >= 0 else self.graph.element(node)
+            path.append(element)
+            node = int(self.predecessors[row, node])
+        return path[::-1]
+
+
+def _prepare(
+    map: models.ElementMap[models.Element], uids: Iterable[str]
+) -> Tuple["CompactGraph[Any]", Any, Any, Any, Any, Any]:
+    """Return graph, interned sources, numpy views of CSR arrays and numpy"""
+    np = _numpy()
+    graph = map if isinstance(map, CompactGraph) else CompactGraph(map)
+    indices: List[int] = []
+    for uid in uids:
+        try:
+            indices.append(graph.index(uid))
+        except KeyError:
+            raise ValueError(f"source uid not reachable from start: {uid}") from None
+    sources = np.array(indices, dtype=np.int64)
+    offsets = np.frombuffer(graph.offsets, dtype=np.dtype(graph.offsets.typecode))
+    targets = np.frombuffer(graph.targets, dtype=np.dtype(graph.targets.typecode))
+    weights = np.frombuffer(graph.weights, dtype=np.float64)
+    return graph, sources, offsets.astype(np.int64), targets, weights, np
+
+
+def _expand(np: Any, offsets: Any, rows: Any, nodes: Any) -> Tuple[Any, Any]:
+    """Return (row, CSR position) pairs of every edge leaving (row, node) pairs"""
+    counts = offsets[nodes + 1] - offsets[nodes]
+    total = int(counts.sum())
+    edge_rows = np.repeat(rows, counts)
+    starts = np.repeat(offsets[nodes] - (np.cumsum(counts) - counts), counts)
+    return edge_rows, starts + np.arange(total)
+
+
+def batch_breadth_first_search(
+    map: models.ElementMap[models.Element],
+    uids: Iterable[str],
+) -> BatchResult:
+    """
+    Level-synchronous Breadth-First Search from every uid in `uids` at once,
+    expanding the whole frontier of all sources per numpy step
+    Distances count edges, `map` is frozen into a `CompactGraph` if needed
+    (NOTE: every uid must be reachable from `map.start`)
+    """
+    graph, sources, offsets, targets, _, np = _prepare(map, uids)
+    shape = (len(sources), graph.size)
+    distances = np.full(shape, np.inf)
+    predecessors = np.full(shape, -1, dtype=np.int64)
+    edges = np.full(shape, -1, dtype=np.int64)
+    visited = np.zeros(shape, dtype=bool)
+
+    rows = np.arange(len(sources))
+    distances[rows, sources] = 0
+    visited[rows, sources] = True
+    frontier_rows, frontier_nodes = rows, sources
+    level = 0
+    while len(frontier_rows) > 0:
+        level += 1
+        edge_rows, edge_ids = _expand(np, offsets, frontier_rows, frontier_nodes)
+        edge_targets = targets[edge_ids]
+        fresh = ~visited[edge_rows, edge_targets]
+        edge_rows, edge_ids = edge_rows[fresh], edge_ids[fresh]
+        edge_targets = edge_targets[fresh]
+
+        keys = edge_rows * graph.size + edge_targets
+        _, first = np.unique(keys, return_index=True)
+        frontier_rows, frontier_nodes = edge_rows[first], edge_targets[first]
+        visited[frontier_rows, frontier_nodes] = True
+        distances[frontier_rows, frontier_nodes] = level
+        edges[frontier_rows, frontier_nodes] = edge_ids[first]
+        origins = np.searchsorted(offsets, edge_ids[first], side="right") - 1
+        predecessors[frontier_rows, frontier_nodes] = origins
+
+    return BatchResult(graph, sources, distances, predecessors, edges)
+
+
+def batch_dijakstra_search(
+    map: models.ElementMap[models.WeightedElement],
+    uids: Iterable[str],
+) -> BatchResult:
+    """
+    Shortest paths from every uid in `uids` at once, via frontier-based
+    Bellman-Ford: each numpy step relaxes all edges leaving nodes whose distance
+    improved in the previous step, for all sources together
+    (NOTE: `Element` weights must be non-negative, see `BatchResult` for weights
+    of sources, and every uid must be reachable from `map.start`)
+    """
+    graph, sources, offsets, targets, weights, np = _prepare(map, uids)
+    shape = (len(sources), graph.size)
+    distances = np.full(shape, np.inf)
+    predecessors = np.full(shape, -1, dtype=np.int64)
+    edges = np.full(shape, -1, dtype=np.int64)
+
+    rows = np.arange(len(sources))
+    origins = [compact_graph._origin(graph, int(s)) for s in sources]
+    distances[rows, sources] = np.array(origins, dtype=np.float64)
+    active_rows, active_nodes = rows, sources
+    while len(active_rows) > 0:
+        edge_rows, edge_ids = _expand(np, offsets, active_rows, active_nodes)
+        origins = np.searchsorted(offsets, edge_ids, side="right") - 1
+        edge_targets = targets[edge_ids]
+        candidates = distances[edge_rows, origins] + weights[edge_ids]
+
+        keys = edge_rows * graph.size + edge_targets
+        order = np.lexsort((edge_ids, candidates, keys))
+        _, first = np.unique(keys[order], return_index=True)
+        best = order[first]
+        improved = candidates[best] < distances[edge_rows[best], edge_targets[best]]
+        best = best[improved]
+
+        active_rows, active_nodes = edge_rows[best], edge_targets[best]
+        distances[active_rows, active_nodes] = candidates[best]
+        predecessors[active_rows, active_nodes] = origins[best]
+        edges[active_rows, active_nodes] = edge_ids[best]
+
+    return BatchResult(graph, sources, distances, predecessors, edges)
@@ -1,5 +1,14 @@
+from pyalgo.sort._external_sort import external_sort
+from pyalgo.sort._keys import cmp_to_key
 from pyalgo.sort._quick_sort import quick_sort
 from pyalgo.sort._merge_sort import merge_sort
+from pyalgo.sort._parallel_sort import parallel_sort
 
 
-__all__ = ["quick_sort", "merge_sort"]
+__all__ = [
+    "cmp_to_key",
+    "external_sort",
+    "quick_sort",
+    "merge_sort",
+    "parallel_sort",
+]
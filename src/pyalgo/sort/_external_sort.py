@@ -0,0 +1,130 @@
+import contextlib
+import itertools
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Generator, Iterable, Iterator, List, Optional, TypeVar
+from pyalgo.sort import _keys, _merge_sort
+
+T = TypeVar("T")
+
+# NOTE: items are spilled and loaded back by batches, bounding memory of the
+# merge to one batch per run
+BATCH_SIZE = 1024
+
+
+def _spill(items: Iterable[Any], path: str) -> str:
+    """Write `items` to file at `path` by pickled batches, returning `path`"""
+    iterator = iter(items)
+    with open(path, "wb") as f:
+        while True:
+            batch = list(itertools.islice(iterator, BATCH_SIZE))
+            if not batch:
+                return path
+            pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+
+
+def _load(path: str) -> Generator[Any, None, None]:
+    """Lazily yield items spilled to file at `path`, opened upon first item"""
+    with open(path, "rb") as f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+
+@contextlib.contextmanager
+def _merged(
+    paths: List[str], key: Optional[Callable[[Any], Any]], reverse: bool
+) -> Iterator[Iterator[Any]]:
+    """Stable k-way merge of runs spilled to `paths`, closing their files after"""
+    runs = [_load(path) for path in paths]
+    try:
+        yield _keys.merge(runs, key, reverse)
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _external_sort(
+    iterable: Iterable[T],
+    key: Optional[Callable[[T], Any]],
+    reverse: bool,
+    chunk_size: int,
+    tmpdir: Optional[str],
+    fan_in: int,
+) -> Generator[T, None, None]:
+    iterator = iter(iterable)
+    chunk = _merge_sort.merge_sort(
+        list(itertools.islice(iterator, chunk_size)), key, reverse
+    )
+    if len(chunk) < chunk_size:
+        # NOTE: everything fit in a single chunk, no need to spill
+        yield from chunk
+        return
+
+    with tempfile.TemporaryDirectory(prefix="pyalgo-", dir=tmpdir) as directory:
+        names = (os.path.join(directory, str(i)) for i in itertools.count())
+        paths: List[str] = []
+        while chunk:
+            full = len(chunk) == chunk_size
+            paths.append(_spill(chunk, next(names)))
+            del chunk
+            if not full:
+                break
+            chunk = _merge_sort.merge_sort(
+                list(itertools.islice(iterator, chunk_size)), key, reverse
+            )
+        while len(paths) > fan_in:
+            # NOTE: intermediate pass merging consecutive runs, keeping merge stable
+            merged: List[str] = []
+            for i in range(0, len(paths), fan_in):
+                group = paths[i : i + fan_in]
+                if len(group) == 1:
+                    merged.extend(group)
+                    continue
+                with _merged(group, key, reverse) as items:
+                    merged.append(_spill(items, next(names)))
+                for path in group:
+                    os.remove(path)
+            paths = merged
+        with _merged(paths, key, reverse) as items:
+            yield from items
+
+
+def external_sort(
+    iterable: Iterable[T],
+    key: Optional[Callable[[T], Any]] = None,
+    reverse: bool = False,
+    chunk_size: int = 100_000,
+    tmpdir: Optional[str] = None,
+    fan_in: int = 64,
+) -> Generator[T, None, None]:
+    """
+    https://en.wikipedia.org/wiki/External_sorting
+    Stable sort of `iterable` larger than memory: chunks of `chunk_size` items are
+    sorted by `merge_sort` and spilled to temporary files (pickled by batches),
+    which are then streamed through stable k-way heap merges of up to `fan_in`
+    files, in as many passes as needed
+    NOTE: memory holds one chunk while spilling, then one batch per merged file
+    while merging, `key` is called once per item for sorting and once again per
+    merge pass
+    Input:
+        iterable    : Items to sort, consumed lazily (must be picklable)
+        key         : See `merge_sort`
+        reverse     : See `merge_sort`
+        chunk_size  : Number of items sorted in memory at once
+        tmpdir      : Directory of temporary files (None for system default),
+                      files are deleted once sorted items are exhausted or
+                      generator is closed
+        fan_in      : Maximum number of files merged (i.e. open) at once
+    Output:
+        Generator of sorted items
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got: {chunk_size}")
+    if fan_in < 2:
+        raise ValueError(f"fan_in must be at least 2, got: {fan_in}")
+    return _external_sort(iterable, key, reverse, chunk_size, tmpdir, fan_in)
@@ -0,0 +1,101 @@
+import functools
+import heapq
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+PLAIN_TYPES = (int, float, str)
+Key = Callable[[Any], Any]
+
+# NOTE: adapts old-style `cmp(a, b)` functions (negative, zero or positive)
+# to `key` functions, see `functools.cmp_to_key`
+cmp_to_key = functools.cmp_to_key
+
+
+def is_plain(values: Sequence[Any]) -> bool:
+    """
+    Return if `values` all share one of `PLAIN_TYPES`, being compared natively
+    and equal ones being interchangeable (so that stability is moot)
+    """
+    if not values:
+        return True
+    kind = type(values[0])
+    return kind in PLAIN_TYPES and all(type(value) is kind for value in values)
+
+
+class _Decorated:
+    """
+    (key, rank) pair comparing by key then rank, using `<` only: unlike tuples,
+    which compare keys with `==` first, ranks break ties between keys neither
+    lesser nor greater than one another, whatever their `==`
+    """
+
+    __slots__ = ("key", "rank")
+
+    def __init__(self, key: Any, rank: int) -> None:
+        self.key = key
+        self.rank = rank
+
+    def __lt__(self, other: "_Decorated") -> bool:
+        if self.key < other.key:
+            return True
+        return self.rank < other.rank and not other.key < self.key
+
+
+def sort_by(
+    sort: Callable[[List[Any]], List[Any]],
+    items: List[Any],
+    key: Optional[Key],
+    reverse: bool,
+) -> List[Any]:
+    """
+    https://en.wikipedia.org/wiki/Schwartzian_transform
+    Sort `items` by `key` with `sort`, calling `key` once per item: (key, rank)
+    pairs are sorted, then mapped back to items, ranks breaking ties so that items
+    are never compared and the outcome is stable (`reverse` included)
+    NOTE: plain `items` sort as is (reversed after) when no `key` is given, plain
+    keys are paired in tuples (compared natively), others in `_Decorated`s
+    Input:
+        sort    : Sort function, returning sorted list (in place or not)
+        items   : Items to sort
+        key     : Function of one item returning its sort key (None for item)
+        reverse : Whether to sort in descending order
+    Output:
+        New sorted list, or `sort` output for plain `items`
+    """
+    if key is None and (not reverse or is_plain(items)):
+        result = sort(items)
+        if reverse:
+            result.reverse()
+        return result
+
+    keys = items if key is None else [key(item) for item in items]
+    size = len(items)
+    # NOTE: reversed ranks keep equal keys in original order once reversed
+    ranks = range(size - 1, -1, -1) if reverse else range(size)
+    if is_plain(keys):
+        ranked = [rank for _, rank in sort(list(zip(keys, ranks)))]
+    else:
+        pairs = [_Decorated(k, rank) for k, rank in zip(keys, ranks)]
+        ranked = [pair.rank for pair in sort(pairs)]
+    if reverse:
+        return [items[size - 1 - rank] for rank in reversed(ranked)]
+    return [items[rank] for rank in ranked]
+
+
+def _rank(
+    run: Iterable[Any], key: Optional[Key], rank: int
+) -> Iterator[Tuple[_Decorated, Any]]:
+    for item in run:
+        yield _Decorated(item if key is None else key(item), rank), item
+
+
+def merge(
+    runs: Sequence[Iterable[Any]], key: Optional[Key], reverse: bool
+) -> Iterator[Any]:
+    """
+    Stable k-way heap merge of sorted `runs`, ties going to earlier runs
+    NOTE: unlike `heapq.merge` on its own, which compares items (or keys) with `==`
+    first, keys are compared with `<` only (see `_Decorated`)
+    """
+    ranked = [_rank(run, key, -i if reverse else i) for i, run in enumerate(runs)]
+    for _, item in heapq.merge(*ranked, reverse=reverse):
+        yield item
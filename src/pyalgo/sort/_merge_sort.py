@@ -1,27 +1,166 @@
-from typing import List
-from pyalgo.sort import comparable
+import bisect
+from typing import Any, Callable, List, Optional, TypeVar
+from pyalgo.sort import _keys, comparable
 
+T = TypeVar("T")
 
-def merge_sort(items: List[comparable.Comparable]) -> List[comparable.Comparable]:
-    if len(items) <= 1:
+# NOTE: consecutive wins of one run before merging switches to galloping
+MIN_GALLOP = 7
+
+
+def _min_run(n: int) -> int:
+    """
+    Return minimum run length, in [32, 64] for large `n`, such that `n` / min run
+    is close to, and at most, a power of 2 (balancing bottom-up merges)
+    """
+    remainder = 0
+    while n >= 64:
+        remainder |= n & 1
+        n >>= 1
+    return n + remainder
+
+
+def _count_run(items: List[comparable.Comparable], lo: int, hi: int) -> int:
+    """
+    Return length of the natural run starting at `lo`, either non-descending or
+    strictly descending (reversed in place, strictness keeping sort stable)
+    """
+    i = lo + 1
+    if i == hi:
+        return 1
+    if items[i] < items[lo]:
+        while i + 1 < hi and items[i + 1] < items[i]:
+            i += 1
+        items[lo : i + 1] = items[lo : i + 1][::-1]
+    else:
+        while i + 1 < hi and not items[i + 1] < items[i]:
+            i += 1
+    return i + 1 - lo
+
+
+def _insertion_sort(
+    items: List[comparable.Comparable], lo: int, start: int, hi: int
+) -> None:
+    """Binary insertion sort of `items[lo:hi]`, `items[lo:start]` being sorted"""
+    for i in range(start, hi):
+        item = items[i]
+        position = bisect.bisect_right(items, item, lo, i)
+        items[position + 1 : i + 1] = items[position:i]
+        items[position] = item
+
+
+def _gallop(
+    key: comparable.Comparable,
+    items: List[comparable.Comparable],
+    lo: int,
+    hi: int,
+    right: bool,
+) -> int:
+    """
+    Return first index of sorted `items[lo:hi]` after `key` (before it if not
+    `right`), probing `lo`, `lo + 1`, `lo + 3`, `lo + 7`, ... then bisecting,
+    in time logarithmic in the distance from `lo`
+    """
+    search = bisect.bisect_right if right else bisect.bisect_left
+    step, probe = 1, lo
+    while probe < hi and search(items, key, probe, probe + 1) > probe:
+        lo = probe + 1
+        probe += step
+        step *= 2
+    return search(items, key, lo, min(probe, hi))
+
+
+def _merge(
+    items: List[comparable.Comparable],
+    buffer: List[comparable.Comparable],
+    lo: int,
+    mid: int,
+    hi: int,
+) -> None:
+    """
+    Stable merge of adjacent sorted runs `items[lo:mid]` and `items[mid:hi]`,
+    copying the left run into `buffer` and merging back into `items` by index
+    NOTE: left run items up to first right run item, and right run items from
+    last left run item, are already in place and left untouched
+    """
+    lo = _gallop(items[mid], items, lo, mid, right=True)
+    hi = _gallop(items[mid - 1], items, mid, hi, right=False)
+    if lo == mid or mid == hi:
+        return
+
+    length = mid - lo
+    buffer[:length] = items[lo:mid]
+    i, j, k = 0, mid, lo
+    wins = 0  # NOTE: positive for left run wins, negative for right run wins
+    while i < length and j < hi:
+        if wins >= MIN_GALLOP:
+            # NOTE: move all left run items not after right run next item at once
+            end = _gallop(items[j], buffer, i, length, right=True)
+            items[k : k + end - i] = buffer[i:end]
+            k += end - i
+            i, wins = end, 0
+        elif wins <= -MIN_GALLOP:
+            end = _gallop(buffer[i], items, j, hi, right=False)
+            items[k : k + end - j] = items[j:end]
+            k += end - j
+            j, wins = end, 0
+        elif items[j] < buffer[i]:
+            items[k] = items[j]
+            j, k = j + 1, k + 1
+            wins = min(wins, 0) - 1
+        else:
+            items[k] = buffer[i]
+            i, k = i + 1, k + 1
+            wins = max(wins, 0) + 1
+    # NOTE: remaining right run items are already in place
+    items[k : k + length - i] = buffer[i:length]
+
+
+def _merge_sort(items: List[Any]) -> List[Any]:
+    """Return new list of `items` sorted by `merge_sort`, comparing them directly"""
+    items = list(items)
+    n = len(items)
+    if n <= 1:
         return items
 
-    midpoint = len(items) // 2
-    unsorted_left = items[:midpoint]
-    unsorted_right = items[midpoint:]
-    sorted_left = merge_sort(unsorted_left)
-    sorted_right = merge_sort(unsorted_right)
-
-    def _recursive_sort(
-        l_sorted: List[comparable.Comparable],
-        r_sorted: List[comparable.Comparable],
-    ) -> List[comparable.Comparable]:
-        if len(l_sorted) == 0 or len(r_sorted) == 0:
-            return list(l_sorted) if len(l_sorted) > 0 else list(r_sorted)
-        left, right = l_sorted[0], r_sorted[0]
-        if left < right:
-            return [left] + _recursive_sort(l_sorted[1:], r_sorted)
-        return [right] + _recursive_sort(l_sorted, r_sorted[1:])
-
-    result = _recursive_sort(sorted_left, sorted_right)
-    return result
+    min_run = _min_run(n)
+    bounds = [0]
+    while bounds[-1] < n:
+        lo = bounds[-1]
+        length = _count_run(items, lo, n)
+        if length < min_run:
+            hi = min(lo + min_run, n)
+            _insertion_sort(items, lo, lo + length, hi)
+            length = hi - lo
+        bounds.append(lo + length)
+
+    buffer = items[:]
+    while len(bounds) > 2:
+        merged = bounds[::2]
+        for lo, mid, hi in zip(bounds[::2], bounds[1::2], bounds[2::2]):
+            _merge(items, buffer, lo, mid, hi)
+        if merged[-1] != n:
+            merged.append(n)
+        bounds = merged
+    return items
+
+
+def merge_sort(
+    items: List[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False
+) -> List[T]:
+    """
+    https://en.wikipedia.org/wiki/Timsort
+    Stable bottom-up merge sort of natural runs, short runs being extended by
+    insertion sort, with a single auxiliary buffer and galloping merges
+    (already sorted, or reversed, `items` sort in linear time)
+    Input:
+        items   : Items to sort, left unchanged
+        key     : Function of one item returning its sort key, called once per
+                  item (see `cmp_to_key` to sort by comparison function)
+        reverse : Whether to sort in descending order (stable nonetheless)
+    Output:
+        New sorted list
+    """
+    if key is None and not reverse:
+        return _merge_sort(items)
+    return _keys.sort_by(_merge_sort, items, key, reverse)
@@ -0,0 +1,129 @@
+import array
+import concurrent.futures
+import heapq
+import mmap
+import os
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from typing_extensions import Literal
+from pyalgo.sort import _keys, _merge_sort
+
+T = TypeVar("T")
+Typecode = Literal["q", "d"]
+
+# NOTE: array typecodes of numbers sorted in shared memory, by type
+TYPECODES: Dict[type, Typecode] = {int: "q", float: "d"}
+INT_BOUNDS = (-(2**63), 2**63 - 1)
+
+
+def _typecode(items: List[Any]) -> Optional[Typecode]:
+    """Return array typecode able to hold plain numbers `items`, if any"""
+    if not items or not _keys.is_plain(items):
+        return None
+    typecode = TYPECODES.get(type(items[0]))
+    if typecode == "q":
+        lowest, highest = INT_BOUNDS
+        if not lowest <= min(items) <= max(items) <= highest:
+            return None
+    return typecode
+
+
+def _bounds(size: int, workers: int) -> List[Tuple[int, int]]:
+    """Split range of `size` into `workers` contiguous partitions of similar sizes"""
+    cuts = [size * i // workers for i in range(workers + 1)]
+    return [(lo, hi) for lo, hi in zip(cuts, cuts[1:]) if lo < hi]
+
+
+def _sort_shared(path: str, typecode: Typecode, lo: int, hi: int) -> None:
+    """Sort numbers at positions [lo, hi) of array file at `path`, in place"""
+    itemsize = array.array(typecode).itemsize
+    with open(path, "r+b") as f:
+        with mmap.mmap(f.fileno(), 0) as shared:
+            view = memoryview(shared)[lo * itemsize : hi * itemsize].cast(typecode)
+            view[:] = array.array(typecode, _merge_sort._merge_sort(view.tolist()))
+            view.release()
+
+
+def _sort_numbers(
+    items: List[Any], typecode: Typecode, workers: int
+) -> List[Iterable[Any]]:
+    """
+    Sort partitions of plain numbers `items` across processes, as an array
+    memory-mapped from file so that numbers are not pickled back and forth
+    (NOTE: partitions are views of the sorted array, not copied into lists)
+    """
+    fd, path = tempfile.mkstemp(prefix="pyalgo-", suffix=".sort")
+    try:
+        values = array.array(typecode, items)
+        with os.fdopen(fd, "wb") as f:
+            values.tofile(f)
+        bounds = _bounds(len(items), workers)
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(_sort_shared, path, typecode, lo, hi)
+                for lo, hi in bounds
+            ]
+            for future in futures:
+                future.result()
+        with open(path, "rb") as f:
+            values = array.array(typecode)
+            values.fromfile(f, len(items))
+        view = memoryview(values)
+        return [view[lo:hi] for lo, hi in bounds]
+    finally:
+        os.remove(path)
+
+
+def _sort_objects(items: List[Any], workers: int) -> List[List[Any]]:
+    """Sort partitions of `items` across processes, pickling them"""
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        partitions = [items[lo:hi] for lo, hi in _bounds(len(items), workers)]
+        return list(executor.map(_merge_sort._merge_sort, partitions))
+
+
+def _parallel_sort(items: List[Any], workers: int) -> List[Any]:
+    """
+    Return new list of `items` sorted by `merge_sort` over contiguous partitions
+    in parallel, then by a k-way heap merge (stable, partitions being in order)
+    """
+    typecode = _typecode(items)
+    if typecode is not None:
+        # NOTE: equal plain numbers are interchangeable, no need for stable merge
+        return list(heapq.merge(*_sort_numbers(items, typecode, workers)))
+    return list(_keys.merge(_sort_objects(items, workers), None, False))
+
+
+def parallel_sort(
+    items: List[T],
+    key: Optional[Callable[[T], Any]] = None,
+    reverse: bool = False,
+    workers: Optional[int] = None,
+    threshold: int = 100_000,
+) -> List[T]:
+    """
+    Stable sort of `items` across processes: partitions are sorted by `merge_sort`
+    in a process pool, then merged by a k-way heap merge
+    NOTE: plain ints (within 64 bits) and floats are shared with workers through
+    a memory-mapped array file, other items (or (key, rank) pairs, keys being
+    computed once in this process, see `merge_sort`) are pickled
+    Input:
+        items       : Items to sort, left unchanged (must be picklable)
+        key         : See `merge_sort`
+        reverse     : See `merge_sort`
+        workers     : Number of worker processes (defaults to number of CPUs)
+        threshold   : Number of items below which `items` are sorted serially
+    Output:
+        New sorted list
+    """
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, got: {workers}")
+    if workers == 1 or len(items) < max(threshold, 2):
+        return _merge_sort.merge_sort(items, key, reverse)
+
+    def _sort(values: List[Any]) -> List[Any]:
+        return _parallel_sort(values, workers)
+
+    if key is None and not reverse:
+        return _sort(items)
+    return _keys.sort_by(_sort, items, key, reverse)
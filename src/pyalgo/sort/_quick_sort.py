@@ -1,17 +1,149 @@
-from typing import List
-from pyalgo.sort import comparable
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+from pyalgo.sort import _keys, comparable
 
+T = TypeVar("T")
 
-def quick_sort(items: List[comparable.Comparable]) -> List[comparable.Comparable]:
-    if len(items) <= 1:
-        return items
-    pivot = items[-1]
-    left, right = [], []
-    for item in items[:-1]:
+# NOTE: ranges up to `INSERTION_CUTOFF` items are insertion sorted, ranges over
+# `NINTHER_CUTOFF` items pick their pivot as a median of three medians of three
+INSERTION_CUTOFF = 16
+NINTHER_CUTOFF = 40
+
+
+def _insertion_sort(items: List[comparable.Comparable], lo: int, hi: int) -> None:
+    """Insertion sort of `items[lo:hi]`, in place"""
+    for i in range(lo + 1, hi):
+        item = items[i]
+        j = i
+        while j > lo and item < items[j - 1]:
+            items[j] = items[j - 1]
+            j -= 1
+        items[j] = item
+
+
+def _sift_down(
+    items: List[comparable.Comparable], lo: int, root: int, size: int
+) -> None:
+    """Sift heap node `root` down the max-heap of `size` items at `items[lo:]`"""
+    item = items[lo + root]
+    child = 2 * root + 1
+    while child < size:
+        if child + 1 < size and items[lo + child] < items[lo + child + 1]:
+            child += 1
+        if not item < items[lo + child]:
+            break
+        items[lo + root] = items[lo + child]
+        root, child = child, 2 * child + 1
+    items[lo + root] = item
+
+
+def _heap_sort(items: List[comparable.Comparable], lo: int, hi: int) -> None:
+    """
+    https://en.wikipedia.org/wiki/Heapsort
+    Heap sort of `items[lo:hi]`, in place and in O(n log n) whatever the input
+    """
+    size = hi - lo
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(items, lo, root, size)
+    for last in range(size - 1, 0, -1):
+        items[lo], items[lo + last] = items[lo + last], items[lo]
+        _sift_down(items, lo, 0, last)
+
+
+def _median(items: List[comparable.Comparable], a: int, b: int, c: int) -> int:
+    """Return index of median of `items` at indices `a`, `b` and `c`"""
+    if items[a] < items[b]:
+        if items[b] < items[c]:
+            return b
+        return c if items[a] < items[c] else a
+    if items[a] < items[c]:
+        return a
+    return c if items[b] < items[c] else b
+
+
+def _pivot(items: List[comparable.Comparable], lo: int, hi: int) -> int:
+    """
+    Return index of pivot of `items[lo:hi]`: median of first, middle and last
+    items, or Tukey's ninther (median of three such medians) over large ranges
+    """
+    last, mid = hi - 1, lo + (hi - lo) // 2
+    if hi - lo <= NINTHER_CUTOFF:
+        return _median(items, lo, mid, last)
+    step = (hi - lo) // 8
+    return _median(
+        items,
+        _median(items, lo, lo + step, lo + 2 * step),
+        _median(items, mid - step, mid, mid + step),
+        _median(items, last - 2 * step, last - step, last),
+    )
+
+
+def _partition(items: List[comparable.Comparable], lo: int, hi: int) -> Tuple[int, int]:
+    """
+    https://en.wikipedia.org/wiki/Dutch_national_flag_problem
+    Three-way partition of `items[lo:hi]` around pivot, in place, returning
+    bounds [lt, gt) of items equal to pivot (lesser ones before, greater ones after)
+    """
+    pivot = items[_pivot(items, lo, hi)]
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        item = items[i]
         if item < pivot:
-            left.append(item)
+            items[lt], items[i] = item, items[lt]
+            lt, i = lt + 1, i + 1
+        elif pivot < item:
+            gt -= 1
+            items[gt], items[i] = item, items[gt]
         else:
-            right.append(item)
+            i += 1
+    return lt, gt
+
+
+def _intro_sort(
+    items: List[comparable.Comparable], lo: int, hi: int, depth: int
+) -> None:
+    """
+    Quick sort of `items[lo:hi]` recursing into the smaller side only (for
+    logarithmic stack depth), falling back to heap sort once `depth` runs out
+    """
+    while hi - lo > INSERTION_CUTOFF:
+        if depth == 0:
+            _heap_sort(items, lo, hi)
+            return
+        depth -= 1
+        lt, gt = _partition(items, lo, hi)
+        if lt - lo < hi - gt:
+            _intro_sort(items, lo, lt, depth)
+            lo = gt
+        else:
+            _intro_sort(items, gt, hi, depth)
+            hi = lt
+    _insertion_sort(items, lo, hi)
+
+
+def _quick_sort(items: List[Any]) -> List[Any]:
+    """Sort `items` in place by `quick_sort`, comparing them directly"""
+    _intro_sort(items, 0, len(items), 2 * len(items).bit_length())
+    return items
+
 
-    # can't do [*quick_sort(left), ...] because mypy has trouble recognising internal types
-    return [i for i in quick_sort(left)] + [pivot] + [i for i in quick_sort(right)]
+def quick_sort(
+    items: List[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False
+) -> List[T]:
+    """
+    https://en.wikipedia.org/wiki/Introsort
+    In place, unstable quick sort: median-of-three (or ninther) pivots, three-way
+    partitions (so duplicate-heavy `items` sort fast), insertion sort of short
+    ranges and heap sort fallback past 2 * log2(n) levels (so O(n log n) at worst)
+    NOTE: sorting by `key` or in `reverse` is stable, ties being broken by rank
+    Input:
+        items   : Items to sort, sorted in place
+        key     : Function of one item returning its sort key, called once per
+                  item (see `cmp_to_key` to sort by comparison function)
+        reverse : Whether to sort in descending order
+    Output:
+        `items`, sorted
+    """
+    if key is None and not reverse:
+        return _quick_sort(items)
+    items[:] = _keys.sort_by(_quick_sort, items, key, reverse)
+    return items
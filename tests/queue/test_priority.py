@@ -64,3 +64,55 @@ class TestPriorityQueue:
 
         observed_reversed = [reverse_queue.get() for _ in range(len(provided))]
         assert expected[::-1] == observed_reversed
+
+    def test_ties_fifo(self, queue, reverse_queue):
+        provided = [SampleData("1", 3), SampleData("2", 3), SampleData("3", 5)]
+        [queue.add(i) for i in provided]
+        [reverse_queue.add(i) for i in provided]
+
+        assert [queue.get().uid for _ in range(3)] == ["3", "1", "2"]
+        assert [reverse_queue.get().uid for _ in range(3)] == ["1", "2", "3"]
+
+    def test_init_elements(self):
+        provided = [SampleData("1", 4), SampleData("2", 7), SampleData("3", 1)]
+        observed = queue.PriorityQueue["SampleData"](provided)
+        assert [observed.get().uid for _ in range(3)] == ["2", "1", "3"]
+
+    def test_remove(self, reverse_queue):
+        provided = [SampleData(str(i), (i * 7) % 10) for i in range(10)]
+        [reverse_queue.add(i) for i in provided]
+
+        reverse_queue.remove("3")
+        reverse_queue.remove("0")
+        assert len(reverse_queue) == 8
+        observed = [reverse_queue.get().value for _ in range(8)]
+        assert observed == [2, 3, 4, 5, 6, 7, 8, 9]
+        with pytest.raises(KeyError):
+            reverse_queue.remove("3")
+
+    def test_decrease_key(self, queue, reverse_queue):
+        provided = [SampleData("1", 4), SampleData("2", 7), SampleData("3", 1)]
+        [queue.add(i) for i in provided]
+        [reverse_queue.add(i) for i in provided]
+
+        queue.decrease_key("3", 10)
+        reverse_queue.decrease_key("2", 0)
+        assert [queue.get().uid for _ in range(3)] == ["3", "2", "1"]
+        assert [reverse_queue.get().uid for _ in range(3)] == ["2", "3", "1"]
+
+    def test_decrease_key_error(self, reverse_queue):
+        reverse_queue.add(SampleData("1", 4))
+        with pytest.raises(ValueError):
+            reverse_queue.decrease_key("1", 5)
+        with pytest.raises(KeyError):
+            reverse_queue.decrease_key("2", 0)
+
+    def test_peek(self, reverse_queue):
+        provided = [SampleData(str(i), (i * 7) % 10) for i in range(10)]
+        [reverse_queue.add(i) for i in provided]
+
+        assert [e.value for e in reverse_queue.peek(4)] == [0, 1, 2, 3]
+        assert len(reverse_queue) == 10
+        assert len(reverse_queue.peek(20)) == 10
+        assert [reverse_queue.get().value for _ in range(10)] == list(range(10))
+        assert reverse_queue.peek() == []
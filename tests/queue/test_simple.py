@@ -41,3 +41,33 @@ class TestFIFOQueue:
             queue.get()
         with pytest.raises(KeyError):
             queue.remove("99")
+
+    def test_duplicate_uid(self, queue: queue_.FIFOQueue[MockElement]):
+        elements = [MockElement("1", "a"), MockElement("2", "b"), MockElement("1", "c")]
+        queue.extend(elements)
+
+        queue.remove("1")
+        assert len(queue) == 2
+        assert queue.drain() == [MockElement("2", "b"), MockElement("1", "c")]
+        with pytest.raises(KeyError):
+            queue.remove("1")
+
+    def test_extend_drain(self, queue: queue_.FIFOQueue[MockElement]):
+        elements = [MockElement(str(i), str(i)) for i in range(10)]
+        queue.extend(elements)
+        for i in range(0, 10, 2):
+            queue.remove(str(i))
+
+        assert queue.drain(2) == [elements[1], elements[3]]
+        assert len(queue) == 3
+        assert queue.drain(10) == [elements[5], elements[7], elements[9]]
+        assert queue.drain() == []
+
+    def test_peek(self, queue: queue_.FIFOQueue[MockElement]):
+        elements = [MockElement(str(i), str(i)) for i in range(5)]
+        queue.extend(elements)
+        queue.remove("0")
+
+        assert queue.peek() == [elements[1]]
+        assert queue.peek(3) == elements[1:4]
+        assert len(queue) == 4
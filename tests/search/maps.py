@@ -0,0 +1,51 @@
+import dataclasses
+import random
+from typing import Dict, List
+from pyalgo import models
+
+
+@dataclasses.dataclass(frozen=True)
+class Element:
+    uid: str
+    weight: int = 1
+
+
+class SimpleMap(models.ElementMap["Element"]):
+    """Map following adjacency lists of `graph`, counting `get_next` calls"""
+
+    def __init__(
+        self, start: "Element", end: "Element", graph: Dict[str, List["Element"]]
+    ):
+        self._start = start
+        self._end = end
+        self._graph = graph
+        self.calls = 0
+
+    @property
+    def start(self) -> "Element":
+        return self._start
+
+    @property
+    def end(self) -> "Element":
+        return self._end
+
+    def get_next(self, uid: str) -> List["Element"]:
+        self.calls += 1
+        return self._graph.get(uid, [])
+
+
+def random_graph(seed: int, size: int, degree: int = 3) -> Dict[str, List[Element]]:
+    """Return `degree` random links (weighing 0 to 9) from each of `size` uids"""
+    rng = random.Random(seed)
+    return {
+        str(i): [
+            Element(str(rng.randrange(size)), rng.randint(0, 9)) for _ in range(degree)
+        ]
+        for i in range(size)
+    }
+
+
+def random_map(seed: int, size: int = 40, degree: int = 3) -> SimpleMap:
+    """Return map of `random_graph` from "0" to "<size - 1>" """
+    graph = random_graph(seed, size, degree)
+    return SimpleMap(Element("0", 0), Element(str(size - 1), 0), graph)
@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+from typing import List
+from pyalgo import models, search
+from pyalgo.search import async_search
+from tests.search.maps import Element, SimpleMap, random_map
+
+
+class AsyncMap(models.AsyncElementMap["Element"]):
+    def __init__(self, map: SimpleMap, delay: float = 0.001):
+        self._map = map
+        self._delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    @property
+    def start(self) -> "Element":
+        return self._map.start
+
+    @property
+    def end(self) -> "Element":
+        return self._map.end
+
+    async def get_next(self, uid: str) -> List["Element"]:
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            self.active -= 1
+        return self._map.get_next(uid)
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("tree_search", [True, False])
+@pytest.mark.parametrize(
+    "sync_search, async_search",
+    [
+        (search.breadth_first_search, search.async_breadth_first_search),
+        (search.depth_first_search, search.async_depth_first_search),
+    ],
+)
+def test_async_queue_search(seed, tree_search, sync_search, async_search):
+    map = random_map(seed, size=8 if tree_search else 30)
+    expected = sync_search(map, tree_search)
+    observed = asyncio.run(async_search(AsyncMap(map), tree_search))
+    assert observed == expected
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_async_dijakstra_search(seed):
+    map = random_map(seed)
+    expected = search.dijakstra_search(map)
+    observed = asyncio.run(search.async_dijakstra_search(AsyncMap(map)))
+    assert observed == expected
+
+
+def test_async_a_star_search():
+    map = random_map(0)
+    heuristic = lambda e: 0 if e.uid == map.end.uid else 1  # noqa: E731
+    expected = search.a_star_search(map, heuristic)
+    observed = asyncio.run(search.async_a_star_search(AsyncMap(map), heuristic))
+    assert observed == expected
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_bounded_concurrency(concurrency):
+    map = random_map(1, size=60, degree=4)
+    async_map = AsyncMap(map)
+    observed = asyncio.run(
+        search.async_breadth_first_search(
+            async_map, prefetch=16, concurrency=concurrency
+        )
+    )
+
+    assert observed == search.breadth_first_search(map)
+    assert async_map.peak == concurrency
+    assert async_map.active == 0
+
+
+def test_async_stats():
+    map = random_map(2)
+    expected = search.dijakstra_search(map, recording="counts")
+    observed = asyncio.run(search.async_dijakstra_search(AsyncMap(map)))
+    assert observed.stats == expected.stats
+
+
+def test_sync_lookup():
+    view = async_search._AsyncMapView(AsyncMap(random_map(0)))
+    with pytest.raises(RuntimeError, match="synchronously"):
+        view.get_next("0")
+
+
+@pytest.mark.parametrize(
+    "sync_search, async_search",
+    [
+        (search.breadth_first_search, search.async_breadth_first_search),
+        (search.dijakstra_search, search.async_dijakstra_search),
+    ],
+)
+def test_async_budget(sync_search, async_search):
+    map = random_map(3, size=60)
+    expected = sync_search(map, max_expansions=6)
+    observed = asyncio.run(async_search(AsyncMap(map), max_expansions=6))
+
+    assert observed == expected and observed.partial
+    assert observed.stats is not None and observed.stats.expanded == 6
@@ -0,0 +1,111 @@
+import pytest
+from typing import Dict, List, Type, TypeVar
+from pyalgo import search
+from pyalgo.search import bidirectional
+from tests.search.maps import Element, SimpleMap, random_graph
+
+
+class ReversibleMap(SimpleMap):
+    def __init__(
+        self, start: "Element", end: "Element", graph: Dict[str, List["Element"]]
+    ):
+        super().__init__(start, end, graph)
+        self._reverse: Dict[str, List[Element]] = {}
+        for uid, elements in graph.items():
+            for e in elements:
+                self._reverse.setdefault(e.uid, []).append(Element(uid, e.weight))
+
+    def get_previous(self, uid: str) -> List["Element"]:
+        return self._reverse.get(uid, [])
+
+
+M = TypeVar("M", bound=SimpleMap)
+
+
+def _random_map(cls: Type[M], seed: int) -> M:
+    return cls(Element("0", 0), Element("59", 0), random_graph(seed, 60))
+
+
+def _cost(solution: List[Element]) -> int:
+    return sum(e.weight for e in solution)
+
+
+@pytest.mark.parametrize("cls", [SimpleMap, ReversibleMap])
+@pytest.mark.parametrize("seed", range(20))
+def test_bidirectional_dijakstra(cls, seed):
+    map = _random_map(cls, seed)
+    expected = list(search.dijakstra_search(map).solution)
+    observed = list(search.bidirectional_dijakstra_search(map).solution)
+
+    assert bool(observed) == bool(expected)
+    assert _cost(observed) == _cost(expected)
+    if observed:
+        assert observed[0] == map.start
+        assert observed[-1].uid == map.end.uid
+        for a, b in zip(observed, observed[1:]):
+            assert b in map.get_next(a.uid)
+
+
+@pytest.mark.parametrize("cls", [SimpleMap, ReversibleMap])
+@pytest.mark.parametrize("seed", range(20))
+def test_bidirectional_bfs(cls, seed):
+    map = _random_map(cls, seed)
+    expected = search.breadth_first_search(map)
+    observed = search.bidirectional_breadth_first_search(map)
+
+    assert len(list(observed.solution)) == len(list(expected.solution))
+
+
+def test_start_eq_end():
+    map = SimpleMap(Element("end"), Element("end"), {})
+    observed = search.bidirectional_breadth_first_search(map)
+    assert observed.solution == [Element("end")]
+
+
+def test_reverse_index_shared():
+    map = _random_map(SimpleMap, 0)
+    search.bidirectional_dijakstra_search(map)
+    calls = map.calls
+    search.bidirectional_dijakstra_search(map)
+    search.bidirectional_breadth_first_search(map)
+    assert calls > 0
+    # NOTE: later queries only call `get_next` to rebuild their solution paths
+    assert map.calls - calls < calls
+
+
+def test_reversible_not_probed():
+    class RecordingMap(ReversibleMap):
+        def __init__(
+            self, start: "Element", end: "Element", graph: Dict[str, List["Element"]]
+        ):
+            super().__init__(start, end, graph)
+            self.previous: List[str] = []
+
+        def get_previous(self, uid: str) -> List["Element"]:
+            self.previous.append(uid)
+            return super().get_previous(uid)
+
+    graph = {"a": [Element("b"), Element("c")]}
+    map = RecordingMap(Element("a"), Element("c"), graph)
+    assert search.bidirectional_breadth_first_search(map).solution == [
+        Element("a"),
+        Element("c"),
+    ]
+    assert map.previous.count("c") == 1
+
+
+def test_inconsistent_map():
+    graph = {"a": [Element("b"), Element("d"), Element("e")]}
+    map = ReversibleMap(Element("a"), Element("c"), graph)
+    map._reverse["c"] = [Element("b")]
+    with pytest.raises(bidirectional.InconsistentMapError):
+        search.bidirectional_breadth_first_search(map)
+
+
+@pytest.mark.parametrize("cls", [SimpleMap, ReversibleMap])
+@pytest.mark.parametrize("seed", range(5))
+def test_searches_unwrapped(cls, seed):
+    map = _random_map(cls, seed)
+    observed = search.bidirectional_dijakstra_search(map)
+    elements = {e for s in observed.searches.values() for e in s}
+    assert elements and all(isinstance(e, Element) for e in elements)
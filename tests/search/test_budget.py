@@ -0,0 +1,157 @@
+import time
+import pytest
+from typing import Dict, List
+from pyalgo import search
+from pyalgo.search import budget
+from tests.search.maps import Element, SimpleMap
+
+
+def _grid_map(size: int) -> SimpleMap:
+    """Directed grid from top-left to bottom-right, rightwards moves costing more"""
+    graph: Dict[str, List[Element]] = {}
+    for i in range(size):
+        for j in range(size):
+            moves = [Element(f"{i + 1},{j}", 1)] if i + 1 < size else []
+            moves += [Element(f"{i},{j + 1}", 2)] if j + 1 < size else []
+            graph[f"{i},{j}"] = moves
+    return SimpleMap(Element("0,0", 0), Element(f"{size - 1},{size - 1}", 0), graph)
+
+
+SEARCHES = [
+    search.breadth_first_search,
+    search.depth_first_search,
+    search.dijakstra_search,
+    lambda map, **kwargs: search.a_star_search(map, lambda e: 0, **kwargs),
+]
+
+DEEPENING = [
+    search.iterative_deepening_search,
+    lambda map, **kwargs: search.depth_limited_search(map, 20, **kwargs),
+    lambda map, **kwargs: search.ida_star_search(map, lambda e: 0, **kwargs),
+]
+
+BIDIRECTIONAL = [
+    search.bidirectional_breadth_first_search,
+    search.bidirectional_dijakstra_search,
+]
+
+
+@pytest.mark.parametrize("search_", SEARCHES + DEEPENING + BIDIRECTIONAL)
+def test_unbounded(search_):
+    map = _grid_map(5)
+    expected = search_(map)
+    observed = search_(map, max_expansions=10**6, max_frontier=10**6)
+
+    assert observed == expected
+    assert not observed.partial and observed.solution[-1].uid == map.end.uid
+
+
+@pytest.mark.parametrize("search_", SEARCHES)
+def test_max_expansions(search_):
+    map = _grid_map(10)
+    observed = search_(map, max_expansions=5, recording="counts")
+
+    assert observed.partial
+    assert observed.stats.expanded == 5 and map.calls == 5
+    assert observed.solution[0] == map.start
+    assert observed.solution[-1].uid != map.end.uid
+
+
+def test_best_so_far():
+    map = _grid_map(10)
+    observed = search.dijakstra_search(map, max_expansions=4)
+
+    # NOTE: settled "0,0", "1,0", "0,1" then "2,0" (both at 2), leaving
+    # "1,1" via "1,0" (at 3) as the cheapest frontier entry, ahead of "3,0" (at 3)
+    assert [e.uid for e in observed.solution] == ["0,0", "1,0", "1,1"]
+    assert observed.partial
+
+
+def test_max_frontier():
+    map = _grid_map(10)
+    observed = search.breadth_first_search(map, max_frontier=3, recording="counts")
+
+    assert observed.stats is not None
+    assert observed.partial and observed.stats.max_frontier == 4
+    assert [e.uid for e in observed.solution] == ["0,0", "1,0", "2,0"]
+
+
+def test_deadline():
+    map = _grid_map(10)
+    observed = search.breadth_first_search(map, deadline=time.monotonic() - 1)
+
+    assert observed.partial and observed.solution == [map.start]
+    assert map.calls == 0
+
+
+def test_compact_graph():
+    map = search.CompactGraph(_grid_map(10))
+    observed = search.dijakstra_search(map, max_expansions=5)
+    assert observed == search.dijakstra_search(_grid_map(10), max_expansions=5)
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        budget.Budget(max_expansions=-1)
+
+
+@pytest.mark.parametrize("search_", SEARCHES + DEEPENING)
+def test_goal_within_budget(search_):
+    map = _grid_map(3)
+    expected = search_(map, recording="counts")
+    limit = expected.stats.expanded - 1
+    observed = search_(map, max_expansions=limit, recording="counts")
+
+    # NOTE: budget runs out as end is popped, which completes the search
+    assert observed == expected and not observed.partial
+
+
+@pytest.mark.parametrize("search_", DEEPENING)
+def test_deepening_max_expansions(search_):
+    map = _grid_map(10)
+    observed = search_(map, max_expansions=5)
+
+    # NOTE: shallow paths are expanded again on each iteration, and counted again
+    assert observed.partial and observed.stats.expanded == 5
+    assert observed.solution[0] == map.start
+    assert observed.solution[-1].uid != map.end.uid
+
+
+@pytest.mark.parametrize("search_", DEEPENING + BIDIRECTIONAL)
+def test_deepening_bidirectional_deadline(search_):
+    map = _grid_map(10)
+    observed = search_(map, deadline=time.monotonic() - 1)
+
+    assert observed.partial and observed.solution == [map.start]
+
+
+@pytest.mark.parametrize("search_", BIDIRECTIONAL)
+def test_bidirectional_max_expansions(search_):
+    map = _grid_map(10)
+    observed = search_(map, max_expansions=5)
+
+    assert observed.partial and observed.stats.expanded == 5
+    assert observed.solution[0] == map.start
+    assert observed.solution[-1].uid != map.end.uid
+
+
+def test_bidirectional_meeting():
+    map = _grid_map(4)
+    expected = search.bidirectional_breadth_first_search(map)
+    assert expected.stats is not None
+    observed = search.bidirectional_breadth_first_search(
+        map, max_expansions=expected.stats.expanded - 1
+    )
+
+    # NOTE: frontiers already met, the path found is not proven shortest yet
+    solution = list(observed.solution)
+    assert observed.partial
+    assert solution[0] == map.start and solution[-1].uid == map.end.uid
+
+
+def test_bidirectional_max_frontier():
+    map = _grid_map(10)
+    observed = search.bidirectional_dijakstra_search(map, max_frontier=4)
+
+    assert observed.stats is not None
+    assert observed.partial and observed.stats.max_frontier > 4
@@ -0,0 +1,137 @@
+import dataclasses
+import pytest
+from typing import Dict, List, Sequence
+from pyalgo import search
+from tests.search.maps import Element, SimpleMap, random_graph
+
+
+class RecordingMap(SimpleMap):
+    def __init__(
+        self, start: "Element", end: "Element", graph: Dict[str, List["Element"]]
+    ):
+        super().__init__(start, end, graph)
+        self.lookups: List[str] = []
+        self.batches: List[List[str]] = []
+
+    def get_next(self, uid: str) -> List["Element"]:
+        self.lookups.append(uid)
+        return super().get_next(uid)
+
+    def get_next_many(self, uids: Sequence[str]) -> Dict[str, List["Element"]]:
+        self.batches.append(list(uids))
+        return {uid: self._graph[uid] for uid in uids}
+
+
+def _random_map(seed: int) -> RecordingMap:
+    graph = random_graph(seed, 30)
+    return RecordingMap(Element("0", 0), Element("29", 0), graph)
+
+
+def _line_map(size: int) -> RecordingMap:
+    graph = {str(i): [Element(str(i + 1))] for i in range(size)}
+    return RecordingMap(Element("0"), Element(str(size)), graph)
+
+
+def test_lru_eviction():
+    inner = _line_map(5)
+    map = search.CachedElementMap(inner, max_size=2)
+
+    for uid in ["0", "1", "0", "2", "1", "0"]:
+        assert map.get_next(uid) == [Element(str(int(uid) + 1))]
+    assert inner.lookups == ["0", "1", "2", "1", "0"]
+    assert dataclasses.astuple(map.stats) == (1, 5, 3)
+    assert len(map) == 2 and "0" in map and "1" in map
+
+
+def test_byte_limit():
+    sizes = {"1": 4, "2": 4, "3": 8, "4": 20}
+    map = search.CachedElementMap(
+        _line_map(5),
+        max_size=None,
+        max_bytes=10,
+        sizeof=lambda elements: sizes[elements[0].uid],
+    )
+
+    [map.get_next(uid) for uid in ["0", "1", "2", "3"]]
+    assert map.nbytes == 8 and "2" in map
+    assert map.stats.evictions == 2 and "3" not in map
+
+
+def test_get_next_many():
+    inner = _line_map(5)
+    map = search.CachedElementMap(inner)
+    map.get_next("1")
+
+    observed = map.get_next_many(["0", "1", "2", "0"])
+    assert list(observed) == ["0", "1", "2"]
+    assert inner.batches == [["0", "2"]]
+    assert dataclasses.astuple(map.stats) == (1, 3, 0)
+
+
+@pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"max_bytes": 0}])
+def test_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        search.CachedElementMap(_line_map(1), **kwargs)
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("batch_size", [0, 4])
+@pytest.mark.parametrize(
+    "search_",
+    [
+        search.breadth_first_search,
+        search.depth_first_search,
+        search.dijakstra_search,
+    ],
+)
+def test_cached_search(seed, batch_size, search_):
+    expected = search_(_random_map(seed))
+    inner = _random_map(seed)
+    map = search.CachedElementMap(inner, batch_size=batch_size)
+    observed = search_(map)
+
+    assert observed == expected
+    assert inner.lookups == []
+    fetched = [uid for batch in inner.batches for uid in batch]
+    assert len(fetched) == len(set(fetched)) == map.stats.misses
+    if batch_size == 0:
+        assert all(len(batch) == 1 for batch in inner.batches)
+
+
+def test_tree_search_hits():
+    graph = {
+        f"{i},{j}": [Element(f"{i + 1},{j}"), Element(f"{i},{j + 1}")]
+        for i in range(3)
+        for j in range(3)
+    }
+    graph.update({f"3,{i}": [] for i in range(4)})
+    graph.update({f"{i},3": [] for i in range(3)})
+    expected = search.breadth_first_search(
+        SimpleMap(Element("0,0"), Element("3,3"), graph), tree_search=True
+    )
+    map = search.CachedElementMap(SimpleMap(Element("0,0"), Element("3,3"), graph))
+
+    assert search.breadth_first_search(map, tree_search=True) == expected
+    assert map.stats.misses == len(map) and map.stats.hits > 0
+
+
+def test_prefetch_small_cache():
+    inner = _line_map(5)
+    map = search.CachedElementMap(inner, max_size=1, batch_size=2)
+
+    map.prefetch("0", lambda n: ["1", "2"][:n])
+    assert inner.batches == [["1", "2", "0"]]
+    assert len(map) == 1 and "0" in map
+    assert map.get_next("0") == [Element("1")]
+    assert inner.lookups == [] and dataclasses.astuple(map.stats) == (0, 3, 2)
+
+
+def test_prefetch_oversized():
+    inner = _line_map(5)
+    map = search.CachedElementMap(
+        inner, max_size=None, max_bytes=1, batch_size=1, sizeof=lambda elements: 2
+    )
+
+    map.prefetch("0", lambda n: ["1"])
+    assert map.get_next("0") == [Element("1")]
+    assert len(map) == 0 and inner.lookups == [] and map.stats.misses == 2
@@ -0,0 +1,44 @@
+import functools
+import pytest
+from pyalgo import search
+from tests.search.maps import Element, SimpleMap, random_map
+
+
+class TestCompactGraph:
+    def test_csr(self):
+        map = SimpleMap(
+            Element("a", 0),
+            Element("z", 0),
+            {"a": [Element("b", 2), Element("c", 3)], "b": [Element("a", 1)], "c": []},
+        )
+        graph = search.CompactGraph(map)
+
+        assert graph.size == 4
+        assert [graph.element(i).uid for i in range(4)] == ["a", "b", "c", "z"]
+        assert list(graph.offsets) == [0, 2, 3, 3, 3]
+        assert list(graph.targets) == [1, 2, 0]
+        assert list(graph.weights) == [2.0, 3.0, 1.0]
+        assert graph.start_index == 0 and graph.end_index == graph.index("z") == 3
+        assert graph.get_next("a") == [Element("b", 2), Element("c", 3)]
+        assert graph.get_next("z") == []
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        search.breadth_first_search,
+        search.depth_first_search,
+        search.dijakstra_search,
+        functools.partial(
+            search.a_star_search, heuristic=lambda e: int(e.uid) % 3 == 0
+        ),
+    ],
+)
+@pytest.mark.parametrize("seed", range(10))
+def test_compact_search(func, seed):
+    map = random_map(seed)
+    expected = func(map)
+    observed = func(search.CompactGraph(map))
+    assert observed == expected
+    # NOTE: `stats` are not compared by `SearchResult` equality
+    assert observed.stats is not None and observed.stats == expected.stats
@@ -0,0 +1,43 @@
+import pytest
+from pyalgo import search
+from tests.search.maps import Element, SimpleMap, random_map
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_dijakstra_distances(seed):
+    map = random_map(seed)
+    table = search.dijakstra_distances(map)
+
+    for uid in map._graph:
+        expected = search.dijakstra_search(
+            SimpleMap(map.start, Element(uid), map._graph)
+        )
+        if expected.solution:
+            assert table.distances[uid] == sum(e.weight for e in expected.solution)
+            assert table.path(uid) == expected.solution
+        else:
+            assert uid not in table.distances and table.path(uid) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_breadth_first_distances(seed):
+    map = random_map(seed)
+    table = search.breadth_first_distances(map)
+
+    for uid in map._graph:
+        expected = search.breadth_first_search(
+            SimpleMap(map.start, Element(uid), map._graph)
+        )
+        if expected.solution:
+            assert table.distances[uid] == len(list(expected.solution)) - 1
+            assert table.previous[map.start.uid] is None
+
+
+def test_multi_target():
+    graph = {str(i): [Element(str(i + 1))] for i in range(100)}
+    map = SimpleMap(Element("0"), Element("100"), graph)
+
+    table = search.breadth_first_distances(map, ends=["5", "3"])
+    assert table.settled == {str(i) for i in range(6)}
+    assert table.distances["5"] == 5 and table.distances["3"] == 3
+    assert map.calls == 5
@@ -0,0 +1,74 @@
+import pytest
+from typing import List
+from pyalgo import search
+from tests.search.maps import Element, SimpleMap, random_map
+
+
+class EventObserver(search.SearchObserver):
+    def __init__(self):
+        self.events: List[str] = []
+
+    def on_push(self, path):
+        self.events.append(f"push {path.element.uid}")
+
+    def on_pop(self, path):
+        self.events.append(f"pop {path.element.uid}")
+
+    def on_expand(self, path):
+        self.events.append(f"expand {path.element.uid}")
+
+    def on_goal(self, path):
+        self.events.append(f"goal {path.element.uid}")
+
+
+def test_hooks():
+    graph = {"0": [Element("1"), Element("2")], "1": [Element("2")], "2": []}
+    map = SimpleMap(Element("0"), Element("2"), graph)
+    observer = EventObserver()
+
+    search.breadth_first_search(map, observer=observer)
+    assert observer.events == [
+        "push 0",
+        "pop 0",
+        "expand 0",
+        "push 1",
+        "push 2",
+        "pop 1",
+        "expand 1",
+        "push 2",
+        "pop 2",
+        "expand 2",
+        "goal 2",
+    ]
+
+
+@pytest.mark.parametrize(
+    "search_", [search.breadth_first_search, search.depth_first_search]
+)
+def test_profiler(search_):
+    map = random_map(0)
+    expected = search_(map, recording="counts")
+    profiler = search.Profiler()
+    observed = search_(map, recording="counts", observer=profiler)
+    report = profiler.report()
+
+    assert observed == expected
+    assert report["expand.count"] == observed.stats.expanded
+    assert report["get_next.count"] == map.calls // 2
+    assert report["convert.count"] == report["push.count"]
+    assert report["search.count"] == 1
+    assert report["goal.count"] == (1 if observed.solution else 0)
+    assert all(v >= 0 for v in report.values())
+    assert report["search.seconds"] >= report["get_next.seconds"]
+
+    profiler.reset()
+    assert profiler.report() == {}
+
+
+def test_compact_graph():
+    map = search.CompactGraph(random_map(1))
+    profiler = search.Profiler()
+
+    observed = search.breadth_first_search(map, observer=profiler)
+    assert observed == search.breadth_first_search(map)
+    assert profiler.report()["expand.count"] > 0
@@ -0,0 +1,88 @@
+import pytest
+from typing import Dict, Iterable, List
+from pyalgo import search
+from tests.search.maps import Element, SimpleMap, random_map
+
+
+def _cost(solution: Iterable[Element]) -> int:
+    return sum(e.weight for e in solution)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_iterative_deepening_search(seed):
+    map = random_map(seed, size=12, degree=2)
+    expected = list(search.breadth_first_search(map).solution)
+    observed = list(search.iterative_deepening_search(map).solution)
+
+    assert len(observed) == len(expected)
+    if observed:
+        assert observed[0] == map.start
+        assert observed[-1].uid == map.end.uid
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_depth_limited_search(seed):
+    map = random_map(seed, size=12, degree=2)
+    moves = len(list(search.breadth_first_search(map).solution)) - 1
+
+    if moves > 0:
+        short = search.depth_limited_search(map, moves - 1)
+        assert short.stats is not None
+        assert short.solution == [] and short.stats.max_frontier <= moves
+    observed = list(search.depth_limited_search(map, max(moves, 0) + 2).solution)
+    assert (len(observed) > 0) == (moves >= 0)
+    assert len(observed) <= moves + 3
+
+
+def test_max_depth():
+    graph = {str(i): [Element(str(i + 1))] for i in range(10)}
+    map = SimpleMap(Element("0"), Element("10"), graph)
+
+    assert search.iterative_deepening_search(map, max_depth=9).solution == []
+    observed = search.iterative_deepening_search(map, max_depth=10, recording="full")
+    assert [e.uid for e in observed.solution] == [str(i) for i in range(11)]
+    assert list(observed.searches.values())[-1] == observed.solution
+    assert observed.stats is not None
+    assert observed.stats.max_frontier == 10
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_ida_star_search(seed):
+    map = random_map(seed, size=12, degree=2)
+    expected = search.dijakstra_search(map)
+    observed = search.ida_star_search(map, lambda e: 0)
+
+    assert _cost(observed.solution) == _cost(expected.solution)
+    assert bool(observed.solution) == bool(expected.solution)
+
+
+def test_ida_star_heuristic():
+    graph: Dict[str, List[Element]] = {}
+    for i in range(6):
+        for j in range(6):
+            moves = [Element(f"{i + 1},{j}", 1)] if i < 5 else []
+            graph[f"{i},{j}"] = moves + ([Element(f"{i},{j + 1}", 2)] if j < 5 else [])
+    map = SimpleMap(Element("0,0", 0), Element("5,5", 0), graph)
+
+    def _heuristic(e: Element) -> int:
+        i, j = e.uid.split(",")
+        return (5 - int(i)) + 2 * (5 - int(j))
+
+    blind = search.ida_star_search(map, lambda e: 0)
+    guided = search.ida_star_search(map, _heuristic)
+    assert _cost(guided.solution) == _cost(blind.solution) == 15
+    assert guided.stats is not None and blind.stats is not None
+    assert guided.stats.expanded < blind.stats.expanded
+
+
+def test_iter_search():
+    map = random_map(1, size=12, degree=2)
+    paths = list(search.iter_search(map, "iterative_deepening"))
+    assert paths[0].elements == [map.start]
+    with pytest.raises(ValueError):
+        search.iter_search(map, "ida_star")
+
+
+def test_invalid_limit():
+    with pytest.raises(ValueError):
+        search.depth_limited_search(random_map(0, size=12, degree=2), -1)
@@ -0,0 +1,75 @@
+import random
+import tempfile
+import pytest
+from pyalgo import search
+from tests.search.maps import Element, SimpleMap
+
+
+@pytest.fixture
+def map() -> SimpleMap:
+    rng = random.Random(7)
+    size = 60
+    graph = {
+        str(i): [Element(str(rng.randrange(size)), rng.randint(0, 9)) for _ in range(3)]
+        for i in range(size)
+    }
+    graph["0"].extend(Element(str(i), 9) for i in range(size))
+    return SimpleMap(Element("0", 0), Element("0", 0), graph)
+
+
+@pytest.mark.parametrize(
+    "algorithm, func",
+    [
+        ("breadth_first", search.breadth_first_search),
+        ("depth_first", search.depth_first_search),
+        ("dijakstra", search.dijakstra_search),
+    ],
+)
+def test_search_many(map, algorithm, func):
+    rng = random.Random(0)
+    pairs = [(str(rng.randrange(60)), str(rng.randrange(60))) for _ in range(40)]
+    graph = search.CompactGraph(map)
+    observed = dict(
+        search.search_many(graph, pairs, algorithm, workers=2, chunk_size=7)
+    )
+
+    assert sorted(observed) == list(range(len(pairs)))
+    for i, (start, end) in enumerate(pairs):
+        query = SimpleMap(graph.element(graph.index(start)), Element(end), map._graph)
+        expected = func(query)
+        assert observed[i] == expected and observed[i].stats == expected.stats
+
+
+def test_search_many_unknown_algorithm(map):
+    with pytest.raises(ValueError):
+        list(search.search_many(map, [("0", "1")], "unknown"))
+    with pytest.raises(ValueError, match="61"):
+        list(search.search_many(map, [("0", "61")]))
+    assert list(search.search_many(map, [])) == []
+
+
+def test_search_many_source_weight():
+    graph = {
+        "a": [Element("c", 4), Element("b", 1)],
+        "b": [Element("c", 2), Element("d", 7)],
+        "c": [Element("a", 3), Element("d", 12)],
+        "d": [],
+    }
+    map = SimpleMap(Element("a", 5), Element("d", 0), graph)
+    observed = dict(search.search_many(map, [("c", "d"), ("a", "d")], workers=1))
+
+    # NOTE: "c" is reached by links weighing 4 and 2, none of which counts
+    expected = search.dijakstra_search(SimpleMap(Element("c", 0), map.end, graph))
+    solution = list(observed[0].solution)
+    assert [e.uid for e in solution] == ["c", "a", "b", "d"]
+    assert solution[1:] == list(expected.solution)[1:]
+    assert observed[1] == search.dijakstra_search(map)
+
+
+def test_search_many_closed_early(map, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    pairs = [("0", str(i % 60)) for i in range(600)]
+    results = search.search_many(map, pairs, workers=1, chunk_size=1)
+    next(results)
+    results.close()
+    assert list(tmp_path.iterdir()) == []
@@ -1,8 +1,9 @@
 import pytest
 import dataclasses
+import functools
 from typing import Dict, List, Union
 from pyalgo import models, search
-from pyalgo.search import queue_search
+from pyalgo.search import a_star, queue_search
 
 
 @dataclasses.dataclass(frozen=True)
@@ -56,7 +57,16 @@ class SimpleMap(models.ElementMap["Element"]):
         return self._graph[uid]
 
 
-@pytest.mark.parametrize("search", [search.dijakstra_search])
+@pytest.mark.parametrize(
+    "search",
+    [
+        pytest.param(search.dijakstra_search, id="dijakstra"),
+        pytest.param(
+            functools.partial(search.a_star_search, heuristic=lambda e: 0),
+            id="a_star",
+        ),
+    ],
+)
 @pytest.mark.parametrize(
     "graph, start, expected",
     [
@@ -92,3 +102,83 @@ def test_common_search(search, graph, start, expected):
     map = SimpleMap(start, end, graph)
     observed = search(map)
     assert observed == expected
+
+
+def test_dijakstra_relaxation():
+    end = Element("end", 0)
+    map = SimpleMap(
+        Element("1", 0),
+        end,
+        {
+            "1": [Element("2", 1), Element("3", 5)],
+            "2": [Element("3", 1), Element("4", 6)],
+            "3": [Element("4", 1)],
+            "4": [Element("end", 1), Element("1", 1)],
+        },
+    )
+    observed = search.dijakstra_search(map)
+    assert observed.solution == [
+        Element("1", 0),
+        Element("2", 1),
+        Element("3", 1),
+        Element("4", 1),
+        Element("end", 1),
+    ]
+    assert len(observed.searches) == 1
+
+
+def test_dijakstra_dense():
+    size = 200
+    graph = {
+        str(i): [Element(str(j), (i * j) % 7 + 1) for j in range(size) if j != i]
+        for i in range(size)
+    }
+    graph[str(size - 1)].append(Element("end", 0))
+    map = SimpleMap(Element("0", 0), Element("end", 0), graph)
+    observed = search.dijakstra_search(map)
+    assert [e.uid for e in observed.solution] == ["0", str(size - 1), "end"]
+    assert sum(e.weight for e in observed.solution) == 1
+
+
+def _grid_map(size: int, walls: List[str]) -> SimpleMap:
+    graph: Dict[str, List[Element]] = {}
+    for x in range(size):
+        for y in range(size):
+            graph[f"{x},{y}"] = [
+                Element(f"{x + dx},{y + dy}", 1)
+                for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]
+                if 0 <= x + dx < size
+                and 0 <= y + dy < size
+                and f"{x + dx},{y + dy}" not in walls
+            ]
+    end = Element(f"{size - 1},{size - 1}", 1)
+    return SimpleMap(Element("0,0", 0), end, graph)
+
+
+def test_a_star_search():
+    size = 20
+    map = _grid_map(size, walls=[f"{size // 2},{y}" for y in range(size - 1)])
+
+    def manhattan(e: Element) -> int:
+        x, y = (int(i) for i in e.uid.split(","))
+        return (size - 1 - x) + (size - 1 - y)
+
+    expected = search.dijakstra_search(map)
+    observed = search.a_star_search(map, manhattan, check_consistency=True)
+    assert sum(e.weight for e in observed.solution) == 2 * (size - 1)
+    assert sum(e.weight for e in observed.solution) == sum(
+        e.weight for e in expected.solution
+    )
+    assert len(observed.searches) < len(expected.searches)
+
+
+def test_a_star_inconsistent_heuristic():
+    map = _grid_map(5, walls=[])
+
+    def heuristic(e: Element) -> int:
+        return 3 if e.uid == "1,0" else 0
+
+    observed = search.a_star_search(map, heuristic)
+    assert sum(e.weight for e in observed.solution) == 8
+    with pytest.raises(a_star.InconsistentHeuristicError):
+        search.a_star_search(map, heuristic, check_consistency=True)
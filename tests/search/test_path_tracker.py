@@ -0,0 +1,76 @@
+import dataclasses
+import tracemalloc
+import pytest
+from typing import List
+from pyalgo.search import path_queue
+
+
+@dataclasses.dataclass(frozen=True)
+class Element:
+    uid: str
+    weight: int = 1
+
+
+class TestPathTracker:
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            path_queue.PathTracker([])
+
+    def test_advance(self):
+        base = path_queue.PathTracker([Element("1"), Element("2")])
+        left = base.advance(Element("3"))
+        right = base.advance(Element("4", 5))
+
+        assert len(base) == 2 and len(left) == len(right) == 3
+        assert left.parent is right.parent is base
+        assert left.previous_uid == right.previous_uid == base.uid
+        assert left.uid != right.uid
+        assert base.elements == [Element("1"), Element("2")]
+        assert right.elements == [Element("1"), Element("2"), Element("4", 5)]
+        assert left.weight == 3 and right.weight == 7
+
+    def test_eq(self):
+        base = path_queue.PathTracker([Element("1"), Element("2")])
+        assert base.advance(Element("3")) == path_queue.PathTracker(
+            [Element("1"), Element("2"), Element("3")]
+        )
+        assert base.advance(Element("3")) != base.advance(Element("4"))
+        assert base != base.advance(Element("3"))
+
+    def test_contains(self):
+        tracker = path_queue.PathTracker([Element(str(i)) for i in range(1000)])
+        assert all(Element(str(i)) in tracker for i in range(1000))
+        assert Element("1000") not in tracker
+        assert Element("1", 2) not in tracker
+
+    def test_contains_long_path(self):
+        comparisons: List[None] = []
+
+        class CountingElement(Element):
+            def __eq__(self, other):
+                comparisons.append(None)
+                return super().__eq__(other)
+
+            __hash__ = Element.__hash__
+
+        size = 4096
+        tracker = path_queue.PathTracker([CountingElement(str(i)) for i in range(size)])
+        assert CountingElement("0") in tracker
+        comparisons.clear()
+        assert not any(CountingElement(str(-i)) in tracker for i in range(1, 1001))
+        # NOTE: a saturated bloom filter would walk the whole path for each miss
+        assert len(comparisons) < 1000 * size // 4
+
+    def test_advance_memory(self):
+        size = 10_000
+        tracemalloc.start()
+        try:
+            tracker = path_queue.PathTracker([Element("0")])
+            for i in range(1, size):
+                tracker = tracker.advance(Element(str(i)))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert Element("0") in tracker and Element(str(size)) not in tracker
+        # NOTE: filters copied along path would take O(size**2) memory
+        assert peak < 1000 * size
@@ -0,0 +1,58 @@
+import dataclasses
+import pytest
+from pyalgo import search
+from pyalgo.search import recorder
+from tests.search.maps import Element, SimpleMap, random_map
+
+SEARCHES = [
+    search.breadth_first_search,
+    search.depth_first_search,
+    search.dijakstra_search,
+    lambda map, **kwargs: search.a_star_search(map, lambda e: 0, **kwargs),
+]
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("search_", SEARCHES)
+def test_recording(seed, search_):
+    map = random_map(seed)
+    full = search_(map)
+    off = search_(map, recording="off")
+    counts = search_(map, recording="counts")
+    last = search_(map, recording="last", recording_limit=3)
+
+    assert full.solution == off.solution == counts.solution == last.solution
+    assert off.searches == counts.searches == {}
+    assert off.stats is None
+    assert list(last.searches.values()) == list(full.searches.values())[-3:]
+    assert counts.stats == last.stats == full.stats
+    assert full.stats.expanded >= len(full.searches)
+
+
+def test_stats():
+    graph = {
+        "0": [Element("1"), Element("2")],
+        "1": [Element("2"), Element("3")],
+        "2": [Element("1"), Element("3")],
+        "3": [],
+    }
+    map = SimpleMap(Element("0"), Element("3"), graph)
+    observed = search.breadth_first_search(map, recording="counts").stats
+
+    # NOTE: "0", "1", "2" then "3" expanded, "2" -> "1" pruned as already closed,
+    # "0" -> "1" -> "2" pruned once popped
+    assert observed is not None and dataclasses.astuple(observed) == (4, 3, 2)
+
+
+def test_compact_graph():
+    map = search.CompactGraph(random_map(0))
+    expected = search.dijakstra_search(random_map(0), recording="counts")
+
+    assert search.dijakstra_search(map).stats == expected.stats
+    assert search.dijakstra_search(map, recording="counts").stats == expected.stats
+
+
+@pytest.mark.parametrize("kwargs", [{"recording": "all"}, {"limit": 0}])
+def test_invalid_recording(kwargs):
+    with pytest.raises(ValueError):
+        recorder.Recorder(**kwargs)
@@ -30,6 +30,7 @@ class SimpleMap(models.ElementMap["Element"]):
         return self._graph[uid]
 
 
+@pytest.mark.parametrize("tree_search", [True, False])
 @pytest.mark.parametrize(
     "search", [search.depth_first_search, search.breadth_first_search]
 )
@@ -114,10 +115,10 @@ class SimpleMap(models.ElementMap["Element"]):
         ),
     ],
 )
-def test_common_search(search, graph, start, expected):
+def test_common_search(search, graph, start, expected, tree_search):
     end = Element("end")
     map = SimpleMap(start, end, graph)
-    observed = search(map)
+    observed = search(map, tree_search)
     assert observed == expected
 
 
@@ -158,7 +159,65 @@ def test_common_search(search, graph, start, expected):
         ),
     ],
 )
-def test_complicated_case(search, expected):
+def test_complicated_tree_case(search, expected):
+    map = SimpleMap(
+        Element("1"),
+        Element("end"),
+        {
+            "1": [Element("2"), Element("3")],
+            "2": [Element("4"), Element("5"), Element("6")],
+            "3": [Element("7")],
+            "4": [Element("7")],
+            "5": [Element("8"), Element("end")],
+            "6": [Element("9")],
+            "7": [],
+            "8": [Element("10")],
+            "9": [],
+            "10": [],
+        },
+    )
+    observed = search(map, tree_search=True)
+    assert observed == expected
+
+
+@pytest.mark.parametrize(
+    "search, expected",
+    [
+        pytest.param(
+            search.depth_first_search,
+            queue_search.SearchResult(
+                [Element("1"), Element("2"), Element("5"), Element("end")],
+                {
+                    0: [Element("1"), Element("2"), Element("4"), Element("7")],
+                    1: [
+                        Element("1"),
+                        Element("2"),
+                        Element("5"),
+                        Element("8"),
+                        Element("10"),
+                    ],
+                    2: [Element("1"), Element("2"), Element("5"), Element("end")],
+                },
+            ),
+            id="dfs_case",
+        ),
+        pytest.param(
+            search.breadth_first_search,
+            queue_search.SearchResult(
+                [Element("1"), Element("2"), Element("5"), Element("end")],
+                {
+                    0: [Element("1"), Element("2"), Element("4")],
+                    1: [Element("1"), Element("2"), Element("6")],
+                    2: [Element("1"), Element("3"), Element("7")],
+                    3: [Element("1"), Element("2"), Element("5"), Element("8")],
+                    4: [Element("1"), Element("2"), Element("5"), Element("end")],
+                },
+            ),
+            id="bfs_case",
+        ),
+    ],
+)
+def test_complicated_graph_case(search, expected):
     map = SimpleMap(
         Element("1"),
         Element("end"),
@@ -177,3 +236,27 @@ def test_complicated_case(search, expected):
     )
     observed = search(map)
     assert observed == expected
+
+
+def test_lattice_expansions():
+    size = 12
+    graph = {
+        f"{x},{y}": [
+            Element(f"{x + dx},{y + dy}")
+            for dx, dy in [(1, 0), (0, 1)]
+            if x + dx < size and y + dy < size
+        ]
+        for x in range(size)
+        for y in range(size)
+    }
+    expanded = []
+
+    class CountingMap(SimpleMap):
+        def get_next(self, uid):
+            expanded.append(uid)
+            return super().get_next(uid)
+
+    map = CountingMap(Element("0,0"), Element("end"), graph)
+    observed = search.breadth_first_search(map)
+    assert observed.solution == []
+    assert sorted(expanded) == sorted(graph)
@@ -0,0 +1,55 @@
+import itertools
+import pytest
+from pyalgo import search
+from tests.search.maps import Element, SimpleMap, random_map
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize(
+    "algorithm, search_",
+    [
+        ("breadth_first", search.breadth_first_search),
+        ("depth_first", search.depth_first_search),
+        ("dijakstra", search.dijakstra_search),
+        ("a_star", lambda map: search.a_star_search(map, lambda e: 0)),
+    ],
+)
+def test_iter_search(seed, algorithm, search_):
+    map = random_map(seed)
+    expected = search_(map)
+    paths = list(search.iter_search(map, algorithm, heuristic=lambda e: 0))
+
+    assert paths[0].elements == [map.start]
+    if expected.solution:
+        assert paths[-1].elements == expected.solution
+    else:
+        assert all(p.element.uid != map.end.uid for p in paths)
+
+
+def test_early_stop():
+    map = random_map(0, size=200)
+    paths = list(itertools.islice(search.iter_search(map), 10))
+
+    assert len(paths) == 10
+    assert map.calls == 9
+
+
+def test_tree_search():
+    graph = {"0": [Element("1"), Element("2")], "1": [Element("2")], "2": []}
+    map = SimpleMap(Element("0"), Element("3"), graph)
+
+    observed = [p.elements for p in search.iter_search(map, tree_search=True)]
+    assert [[e.uid for e in path] for path in observed] == [
+        ["0"],
+        ["0", "1"],
+        ["0", "2"],
+        ["0", "1", "2"],
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"algorithm": "unknown"}, {"algorithm": "a_star", "heuristic": None}]
+)
+def test_invalid_algorithm(kwargs):
+    with pytest.raises(ValueError):
+        search.iter_search(random_map(0), **kwargs)
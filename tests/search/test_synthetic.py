@@ -0,0 +1,141 @@
+import collections
+import pytest
+from pyalgo import search
+from pyalgo.search import synthetic
+
+MAPS = [
+    lambda seed: search.GridMap((30, 20), obstacles=0.2, max_weight=9, seed=seed),
+    lambda seed: search.GridMap((8, 8, 8), obstacles=0.1, seed=seed),
+    lambda seed: search.ErdosRenyiMap(500, seed=seed),
+    lambda seed: search.BarabasiAlbertMap(500, seed=seed),
+    lambda seed: search.BarabasiAlbertMap(500, seed=seed, directed=False),
+    lambda seed: search.RoadMap(20, seed=seed),
+]
+
+
+def _graph(map, uids):
+    return {uid: map.get_next(uid) for uid in uids}
+
+
+@pytest.mark.parametrize("make", MAPS)
+def test_deterministic(make):
+    uids = [make(0).start.uid, make(0).end.uid]
+    assert _graph(make(0), uids) == _graph(make(0), uids)
+    assert search.dijakstra_search(make(1)) == search.dijakstra_search(make(1))
+    assert any(
+        search.dijakstra_search(make(0)) != search.dijakstra_search(make(seed))
+        for seed in range(1, 4)
+    )
+
+
+@pytest.mark.parametrize("make", MAPS)
+def test_lazy(make):
+    map = make(0)
+    expected = [e.uid for e in map.get_next(map.start.uid)]
+    # NOTE: lookups do not depend on earlier ones
+    map.get_next(map.end.uid)
+    assert [e.uid for e in map.get_next(map.start.uid)] == expected
+
+
+def test_grid():
+    map = search.GridMap((10, 6))
+    assert map.size == 60 and map.end.uid == "9,5"
+    assert {e.uid for e in map.get_next("0,0")} == {"1,0", "0,1"}
+    assert len(list(search.breadth_first_search(map).solution)) == 15
+
+
+def test_grid_obstacles():
+    map = search.GridMap((50, 50), obstacles=0.3, max_weight=5)
+    cells = [f"{i},{j}" for i in range(50) for j in range(50)]
+    blocked = sum(map.blocked(uid) for uid in cells)
+    assert 0.25 < blocked / len(cells) < 0.35
+    assert not map.blocked(map.start.uid) and not map.blocked(map.end.uid)
+    for uid in cells[:200]:
+        assert all(not map.blocked(e.uid) for e in map.get_next(uid))
+        for e in map.get_previous(uid):
+            assert (uid, e.weight) in [(n.uid, n.weight) for n in map.get_next(e.uid)]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_grid_heuristic(seed):
+    map = search.GridMap((25, 25), obstacles=0.2, max_weight=9, seed=seed)
+    expected = list(search.dijakstra_search(map).solution)
+    observed = search.a_star_search(map, map.heuristic, check_consistency=True)
+    assert sum(e.weight for e in list(observed.solution)[1:]) == sum(
+        e.weight for e in expected[1:]
+    )
+
+
+def test_erdos_renyi():
+    map = search.ErdosRenyiMap(2000, degree=4)
+    degrees = [len(map.get_next(str(i))) for i in range(2000)]
+    assert 3.8 < sum(degrees) / len(degrees) < 4.2
+    assert all(e.uid != "7" for e in map.get_next("7"))
+    assert len(search.ErdosRenyiMap(5, degree=4).get_next("2")) == 4
+
+
+def test_barabasi_albert():
+    map = search.BarabasiAlbertMap(5000, links=3)
+    in_degrees = collections.Counter(
+        e.uid for i in range(5000) for e in map.get_next(str(i))
+    )
+    for i in range(1, 5000):
+        links = map.get_next(str(i))
+        assert 1 <= len(links) <= 3 and all(int(e.uid) < i for e in links)
+    # NOTE: preferential attachment yields hubs far above the average degree
+    assert max(in_degrees.values()) > 20 * sum(in_degrees.values()) / 5000
+    assert list(search.breadth_first_search(map).solution)[-1].uid == "0"
+
+
+def test_barabasi_albert_undirected():
+    directed = search.BarabasiAlbertMap(500)
+    map = search.BarabasiAlbertMap(500, directed=False)
+    for i in range(500):
+        older = directed.get_next(str(i))
+        links = map.get_next(str(i))
+        assert links[: len(older)] == older
+        assert all(int(e.uid) > i for e in links[len(older) :])
+        for e in links:
+            assert synthetic.GraphElement(str(i), e.weight) in map.get_next(e.uid)
+    assert search.CompactGraph(map).size == 500
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_road(seed):
+    map = search.RoadMap(20, seed=seed)
+    for i in range(20):
+        uid = f"{i},{(i * 7) % 20}"
+        for e in map.get_next(uid):
+            assert (uid, e.weight) in [(n.uid, n.weight) for n in map.get_next(e.uid)]
+            assert e.weight >= 100 * 0.4 - 1
+    expected = search.dijakstra_search(map)
+    observed = search.a_star_search(map, map.heuristic, check_consistency=True)
+    assert sum(e.weight for e in observed.solution) == sum(
+        e.weight for e in expected.solution
+    )
+
+
+def test_large():
+    map = search.GridMap((10**4, 10**4, 10**4))
+    assert map.size == 10**12
+    assert len(map.get_next("5000,5000,5000")) == 6
+    assert len(search.BarabasiAlbertMap(10**9).get_next(str(10**9 - 1))) >= 1
+    assert synthetic.GraphElement("1") == synthetic.GraphElement("1", 1)
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda: search.GridMap(()),
+        lambda: search.GridMap((3, 0)),
+        lambda: search.GridMap((3, 3), obstacles=1.0),
+        lambda: search.ErdosRenyiMap(1),
+        lambda: search.ErdosRenyiMap(10, degree=10),
+        lambda: search.BarabasiAlbertMap(10, links=0),
+        lambda: search.RoadMap(1),
+        lambda: search.RoadMap(10, jitter=0.5),
+    ],
+)
+def test_invalid(make):
+    with pytest.raises(ValueError):
+        make()
@@ -0,0 +1,85 @@
+import pytest
+from pyalgo import search
+from tests.search.maps import Element, SimpleMap, random_map
+
+np = pytest.importorskip("numpy")
+
+
+def _with_start(map: SimpleMap, start: Element, end: str) -> SimpleMap:
+    return SimpleMap(start, Element(end, 0), map._graph)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_dijakstra_search(seed):
+    map = random_map(seed)
+    graph = search.CompactGraph(map)
+    uids = [graph.element(i).uid for i in range(0, graph.size, 7)]
+    observed = search.batch_dijakstra_search(graph, uids)
+
+    for row, uid in enumerate(uids):
+        for target in range(graph.size):
+            end = graph.element(target).uid
+            start = graph.start if uid == graph.start.uid else Element(uid, 0)
+            expected = search.dijakstra_search(_with_start(map, start, end))
+            cost = sum(e.weight for e in expected.solution)
+            if expected.solution:
+                assert observed.distances[row, target] == cost
+                path = observed.path(row, end)
+                assert start.weight + sum(e.weight for e in path[1:]) == cost
+                assert path[0].uid == uid and path[-1].uid == end
+            else:
+                assert observed.distances[row, target] == np.inf
+                assert observed.path(row, end) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_breadth_first_search(seed):
+    map = random_map(seed)
+    graph = search.CompactGraph(map)
+    uids = [graph.element(i).uid for i in range(0, graph.size, 7)]
+    observed = search.batch_breadth_first_search(graph, uids)
+
+    for row, uid in enumerate(uids):
+        for target in range(graph.size):
+            end = graph.element(target).uid
+            start = Element(uid, 0)
+            expected = search.breadth_first_search(_with_start(map, start, end))
+            if expected.solution:
+                length = len(list(expected.solution)) - 1
+                assert observed.distances[row, target] == length
+                assert len(observed.path(row, end)) - 1 == length
+            else:
+                assert observed.distances[row, target] == np.inf
+
+
+def test_batch_dijakstra_distances():
+    map = _with_start(random_map(0), Element("0", 5), "39")
+    graph = search.CompactGraph(map)
+    observed = search.batch_dijakstra_search(graph, [graph.start.uid])
+    assert observed.distances[0, graph.index("0")] == 5
+    expected = search.dijakstra_distances(graph)
+    for uid, distance in expected.distances.items():
+        assert observed.distances[0, graph.index(uid)] == distance
+
+
+def test_batch_dijakstra_source_weight():
+    graph = {
+        "a": [Element("c", 4), Element("b", 1)],
+        "b": [Element("c", 2)],
+        "c": [Element("a", 3)],
+    }
+    map = search.CompactGraph(SimpleMap(Element("a", 5), Element("c", 0), graph))
+    observed = search.batch_dijakstra_search(map, ["a", "c"])
+    # NOTE: "c" is known by uid only, not by the `Element`s reaching it
+    assert list(observed.distances[0]) == [5, 8, 6]
+    assert list(observed.distances[1]) == [3, 0, 4]
+    assert observed.path(1, "b") == [map.element(1), Element("a", 3), Element("b", 1)]
+
+
+def test_batch_unknown_source():
+    graph = {"a": [Element("b")], "b": [], "c": [Element("a")]}
+    map = SimpleMap(Element("a"), Element("b"), graph)
+    with pytest.raises(ValueError, match="c"):
+        search.batch_dijakstra_search(map, ["a", "c"])
+    with pytest.raises(ValueError, match="c"):
+        search.batch_breadth_first_search(map, ["c"])
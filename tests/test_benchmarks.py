@@ -0,0 +1,24 @@
+import pytest
+from benchmarks import harness
+
+CASES = harness.load()
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_benchmark_runs(name):
+    case = CASES[name]
+    [timing] = harness.run([case], repeat=1, max_size=min(case.sizes))
+    assert timing.key == f"{name}[{min(case.sizes)}]" and timing.best >= 0
+
+
+def test_compare():
+    timings = [harness.Timing("a[1]", 2.0, 2.0), harness.Timing("b[1]", 1.0, 1.0)]
+    regressions = harness.compare(timings, {"a[1]": 1.0, "b[1]": 1.0}, 1.5)
+    assert regressions == [(timings[0], 2.0)]
+
+
+def test_save(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    harness.save([harness.Timing("a[1]", 2.0, 3.0)], path)
+    harness.save([harness.Timing("b[1]", 1.0, 1.0)], path)
+    assert harness.main(["-k", "unknown", "--baseline", path]) == 0
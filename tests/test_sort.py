@@ -1,5 +1,9 @@
+import dataclasses
+import random
 import pytest
+from typing import List
 from pyalgo import sort
+from pyalgo.sort import _external_sort, _quick_sort
 
 
 @pytest.mark.parametrize(
@@ -21,3 +25,247 @@ from pyalgo import sort
 def test_sort(func, input, expected):
     observed = func(input)
     assert expected == observed
+
+
+@dataclasses.dataclass(frozen=True)
+class Item:
+    key: int
+    tag: int
+
+    def __lt__(self, other: "Item") -> bool:
+        Item.comparisons += 1
+        return self.key < other.key
+
+    comparisons = 0
+
+
+def _inputs(size: int):
+    rng = random.Random(size)
+    yield [rng.randrange(size) for _ in range(size)]
+    yield list(range(size))
+    yield list(range(size, 0, -1))
+    yield [rng.randrange(5) for _ in range(size)]
+    yield list(range(size // 2)) + list(range(size // 2))
+    yield [i if i % 50 else -i for i in range(size)]
+
+
+@pytest.mark.parametrize("size", [2, 3, 63, 64, 65, 1000, 20000])
+def test_merge_sort(size):
+    for items in _inputs(size):
+        original = list(items)
+        assert sort.merge_sort(items) == sorted(items)
+        assert items == original
+
+
+@pytest.mark.parametrize("size", [100, 5000])
+def test_merge_sort_stable(size):
+    for keys in _inputs(size):
+        items = [Item(key % 7, tag) for tag, key in enumerate(keys)]
+        observed = sort.merge_sort(items)
+        assert observed == sorted(items, key=lambda item: item.key)
+
+
+def test_merge_sort_runs():
+    size = 10**5
+    for items in (list(range(size)), list(range(size, 0, -1))):
+        Item.comparisons = 0
+        sort.merge_sort([Item(key, 0) for key in items])
+        assert Item.comparisons < size
+    # NOTE: beyond detecting runs, interleaved runs merge by galloping in few
+    # comparisons (a linear merge would take about as many again)
+    Item.comparisons = 0
+    keys = list(range(0, size, 1000)) + list(range(size))
+    sort.merge_sort([Item(key, 0) for key in keys])
+    assert Item.comparisons < size + size // 10
+
+
+@pytest.mark.parametrize("size", [2, 3, 16, 17, 41, 1000, 20000])
+def test_quick_sort(size):
+    for items in _inputs(size):
+        expected = sorted(items)
+        observed = sort.quick_sort(items)
+        assert observed is items and items == expected
+
+
+def test_quick_sort_comparisons():
+    size = 2**14
+    for keys in _inputs(size):
+        Item.comparisons = 0
+        sort.quick_sort([Item(key, 0) for key in keys])
+        assert Item.comparisons < 3 * size * 14
+    # NOTE: three-way partitions settle all equal items at once
+    Item.comparisons = 0
+    sort.quick_sort([Item(0, 0)] * size)
+    assert Item.comparisons < 3 * size
+
+
+@pytest.mark.parametrize("size", [17, 1000])
+def test_heap_sort_fallback(size):
+    for items in _inputs(size):
+        expected = sorted(items)
+        _quick_sort._intro_sort(items, 0, len(items), 0)
+        assert items == expected
+
+
+SORTS = [sort.quick_sort, sort.merge_sort]
+
+
+@pytest.mark.parametrize("func", SORTS)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_key(func, reverse):
+    for keys in _inputs(3000):
+        items = [Item(key % 11, tag) for tag, key in enumerate(keys)]
+        expected = sorted(items, key=lambda item: -item.tag % 5, reverse=reverse)
+        Item.comparisons = 0
+        observed = func(list(items), key=lambda item: -item.tag % 5, reverse=reverse)
+        assert observed == expected and Item.comparisons == 0
+
+        # NOTE: quick sort is only stable when sorting by key or in reverse
+        if reverse or func is sort.merge_sort:
+            expected = sorted(items, key=lambda item: item.key, reverse=reverse)
+            assert func(list(items), reverse=reverse) == expected
+
+
+@pytest.mark.parametrize("func", SORTS)
+def test_sort_key_calls(func):
+    calls = []
+
+    def _key(item: int) -> str:
+        calls.append(item)
+        return str(item)
+
+    items = list(range(1000, 0, -3))
+    assert func(items, key=_key) == sorted(items, key=str)
+    assert sorted(calls) == sorted(items)
+
+
+@pytest.mark.parametrize("func", SORTS)
+def test_sort_reverse_plain(func):
+    for items in _inputs(1000):
+        assert func(list(items), reverse=True) == sorted(items, reverse=True)
+
+
+@pytest.mark.parametrize("func", SORTS)
+def test_cmp_to_key(func):
+    def _cmp(a: str, b: str) -> int:
+        return (len(a) > len(b)) - (len(a) < len(b))
+
+    words = ["ccc", "a", "bb", "b", "aaa", ""]
+    expected = ["", "a", "b", "bb", "ccc", "aaa"]
+    assert func(words, key=sort.cmp_to_key(_cmp)) == expected
+
+
+def test_quick_sort_key_in_place():
+    items = [3, 1, 2]
+    assert sort.quick_sort(items, key=lambda i: -i) is items and items == [3, 2, 1]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 3000, 5000])
+def test_external_sort(chunk_size, tmp_path):
+    for items in _inputs(3000):
+        observed = sort.external_sort(
+            iter(items), chunk_size=chunk_size, tmpdir=str(tmp_path)
+        )
+        assert list(observed) == sorted(items)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_external_sort_key(reverse):
+    items = [Item(key % 11, tag) for tag, key in enumerate(next(_inputs(2000)))]
+    observed = sort.external_sort(
+        items, key=lambda item: item.key, reverse=reverse, chunk_size=300
+    )
+    assert list(observed) == sorted(items, key=lambda item: item.key, reverse=reverse)
+    observed = sort.external_sort(items, reverse=reverse, chunk_size=300)
+    assert list(observed) == sorted(items, reverse=reverse)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("fan_in", [2, 3, 64])
+def test_external_sort_fan_in(fan_in, reverse, tmp_path, monkeypatch):
+    opened: List[int] = []
+    monkeypatch.setattr(_external_sort, "_load", _track(_external_sort._load, opened))
+    items = [Item(key % 11, tag) for tag, key in enumerate(next(_inputs(2000)))]
+    observed = sort.external_sort(
+        items,
+        key=lambda item: item.key,
+        reverse=reverse,
+        chunk_size=50,
+        tmpdir=str(tmp_path),
+        fan_in=fan_in,
+    )
+    assert list(observed) == sorted(items, key=lambda item: item.key, reverse=reverse)
+    assert max(opened) <= fan_in
+    assert list(tmp_path.iterdir()) == []
+
+
+def _track(load, opened):
+    """Wrap `load` so as to record numbers of files open at once in `opened`"""
+    count = [0]
+
+    def _load(path):
+        count[0] += 1
+        opened.append(count[0])
+        try:
+            yield from load(path)
+        finally:
+            count[0] -= 1
+
+    return _load
+
+
+def test_external_sort_lazy():
+    consumed = []
+
+    def _items():
+        for i in range(1000, 0, -1):
+            consumed.append(i)
+            yield i
+
+    observed = sort.external_sort(_items(), chunk_size=100)
+    assert consumed == []
+    assert next(observed) == 1 and len(consumed) == 1000
+    observed.close()
+    assert list(sort.external_sort([])) == []
+    with pytest.raises(ValueError):
+        sort.external_sort([], chunk_size=0)
+    with pytest.raises(ValueError):
+        sort.external_sort([], fan_in=1)
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        pytest.param([random.Random(0).randrange(9) for _ in range(5000)], id="ints"),
+        pytest.param([random.Random(0).random() for _ in range(5000)], id="floats"),
+        pytest.param([2**70 - i for i in range(3000)], id="big_ints"),
+        pytest.param([str(i) for i in range(5000, 0, -1)], id="strings"),
+        pytest.param([1, 2.5] * 2000, id="mixed"),
+    ],
+)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_parallel_sort(items, reverse):
+    original = list(items)
+    observed = sort.parallel_sort(items, reverse=reverse, workers=3, threshold=100)
+    assert observed == sorted(items, reverse=reverse) and items == original
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_parallel_sort_key(reverse):
+    items = [Item(key % 11, tag) for tag, key in enumerate(next(_inputs(3000)))]
+    expected = sorted(items, key=lambda item: item.key, reverse=reverse)
+    observed = sort.parallel_sort(
+        items, key=lambda item: item.key, reverse=reverse, workers=2, threshold=100
+    )
+    assert observed == expected
+    observed = sort.parallel_sort(items, reverse=reverse, workers=2, threshold=100)
+    assert observed == expected
+
+
+def test_parallel_sort_serial():
+    items = [3, 1, 2]
+    assert sort.parallel_sort(items, workers=4) == [1, 2, 3]
+    assert sort.parallel_sort([], workers=4, threshold=0) == []
+    with pytest.raises(ValueError):
+        sort.parallel_sort(items, workers=0)